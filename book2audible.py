@@ -113,11 +113,14 @@ def main(input_file: str, output_dir: Optional[str], voice: str,
         click.echo("\n🚀 Starting processing...")
         
         # Process the book
-        summary = processor.process_book(
-            input_path, 
-            output_path, 
-            list(manual_chapters) if manual_chapters else None
-        )
+        try:
+            summary = processor.process_book(
+                input_path, 
+                output_path, 
+                list(manual_chapters) if manual_chapters else None
+            )
+        finally:
+            processor.close()
         
         # Display results
         click.echo("\n" + "=" * 50)
@@ -25,6 +25,23 @@ class ScreenshotTester:
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self._playwright = None
+        self._browser = None
+    
+    async def __aenter__(self):
+        """Launch one browser to be shared by every screenshot taken inside the block."""
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the shared browser and stop Playwright."""
+        try:
+            await self._browser.close()
+        finally:
+            await self._playwright.stop()
+            self._browser = None
+            self._playwright = None
     
     async def take_screenshot(self, url: str, name: str = None, wait_for_selector: str = None) -> str:
         """
@@ -47,34 +64,55 @@ class ScreenshotTester:
         filename = f"{name}.png"
         filepath = self.output_dir / filename
         
+        if self._browser is not None:
+            return await self._capture(self._browser, url, filepath, wait_for_selector)
+        
+        # Outside "async with tester:" each screenshot launches its own browser
         async with async_playwright() as p:
-            # Launch browser
             browser = await p.chromium.launch()
-            page = await browser.new_page()
-            
-            # Set viewport size
-            await page.set_viewport_size({"width": 1920, "height": 1080})
-            
             try:
-                # Navigate to URL
-                await page.goto(url, wait_until="networkidle")
-                
-                # Wait for specific selector if provided
-                if wait_for_selector:
-                    await page.wait_for_selector(wait_for_selector, timeout=10000)
-                
-                # Take screenshot
-                await page.screenshot(path=str(filepath), full_page=True)
-                
-                print(f"Screenshot saved: {filepath}")
-                return str(filepath)
-                
-            except Exception as e:
-                print(f"Error taking screenshot: {e}")
-                raise
+                return await self._capture(browser, url, filepath, wait_for_selector)
             finally:
                 await browser.close()
     
+    async def _capture(self, browser, url: str, filepath: Path, wait_for_selector: str = None) -> str:
+        """
+        Open a page in the given browser, screenshot it and close the page.
+        
+        Args:
+            browser: Playwright browser to open the page in
+            url (str): URL to take screenshot of
+            filepath (Path): Where to save the screenshot
+            wait_for_selector (str): Optional CSS selector to wait for before taking screenshot
+            
+        Returns:
+            str: Path to the saved screenshot file
+        """
+        page = await browser.new_page()
+        
+        # Set viewport size
+        await page.set_viewport_size({"width": 1920, "height": 1080})
+        
+        try:
+            # Navigate to URL
+            await page.goto(url, wait_until="networkidle")
+            
+            # Wait for specific selector if provided
+            if wait_for_selector:
+                await page.wait_for_selector(wait_for_selector, timeout=10000)
+            
+            # Take screenshot
+            await page.screenshot(path=str(filepath), full_page=True)
+            
+            print(f"Screenshot saved: {filepath}")
+            return str(filepath)
+            
+        except Exception as e:
+            print(f"Error taking screenshot: {e}")
+            raise
+        finally:
+            await page.close()
+    
     async def take_multiple_screenshots(self, urls: list, wait_time: float = 2.0) -> list:
         """
         Take screenshots of multiple URLs.
@@ -108,13 +146,14 @@ async def main():
     tester = ScreenshotTester()
     
     try:
-        # Test external site first
-        print("Taking screenshot of example.com...")
-        await tester.take_screenshot("https://example.com", "example_test")
-        
-        # Test Google as another example
-        print("Taking screenshot of google.com...")
-        await tester.take_screenshot("https://google.com", "google_test")
+        async with tester:
+            # Test external site first
+            print("Taking screenshot of example.com...")
+            await tester.take_screenshot("https://example.com", "example_test")
+            
+            # Test Google as another example
+            print("Taking screenshot of google.com...")
+            await tester.take_screenshot("https://google.com", "google_test")
         
         print("Screenshots completed successfully!")
         
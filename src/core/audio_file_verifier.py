@@ -3,13 +3,15 @@ Audio file verification system to ensure all WAV files are created successfully
 """
 import wave
 import os
-import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import logging
 from pydub import AudioSegment
 import hashlib
 
+from ..utils.json_utils import write_json
+from ..utils.text_io import write_text
+
 class AudioFileVerifier:
     """Comprehensive audio file verification system"""
     
@@ -207,56 +209,57 @@ class AudioFileVerifier:
         try:
             # Save JSON report
             json_file = output_file.with_suffix('.json')
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(verification_results, f, indent=2, default=str)
+            write_json(verification_results, json_file)
             
             # Save human-readable report
             txt_file = output_file.with_suffix('.txt')
-            with open(txt_file, 'w', encoding='utf-8') as f:
-                f.write("=" * 80 + "\n")
-                f.write("AUDIO FILE VERIFICATION REPORT\n")
-                f.write("=" * 80 + "\n\n")
-                
-                f.write(f"Directory: {verification_results['chunks_directory']}\n")
-                f.write(f"Base Name: {verification_results['base_name']}\n")
-                f.write(f"Expected Chunks: {verification_results['expected_chunk_count']}\n")
-                f.write(f"Status: {verification_results['summary_status']}\n\n")
-                
-                f.write("SUMMARY:\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"Text Files Found: {verification_results['found_text_files']}/{verification_results['expected_chunk_count']}\n")
-                f.write(f"Audio Files Found: {verification_results['found_audio_files']}/{verification_results['expected_chunk_count']}\n")
-                f.write(f"Valid Audio Files: {verification_results['valid_audio_files']}/{verification_results['expected_chunk_count']}\n")
-                f.write(f"Total Duration: {verification_results['total_duration_ms']/1000:.1f} seconds\n")
-                f.write(f"Total File Size: {verification_results['total_file_size_bytes']/1024/1024:.1f} MB\n\n")
-                
-                if verification_results['missing_chunks']:
-                    f.write(f"MISSING CHUNKS: {verification_results['missing_chunks']}\n\n")
-                
-                if verification_results['corrupted_chunks']:
-                    f.write(f"CORRUPTED CHUNKS: {verification_results['corrupted_chunks']}\n\n")
-                
-                f.write("DETAILED CHUNK VERIFICATION:\n")
-                f.write("-" * 40 + "\n")
+            # Build the report in memory and write it with a single call
+            report = [
+                "=" * 80 + "\n",
+                "AUDIO FILE VERIFICATION REPORT\n",
+                "=" * 80 + "\n\n",
+                f"Directory: {verification_results['chunks_directory']}\n",
+                f"Base Name: {verification_results['base_name']}\n",
+                f"Expected Chunks: {verification_results['expected_chunk_count']}\n",
+                f"Status: {verification_results['summary_status']}\n\n",
+                "SUMMARY:\n",
+                "-" * 40 + "\n",
+                f"Text Files Found: {verification_results['found_text_files']}/{verification_results['expected_chunk_count']}\n",
+                f"Audio Files Found: {verification_results['found_audio_files']}/{verification_results['expected_chunk_count']}\n",
+                f"Valid Audio Files: {verification_results['valid_audio_files']}/{verification_results['expected_chunk_count']}\n",
+                f"Total Duration: {verification_results['total_duration_ms']/1000:.1f} seconds\n",
+                f"Total File Size: {verification_results['total_file_size_bytes']/1024/1024:.1f} MB\n\n",
+            ]
+            
+            if verification_results['missing_chunks']:
+                report.append(f"MISSING CHUNKS: {verification_results['missing_chunks']}\n\n")
+            
+            if verification_results['corrupted_chunks']:
+                report.append(f"CORRUPTED CHUNKS: {verification_results['corrupted_chunks']}\n\n")
+            
+            report.append("DETAILED CHUNK VERIFICATION:\n")
+            report.append("-" * 40 + "\n")
+            
+            for chunk_info in verification_results['chunk_verifications']:
+                chunk_num = chunk_info['chunk_number']
+                report.append(f"Chunk {chunk_num:03d}:\n")
+                report.append(f"  Text File: {chunk_info['text_file_status']}\n")
+                report.append(f"  Audio File: {chunk_info['audio_file_status']}\n")
                 
-                for chunk_info in verification_results['chunk_verifications']:
-                    chunk_num = chunk_info['chunk_number']
-                    f.write(f"Chunk {chunk_num:03d}:\n")
-                    f.write(f"  Text File: {chunk_info['text_file_status']}\n")
-                    f.write(f"  Audio File: {chunk_info['audio_file_status']}\n")
+                if chunk_info['audio_verification']:
+                    av = chunk_info['audio_verification']
+                    report.append(f"    Duration: {av['duration_ms']/1000:.1f}s\n")
+                    report.append(f"    File Size: {av['file_size_bytes']/1024:.1f} KB\n")
+                    report.append(f"    Sample Rate: {av['sample_rate']} Hz\n")
+                    report.append(f"    Channels: {av['channels']}\n")
+                    report.append(f"    Bit Depth: {av['bit_depth']} bits\n")
                     
-                    if chunk_info['audio_verification']:
-                        av = chunk_info['audio_verification']
-                        f.write(f"    Duration: {av['duration_ms']/1000:.1f}s\n")
-                        f.write(f"    File Size: {av['file_size_bytes']/1024:.1f} KB\n")
-                        f.write(f"    Sample Rate: {av['sample_rate']} Hz\n")
-                        f.write(f"    Channels: {av['channels']}\n")
-                        f.write(f"    Bit Depth: {av['bit_depth']} bits\n")
-                        
-                        if av['error_messages']:
-                            f.write(f"    Errors: {'; '.join(av['error_messages'])}\n")
-                    
-                    f.write("\n")
+                    if av['error_messages']:
+                        report.append(f"    Errors: {'; '.join(av['error_messages'])}\n")
+                
+                report.append("\n")
+            
+            write_text(txt_file, "".join(report))
             
             self.logger.info(f"Verification report saved: {json_file} and {txt_file}")
             
@@ -4,11 +4,13 @@ Audio processing for seamless WAV stitching and quality control
 import wave
 import struct
 import io
-from typing import List, Optional, Dict, Any
+import shutil
+from typing import List, Optional, Dict, Any, Union, BinaryIO
 from pathlib import Path
 import logging
 from pydub import AudioSegment
 from pydub.silence import split_on_silence
+from pydub.utils import db_to_float, ratio_to_db
 import numpy as np
 
 from .config import config
@@ -23,14 +25,22 @@ class AudioProcessor:
         self.channels = config.tts_settings.get("channels", 2)
         self.fade_duration = config.tts_settings.get("fade_duration", 50)
         self.normalize_audio = config.tts_settings.get("normalize_audio", True)
+        # Output directories already created by this processor, so per-chunk saves skip the mkdir
+        self._known_dirs = set()
     
-    def stitch_audio_chunks(self, audio_chunks: List[bytes]) -> bytes:
-        """Stitch multiple audio chunks into seamless audio"""
+    def stitch_audio_chunks(self, audio_chunks: List[Union[bytes, Path, BinaryIO]]) -> bytes:
+        """Stitch multiple audio chunks into seamless audio
+        
+        Chunks may be WAV/PCM bytes, paths to WAV files on disk, or binary file
+        objects (e.g. open WAV files); paths and
+        files are decoded directly so callers don't need to hold every chunk in memory.
+        """
         if not audio_chunks:
             raise ValueError("No audio chunks provided")
         
         if len(audio_chunks) == 1:
-            return audio_chunks[0]
+            chunk = audio_chunks[0]
+            return chunk.read() if hasattr(chunk, 'read') else chunk
         
         self.logger.info(f"Stitching {len(audio_chunks)} audio chunks")
         
@@ -38,8 +48,12 @@ class AudioProcessor:
         audio_segments = []
         for i, chunk in enumerate(audio_chunks):
             try:
-                # Check if chunk is raw PCM or WAV format
-                if chunk.startswith(b'RIFF'):
+                # Check if chunk is a WAV file on disk, raw PCM or WAV format
+                if isinstance(chunk, Path):
+                    segment = AudioSegment.from_wav(str(chunk))
+                elif hasattr(chunk, 'read'):
+                    segment = self._segment_from_file(chunk)
+                elif chunk.startswith(b'RIFF'):
                     # Already WAV format
                     segment = AudioSegment.from_wav(io.BytesIO(chunk))
                 else:
@@ -78,29 +92,130 @@ class AudioProcessor:
         # Export to bytes
         return self._export_to_bytes(combined_audio)
 
+    def _segment_from_file(self, audio_file: BinaryIO) -> AudioSegment:
+        """Decode a binary file object holding WAV or raw PCM audio"""
+        is_wav = audio_file.read(4) == b'RIFF'
+        audio_file.seek(0)
+        if is_wav:
+            return AudioSegment.from_wav(audio_file)
+        return AudioSegment(
+            data=audio_file.read(),
+            sample_width=self.bit_depth // 8,
+            frame_rate=self.sample_rate,
+            channels=self.channels
+        )
+    
+    def concatenate_wav_files(self, chunk_paths: List[Path], output_path: Path) -> None:
+        """Stitch chunk WAV files into output_path, decoding one chunk at a time
+        
+        Applies the same fades and peak normalization as stitch_audio_chunks,
+        but frames are appended to the output as each chunk is read, so peak
+        memory is one chunk rather than the whole chapter.
+        """
+        if not chunk_paths:
+            raise ValueError("No audio chunks provided")
+        
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        if len(chunk_paths) == 1:
+            shutil.copyfile(chunk_paths[0], output_path)
+            self.logger.info(f"Audio saved to: {output_path}")
+            return
+        
+        self.logger.info(f"Streaming {len(chunk_paths)} audio chunks to {output_path}")
+        
+        # Output format follows the first chunk; later chunks are converted to match
+        first = AudioSegment.from_wav(str(chunk_paths[0]))
+        params = (first.frame_rate, first.channels, first.sample_width)
+        
+        # Normalization needs the peak of the whole chapter, so find it in a first pass
+        gain_db = 0.0
+        if self.normalize_audio:
+            peak = max(self._load_chunk_segment(path, i, len(chunk_paths), params).max
+                       for i, path in enumerate(chunk_paths))
+            if peak:
+                # Same 0.1 dB headroom as AudioSegment.normalize()
+                target_peak = first.max_possible_amplitude * db_to_float(-0.1)
+                gain_db = ratio_to_db(target_peak / peak)
+        
+        total_ms = 0
+        with wave.open(str(output_path), 'wb') as out:
+            out.setframerate(params[0])
+            out.setnchannels(params[1])
+            out.setsampwidth(params[2])
+            
+            for i, path in enumerate(chunk_paths):
+                try:
+                    segment = self._load_chunk_segment(path, i, len(chunk_paths), params)
+                    if gain_db:
+                        segment = segment.apply_gain(gain_db)
+                    out.writeframes(segment.raw_data)
+                    total_ms += len(segment)
+                except Exception as e:
+                    self.logger.error(f"Failed to process audio chunk {i + 1}: {e}")
+                    raise
+        
+        self.logger.info(f"Audio stitching completed. Final length: {total_ms}ms")
+        self.logger.info(f"Audio saved to: {output_path}")
+    
+    def _load_chunk_segment(self, path: Path, index: int, total: int, params: tuple) -> AudioSegment:
+        """Load one chunk WAV in the output format with its boundary fades applied"""
+        frame_rate, channels, sample_width = params
+        segment = AudioSegment.from_wav(str(path))
+        segment = segment.set_frame_rate(frame_rate).set_channels(channels).set_sample_width(sample_width)
+        
+        # Apply fade in/out to prevent clicks
+        if index > 0:
+            segment = segment.fade_in(self.fade_duration)
+        if index < total - 1:
+            segment = segment.fade_out(self.fade_duration)
+        return segment
+    
     def _export_to_bytes(self, audio: AudioSegment) -> bytes:
         """Export AudioSegment to WAV bytes"""
         buffer = io.BytesIO()
         audio.export(buffer, format="wav")
         return buffer.getvalue()
     
-    def save_wav_file(self, audio_data: bytes, output_path: Path) -> None:
-        """Save audio data to WAV file"""
+    def save_wav_file(self, audio_data: Union[bytes, BinaryIO], output_path: Path) -> None:
+        """Save audio data (bytes or a binary file object) to WAV file"""
         try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if hasattr(audio_data, 'read'):
+                is_wav = audio_data.read(4) == b'RIFF'
+                audio_data.seek(0)
+                if is_wav:
+                    # Copy straight through without materializing the whole file
+                    with self._open_output(output_path) as f:
+                        shutil.copyfileobj(audio_data, f)
+                    self.logger.info(f"Audio saved to: {output_path}")
+                    return
+                audio_data = audio_data.read()
             
             # Check if audio_data is raw PCM or already a WAV file
             if not audio_data.startswith(b'RIFF'):
                 # Raw PCM data - need to add WAV header
                 audio_data = self._add_wav_header(audio_data)
             
-            with open(output_path, 'wb') as f:
+            with self._open_output(output_path) as f:
                 f.write(audio_data)
             self.logger.info(f"Audio saved to: {output_path}")
         except Exception as e:
             self.logger.error(f"Failed to save audio file: {e}")
             raise
     
+    def _open_output(self, output_path: Path):
+        """Open output_path for binary writing, creating its directory the first time it is seen"""
+        directory = output_path.parent
+        if directory not in self._known_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(directory)
+        try:
+            return open(output_path, 'wb')
+        except FileNotFoundError:
+            # The directory was removed after it was first created
+            directory.mkdir(parents=True, exist_ok=True)
+            return open(output_path, 'wb')
+    
     def _add_wav_header(self, pcm_data: bytes) -> bytes:
         """Add WAV header to raw PCM data"""
         # PCM data length
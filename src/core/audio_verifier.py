@@ -14,6 +14,12 @@ try:
 except ImportError:
     WHISPER_AVAILABLE = False
 
+try:
+    from rapidfuzz.distance import Indel, Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 from .config import config
 
 @dataclass
@@ -179,24 +185,31 @@ class AudioVerifier:
         orig_words = orig_normalized.split()
         trans_words = trans_normalized.split()
         
-        # Calculate similarity using difflib
-        similarity = difflib.SequenceMatcher(None, orig_normalized, trans_normalized).ratio()
-        
-        # Calculate word-level differences
-        word_diffs = list(difflib.unified_diff(orig_words, trans_words, lineterm=''))
-        
-        # Count errors
-        missing_words = []
-        extra_words = []
-        
-        for line in word_diffs:
-            if line.startswith('- '):
-                missing_words.append(line[2:])
-            elif line.startswith('+ '):
-                extra_words.append(line[2:])
+        if RAPIDFUZZ_AVAILABLE:
+            # C++ bit-parallel edit distances; Indel similarity is the exact LCS ratio that
+            # SequenceMatcher.ratio() approximates
+            similarity = Indel.normalized_similarity(orig_normalized, trans_normalized)
+            word_edits = Levenshtein.editops(orig_words, trans_words)
+            word_distance = len(word_edits)
+            missing_words = [orig_words[op.src_pos] for op in word_edits if op.tag != 'insert']
+            extra_words = [trans_words[op.dest_pos] for op in word_edits if op.tag != 'delete']
+        else:
+            # Calculate similarity using difflib
+            similarity = difflib.SequenceMatcher(None, orig_normalized, trans_normalized).ratio()
+            
+            # Calculate word-level differences
+            word_distance = 0
+            missing_words = []
+            extra_words = []
+            matcher = difflib.SequenceMatcher(None, orig_words, trans_words)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                if tag != 'equal':
+                    missing_words.extend(orig_words[i1:i2])
+                    extra_words.extend(trans_words[j1:j2])
+                    word_distance += max(i2 - i1, j2 - j1)
         
         # Calculate error rates
-        word_error_rate = len(missing_words + extra_words) / max(len(orig_words), 1)
+        word_error_rate = word_distance / max(len(orig_words), 1)
         char_error_rate = 1.0 - similarity
         
         return ComparisonResult(
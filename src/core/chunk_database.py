@@ -4,13 +4,21 @@ Enables individual chunk reprocessing, insertion, and management
 """
 import sqlite3
 import json
+import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import logging
 
+# Read pages through a memory map instead of copying them into SQLite's page cache
+_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+
+# Rows per multi-row audio_versions INSERT, well under SQLite's bound-parameter limit at 8 columns
+_VERSION_INSERT_BATCH = 50
+
 @dataclass
 class BookProject:
     """Represents a book processing project"""
@@ -65,18 +73,109 @@ class ChunkRecord:
     orpheus_speed: Optional[float] = 1.0
     sequence_in_chapter: Optional[int] = None
 
+def _audio_file_stats(audio_file_path: str) -> Tuple[Optional[int], Optional[float]]:
+    """File size and duration of an audio file, each None when unavailable"""
+    file_size_bytes = None
+    duration_seconds = None
+    try:
+        audio_path = Path(audio_file_path)
+        if audio_path.exists():
+            file_size_bytes = audio_path.stat().st_size
+            
+            # Get duration using librosa or similar
+            try:
+                import librosa
+                duration_seconds = librosa.get_duration(filename=str(audio_path))
+            except ImportError:
+                pass
+    except Exception:
+        pass
+    return file_size_bytes, duration_seconds
+
+def _chunk_from_row(row: tuple) -> ChunkRecord:
+    """Build a ChunkRecord from a 'SELECT * FROM chunks' row"""
+    # _migrate_chunks_table guarantees the Orpheus columns, so every row carries all of them
+    return ChunkRecord(
+        id=row[0], chapter_id=row[1], chunk_number=row[2], 
+        position_start=row[3], position_end=row[4], original_text=row[5],
+        cleaned_text=row[6], text_file_path=row[7], audio_file_path=row[8],
+        transcription_file_path=row[9], diff_file_path=row[10], status=row[11],
+        verification_score=row[12], processing_time=row[13], error_message=row[14],
+        created_at=row[15], updated_at=row[16], metadata=json.loads(row[17]),
+        orpheus_temperature=row[18], orpheus_voice=row[19], orpheus_speed=row[20],
+        sequence_in_chapter=row[21]
+    )
+
 class ChunkDatabase:
     """Database manager for chunk-level operations"""
     
     def __init__(self, db_path: Path = None):
+        """Open or create the database at db_path; ":memory:" keeps it in RAM for this object's lifetime"""
         self.logger = logging.getLogger(__name__)
-        self.db_path = db_path or Path("data/chunk_database.db")
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Connection of the transaction() in progress, per thread
+        self._local = threading.local()
+        self.db_path = Path(db_path or "data/chunk_database.db")
+        self._in_memory = str(self.db_path) == ":memory:"
+        if self._in_memory:
+            # Each method opens its own connection, so they share one named in-memory database
+            # that stays alive as long as this keep-alive connection does
+            self._database = f"file:chunk_database_{id(self)}?mode=memory&cache=shared"
+            self._keepalive = sqlite3.connect(self._database, uri=True)
+        else:
+            self._database = self.db_path
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection tuned for the many small write transactions chunk processing makes"""
+        conn = sqlite3.connect(self._database, uri=self._in_memory)
+        # WAL only needs fsync at checkpoints, so NORMAL stays crash-safe while skipping one per commit
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE_BYTES}")
+        return conn
+    
+    @contextmanager
+    def _connection(self):
+        """Connection for one method call: the open transaction's, or a fresh one committed on exit"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            yield conn
+            return
+        
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    @contextmanager
+    def transaction(self):
+        """Run several calls on this thread as one transaction, committed once at the end
+        
+        Rolled back entirely if the block raises; nested transaction() blocks join the outer one.
+        """
+        if getattr(self._local, 'conn', None) is not None:
+            yield
+            return
+        
+        conn = self._connect()
+        self._local.conn = conn
+        try:
+            with conn:
+                yield
+        finally:
+            self._local.conn = None
+            conn.close()
+    
     def _init_database(self):
         """Initialize database tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
+            # Journal mode is stored in the database file, so every later connection inherits it
+            if not self._in_memory:
+                conn.execute("PRAGMA journal_mode=WAL")
+            
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS projects (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -230,9 +329,13 @@ class ChunkDatabase:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_chunks_chapter ON chunks(chapter_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_chunks_status ON chunks(status)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_audio_versions_chunk ON audio_versions(chunk_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_word_timings_version ON word_timings(audio_version_id)")
+            # Lookups by version/chapter read rows in word order, so index both to skip the sort;
+            # these supersede the earlier single-column indexes
+            conn.execute("DROP INDEX IF EXISTS idx_word_timings_version")
+            conn.execute("DROP INDEX IF EXISTS idx_chapter_words_chapter")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_word_timings_version_order ON word_timings(audio_version_id, word_index)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_word_timings_time ON word_timings(start_time, end_time)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_chapter_words_chapter ON chapter_words(chapter_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_chapter_words_chapter_order ON chapter_words(chapter_id, word_index)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_chapter_words_chunk ON chapter_words(chunk_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_chapter_audio_versions_chapter ON chapter_audio_versions(chapter_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_chapter_audio_versions_active ON chapter_audio_versions(is_active)")
@@ -265,6 +368,11 @@ class ChunkDatabase:
         except Exception as e:
             self.logger.warning(f"Migration warning: {e}")
     
+    def table_schemas(self) -> Dict[str, str]:
+        """CREATE TABLE statement of every table, by table name, as stored in sqlite_master"""
+        with self._connection() as conn:
+            return dict(conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'table'").fetchall())
+    
     def create_project(self, title: str, original_file: str, metadata: Dict[str, Any] = None) -> int:
         """Create a new book project"""
         project = BookProject(
@@ -277,7 +385,7 @@ class ChunkDatabase:
             metadata=metadata or {}
         )
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 INSERT INTO projects (title, original_file, created_at, status, total_chapters, metadata)
                 VALUES (?, ?, ?, ?, ?, ?)
@@ -308,7 +416,7 @@ class ChunkDatabase:
             metadata=metadata or {}
         )
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 INSERT INTO chapters (project_id, chapter_number, title, original_text, 
                                     cleaned_text, chunks_directory, total_chunks, completed_chunks,
@@ -348,7 +456,7 @@ class ChunkDatabase:
             metadata=metadata or {}
         )
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 INSERT INTO chunks (chapter_id, chunk_number, position_start, position_end,
                                   original_text, cleaned_text, text_file_path, status,
@@ -367,7 +475,7 @@ class ChunkDatabase:
                            diff_file_path: str = None, verification_score: float = None,
                            processing_time: float = None, error_message: str = None):
         """Update chunk processing status and results"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("""
                 UPDATE chunks 
                 SET status = ?, audio_file_path = ?, transcription_file_path = ?,
@@ -380,7 +488,7 @@ class ChunkDatabase:
     
     def get_project(self, project_id: int) -> Optional[BookProject]:
         """Get project by ID"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("SELECT * FROM projects WHERE id = ?", (project_id,))
             row = cursor.fetchone()
             
@@ -393,7 +501,7 @@ class ChunkDatabase:
     
     def get_chapter(self, chapter_id: int) -> Optional[ChapterRecord]:
         """Get chapter by ID"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("SELECT * FROM chapters WHERE id = ?", (chapter_id,))
             row = cursor.fetchone()
             
@@ -409,52 +517,28 @@ class ChunkDatabase:
     def get_chunks_by_chapter(self, chapter_id: int) -> List[ChunkRecord]:
         """Get all chunks for a chapter"""
         chunks = []
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM chunks WHERE chapter_id = ? ORDER BY chunk_number
             """, (chapter_id,))
             
             for row in cursor.fetchall():
-                chunks.append(ChunkRecord(
-                    id=row[0], chapter_id=row[1], chunk_number=row[2], 
-                    position_start=row[3], position_end=row[4], original_text=row[5],
-                    cleaned_text=row[6], text_file_path=row[7], audio_file_path=row[8],
-                    transcription_file_path=row[9], diff_file_path=row[10], status=row[11],
-                    verification_score=row[12], processing_time=row[13], error_message=row[14],
-                    created_at=row[15], updated_at=row[16], metadata=json.loads(row[17])
-                ))
+                chunks.append(_chunk_from_row(row))
         return chunks
     
     def get_chunk(self, chunk_id: int) -> Optional[ChunkRecord]:
         """Get specific chunk by ID"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("SELECT * FROM chunks WHERE id = ?", (chunk_id,))
             row = cursor.fetchone()
             
             if row:
-                # Handle both old and new schema
-                base_record = ChunkRecord(
-                    id=row[0], chapter_id=row[1], chunk_number=row[2], 
-                    position_start=row[3], position_end=row[4], original_text=row[5],
-                    cleaned_text=row[6], text_file_path=row[7], audio_file_path=row[8],
-                    transcription_file_path=row[9], diff_file_path=row[10], status=row[11],
-                    verification_score=row[12], processing_time=row[13], error_message=row[14],
-                    created_at=row[15], updated_at=row[16], metadata=json.loads(row[17])
-                )
-                
-                # Add new fields if they exist
-                if len(row) > 18:
-                    base_record.orpheus_temperature = row[18]
-                    base_record.orpheus_voice = row[19] if len(row) > 19 else 'tara'
-                    base_record.orpheus_speed = row[20] if len(row) > 20 else 1.0
-                    base_record.sequence_in_chapter = row[21] if len(row) > 21 else None
-                
-                return base_record
+                return _chunk_from_row(row)
         return None
     
     def find_project_by_file(self, original_file: str) -> Optional[BookProject]:
         """Find project by original file path"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("SELECT * FROM projects WHERE original_file = ?", (original_file,))
             row = cursor.fetchone()
             
@@ -467,7 +551,7 @@ class ChunkDatabase:
     
     def find_chapter(self, project_id: int, chapter_number: int) -> Optional[ChapterRecord]:
         """Find chapter by project ID and chapter number"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM chapters WHERE project_id = ? AND chapter_number = ?
             """, (project_id, chapter_number))
@@ -502,7 +586,7 @@ class ChunkDatabase:
         params.append(datetime.now().isoformat())
         params.append(chapter_id)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute(f"""
                 UPDATE chapters 
                 SET {', '.join(updates)}
@@ -525,7 +609,7 @@ class ChunkDatabase:
     
     def mark_chunk_for_reprocessing(self, chunk_id: int, reason: str = "Manual reprocess"):
         """Mark a chunk to be reprocessed"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("""
                 UPDATE chunks 
                 SET status = 'needs_reprocess', error_message = ?, updated_at = ?
@@ -536,8 +620,9 @@ class ChunkDatabase:
     
     def insert_chunk_at_position(self, chapter_id: int, position: int, new_text: str) -> int:
         """Insert a new chunk at a specific position within a chapter"""
-        # First, shift all existing chunks after the position
-        with sqlite3.connect(self.db_path) as conn:
+        # First, shift all existing chunks after the position; create_chunk joins the same
+        # transaction, so the shift and the insert commit together
+        with self.transaction(), self._connection() as conn:
             conn.execute("""
                 UPDATE chunks 
                 SET chunk_number = chunk_number + 1
@@ -561,7 +646,7 @@ class ChunkDatabase:
     
     def get_chapter_summary(self, chapter_id: int) -> Dict[str, Any]:
         """Get summary statistics for a chapter"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT 
                     COUNT(*) as total_chunks,
@@ -586,7 +671,7 @@ class ChunkDatabase:
     def get_chunks_needing_reprocessing(self, chapter_id: int = None) -> List[ChunkRecord]:
         """Get all chunks that need reprocessing"""
         chunks = []
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             if chapter_id:
                 cursor = conn.execute("""
                     SELECT * FROM chunks WHERE chapter_id = ? AND status = 'needs_reprocess'
@@ -599,83 +684,91 @@ class ChunkDatabase:
                 """)
             
             for row in cursor.fetchall():
-                chunks.append(ChunkRecord(
-                    id=row[0], chapter_id=row[1], chunk_number=row[2], 
-                    position_start=row[3], position_end=row[4], original_text=row[5],
-                    cleaned_text=row[6], text_file_path=row[7], audio_file_path=row[8],
-                    transcription_file_path=row[9], diff_file_path=row[10], status=row[11],
-                    verification_score=row[12], processing_time=row[13], error_message=row[14],
-                    created_at=row[15], updated_at=row[16], metadata=json.loads(row[17])
-                ))
+                chunks.append(_chunk_from_row(row))
         return chunks
     
     # Audio version tracking methods
     def create_audio_version(self, chunk_id: int, audio_file_path: str, orpheus_params: Dict[str, Any] = None) -> int:
         """Create a new audio version for a chunk"""
-        with sqlite3.connect(self.db_path) as conn:
+        return self.create_audio_versions(chunk_id, [(audio_file_path, orpheus_params)])[0]
+    
+    def create_audio_versions(self, chunk_id: int,
+                              versions: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[int]:
+        """Create several audio versions for a chunk with multi-row INSERTs; the last one becomes active
+        
+        versions holds (audio_file_path, orpheus_params) pairs; returns their IDs in the same order.
+        """
+        if not versions:
+            return []
+        
+        # Stat the files before taking the write lock
+        created_at = datetime.now().isoformat()
+        last = len(versions)
+        rows = [
+            (audio_file_path, json.dumps(orpheus_params or {}), offset == last, *_audio_file_stats(audio_file_path))
+            for offset, (audio_file_path, orpheus_params) in enumerate(versions, 1)
+        ]
+        
+        with self._connection() as conn:
             # Get next version number
             cursor = conn.execute("SELECT MAX(version_number) FROM audio_versions WHERE chunk_id = ?", (chunk_id,))
-            max_version = cursor.fetchone()[0]
-            version_number = (max_version or 0) + 1
+            max_version = cursor.fetchone()[0] or 0
             
-            # Get file stats if possible
-            file_size_bytes = None
-            duration_seconds = None
-            try:
-                from pathlib import Path
-                audio_path = Path(audio_file_path)
-                if audio_path.exists():
-                    file_size_bytes = audio_path.stat().st_size
-                    
-                    # Get duration using librosa or similar
-                    try:
-                        import librosa
-                        duration_seconds = librosa.get_duration(filename=str(audio_path))
-                    except ImportError:
-                        pass
-            except Exception:
-                pass
+            for start in range(0, len(rows), _VERSION_INSERT_BATCH):
+                batch = rows[start:start + _VERSION_INSERT_BATCH]
+                params = []
+                for offset, (audio_file_path, params_json, is_active, file_size_bytes, duration_seconds) in \
+                        enumerate(batch, max_version + start + 1):
+                    params += (chunk_id, offset, audio_file_path, params_json, created_at, is_active,
+                               file_size_bytes, duration_seconds)
+                conn.execute(f"""
+                    INSERT INTO audio_versions (chunk_id, version_number, audio_file_path, orpheus_params, 
+                                              created_at, is_active, file_size_bytes, duration_seconds)
+                    VALUES {', '.join(['(?, ?, ?, ?, ?, ?, ?, ?)'] * len(batch))}
+                """, params)
             
+            # IDs by version number, which (unlike RETURNING row order) is defined; UNIQUE(chunk_id,
+            # version_number) indexes this lookup
             cursor = conn.execute("""
-                INSERT INTO audio_versions (chunk_id, version_number, audio_file_path, orpheus_params, 
-                                          created_at, is_active, file_size_bytes, duration_seconds)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (chunk_id, version_number, audio_file_path, json.dumps(orpheus_params or {}),
-                  datetime.now().isoformat(), True, file_size_bytes, duration_seconds))
-            
-            version_id = cursor.lastrowid
+                SELECT id FROM audio_versions WHERE chunk_id = ? AND version_number > ?
+                ORDER BY version_number
+            """, (chunk_id, max_version))
+            version_ids = [row[0] for row in cursor.fetchall()]
             
             # Deactivate previous versions
             conn.execute("""
                 UPDATE audio_versions SET is_active = FALSE 
                 WHERE chunk_id = ? AND id != ?
-            """, (chunk_id, version_id))
+            """, (chunk_id, version_ids[-1]))
             
-            self.logger.info(f"Created audio version {version_id} for chunk {chunk_id}")
-            return version_id
+            self.logger.info(f"Created audio versions {version_ids} for chunk {chunk_id}")
+            return version_ids
     
     def store_word_timings(self, audio_version_id: int, word_timings: List[Dict[str, Any]]):
         """Store word-level timing data for an audio version"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             # Clear existing timings for this version
             conn.execute("DELETE FROM word_timings WHERE audio_version_id = ?", (audio_version_id,))
             
-            # Insert new timings
-            for timing in word_timings:
-                conn.execute("""
-                    INSERT INTO word_timings (audio_version_id, word_index, word_text, start_time, 
-                                            end_time, confidence, character_start, character_end)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (audio_version_id, timing.get('word_index', 0), timing['word'],
-                      timing['start'], timing['end'], timing.get('confidence', 1.0),
-                      timing.get('char_start'), timing.get('char_end')))
+            # Insert new timings with one prepared statement fed row by row, committed together on exit
+            rows = ((audio_version_id, timing.get('word_index', 0), timing['word'],
+                     timing['start'], timing['end'], timing.get('confidence', 1.0),
+                     timing.get('char_start'), timing.get('char_end'))
+                    for timing in word_timings)
+            conn.executemany("""
+                INSERT INTO word_timings (audio_version_id, word_index, word_text, start_time, 
+                                        end_time, confidence, character_start, character_end)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            # Refresh planner statistics once per bulk write so later timing lookups keep using their index
+            conn.execute("PRAGMA optimize")
             
             self.logger.info(f"Stored {len(word_timings)} word timings for audio version {audio_version_id}")
     
     def get_audio_versions(self, chunk_id: int) -> List[Dict[str, Any]]:
         """Get all audio versions for a chunk"""
         versions = []
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT id, version_number, audio_file_path, orpheus_params, created_at, 
                        is_active, processing_time, file_size_bytes, duration_seconds
@@ -698,7 +791,7 @@ class ChunkDatabase:
     
     def get_active_audio_version(self, chunk_id: int) -> Optional[Dict[str, Any]]:
         """Get the currently active audio version for a chunk"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT id, version_number, audio_file_path, orpheus_params, created_at, 
                        processing_time, file_size_bytes, duration_seconds
@@ -719,10 +812,18 @@ class ChunkDatabase:
                 }
         return None
     
+    def get_active_version_number(self, chunk_id: int) -> Optional[int]:
+        """Get just the version number of a chunk's active audio version"""
+        with self._connection() as conn:
+            row = conn.execute("""
+                SELECT version_number FROM audio_versions WHERE chunk_id = ? AND is_active = TRUE
+            """, (chunk_id,)).fetchone()
+        return row[0] if row else None
+    
     def get_word_timings(self, audio_version_id: int) -> List[Dict[str, Any]]:
         """Get word timings for an audio version"""
         timings = []
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT word_index, word_text, start_time, end_time, confidence, character_start, character_end
                 FROM word_timings WHERE audio_version_id = ? ORDER BY word_index
@@ -742,26 +843,28 @@ class ChunkDatabase:
     
     def store_chapter_words(self, chapter_id: int, words_data: List[Dict[str, Any]]):
         """Store chapter-level word mapping for text highlighting"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             # Clear existing data
             conn.execute("DELETE FROM chapter_words WHERE chapter_id = ?", (chapter_id,))
             
-            # Insert new word mapping
-            for word_data in words_data:
-                conn.execute("""
-                    INSERT INTO chapter_words (chapter_id, word_index, word_text, chunk_id, 
-                                             char_start, char_end, audio_start_time, audio_end_time)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (chapter_id, word_data['word_index'], word_data['word'],
-                      word_data.get('chunk_id'), word_data['char_start'], word_data['char_end'],
-                      word_data.get('audio_start_time'), word_data.get('audio_end_time')))
+            # Insert new word mapping with one prepared statement fed row by row, committed together on exit
+            rows = ((chapter_id, word_data['word_index'], word_data['word'],
+                     word_data.get('chunk_id'), word_data['char_start'], word_data['char_end'],
+                     word_data.get('audio_start_time'), word_data.get('audio_end_time'))
+                    for word_data in words_data)
+            conn.executemany("""
+                INSERT INTO chapter_words (chapter_id, word_index, word_text, chunk_id, 
+                                         char_start, char_end, audio_start_time, audio_end_time)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            conn.execute("PRAGMA optimize")
             
             self.logger.info(f"Stored {len(words_data)} word mappings for chapter {chapter_id}")
     
     def get_chapter_words(self, chapter_id: int) -> List[Dict[str, Any]]:
         """Get word mapping for a chapter"""
         words = []
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT word_index, word_text, chunk_id, char_start, char_end, audio_start_time, audio_end_time
                 FROM chapter_words WHERE chapter_id = ? ORDER BY word_index
@@ -782,7 +885,7 @@ class ChunkDatabase:
     def update_chunk_orpheus_params(self, chunk_id: int, temperature: float = None, 
                                    voice: str = None, speed: float = None):
         """Update Orpheus parameters for a chunk"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             updates = []
             params = []
             
@@ -837,7 +940,7 @@ class ChunkDatabase:
             except:
                 pass
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             # Deactivate previous versions
             conn.execute("""
                 UPDATE chapter_audio_versions 
@@ -875,7 +978,7 @@ class ChunkDatabase:
     
     def get_active_chapter_audio(self, chapter_id: int) -> Optional[Dict[str, Any]]:
         """Get the active stitched audio version for a chapter"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT id, version_number, audio_file_path, file_size_bytes,
                        duration_seconds, created_at, stitched_from_chunks,
@@ -904,7 +1007,7 @@ class ChunkDatabase:
     
     def list_chapter_audio_versions(self, chapter_id: int) -> List[Dict[str, Any]]:
         """List all audio versions for a chapter"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT id, version_number, audio_file_path, file_size_bytes,
                        duration_seconds, created_at, is_active, stitched_from_chunks,
@@ -935,7 +1038,7 @@ class ChunkDatabase:
     
     def set_chapter_custom_title(self, chapter_id: int, custom_title: str):
         """Set a custom title for a chapter"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             # Upsert chapter settings
             conn.execute("""
                 INSERT INTO chapter_settings (chapter_id, custom_title, created_at, updated_at)
@@ -949,7 +1052,7 @@ class ChunkDatabase:
     
     def get_chapter_display_info(self, chapter_id: int) -> Dict[str, Any]:
         """Get chapter display information including custom title"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT c.id, c.chapter_number, c.title, c.status,
                        cs.custom_title, cs.display_order, cs.is_hidden, cs.notes, cs.tags
@@ -5,7 +5,8 @@ Enables individual chunk reprocessing, insertion, and selective audio stitching
 import time
 import sqlite3
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from functools import cached_property
+from typing import List, Dict, Any, Optional, Tuple, Callable
 import logging
 from datetime import datetime
 
@@ -14,19 +15,30 @@ from .text_processor import TextProcessor
 from .fal_tts_client import FalTTSClient
 from .audio_processor import AudioProcessor
 from .audio_verifier import AudioVerifier
+from .html_diff import write_html_diff, verification_scores
 from .config import config
+from ..utils.text_io import write_text
 
 class ChunkManager:
     """Advanced chunk-level management for cost-effective reprocessing"""
     
-    def __init__(self, tts_client=None, audio_processor=None, audio_verifier=None):
+    def __init__(self, tts_client=None, audio_processor=None, audio_verifier=None,
+                 tts_client_factory: Optional[Callable[[], Any]] = None):
         self.logger = logging.getLogger(__name__)
         self.db = ChunkDatabase()
         self.text_processor = TextProcessor()
-        self.tts_client = tts_client or FalTTSClient()
+        # The TTS client is only needed to regenerate chunks, so without one it is built on first use
+        if tts_client is not None:
+            self.tts_client = tts_client
+        self._tts_client_factory = tts_client_factory or FalTTSClient
         self.audio_processor = audio_processor or AudioProcessor()
         self.audio_verifier = audio_verifier or AudioVerifier()
-        
+    
+    @cached_property
+    def tts_client(self):
+        """TTS client for chunk regeneration, created on first use"""
+        return self._tts_client_factory()
+    
     def register_chapter_processing(self, input_file: str, chapter_number: int, 
                                   chapter_title: str, original_text: str, 
                                   chunks_directory: str) -> int:
@@ -123,12 +135,11 @@ class ChunkManager:
             verification = self.audio_verifier.verify_audio_content(audio_file_path, chunk.cleaned_text)
             
             # Save transcription
-            with open(transcription_file_path, 'w', encoding='utf-8') as f:
-                f.write(verification.transcribed_text)
+            write_text(transcription_file_path, verification.transcribed_text)
             
-            # Generate diff
-            self._generate_html_diff(chunk.cleaned_text, verification.transcribed_text, 
-                                   diff_file_path, f"Chunk {chunk.chunk_number} (Reprocessed)")
+            # Generate diff (same page layout as the main processor's chunk diffs)
+            write_html_diff(chunk.cleaned_text, verification.transcribed_text, diff_file_path,
+                            f"{chunk.chunk_number} (Reprocessed)", verification_scores(verification))
             
             processing_time = time.time() - start_time
             
@@ -178,8 +189,7 @@ class ChunkManager:
         text_file_path = chunks_dir / f"{base_name}_INSERTED_{timestamp}.txt"
         
         # Save the new text file
-        with open(text_file_path, 'w', encoding='utf-8') as f:
-            f.write(cleaned_text)
+        write_text(text_file_path, cleaned_text)
         
         # Update chunk with proper file path  
         with sqlite3.connect(self.db.db_path) as conn:
@@ -260,30 +270,22 @@ class ChunkManager:
                 self.logger.warning(f"⚠️ Audio file missing for chunk {chunk.chunk_number}: {audio_path}")
                 continue
             
-            # Load audio data
-            with open(audio_path, 'rb') as f:
-                audio_data = f.read()
-                audio_chunks.append(audio_data)
-                included_chunks.append(chunk.chunk_number)
+            # Stitcher reads the WAV from disk
+            audio_chunks.append(audio_path)
+            included_chunks.append(chunk.chunk_number)
         
         if not audio_chunks:
             raise ValueError("No valid audio chunks found for stitching")
         
         self.logger.info(f"Stitching {len(audio_chunks)} chunks: {included_chunks}")
         
-        # Stitch audio
-        if len(audio_chunks) == 1:
-            final_audio = audio_chunks[0]
-        else:
-            final_audio = self.audio_processor.stitch_audio_chunks(audio_chunks)
-        
-        # Save new stitched file
+        # Stitch audio into new file
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         chunks_dir = Path(chapter.chunks_directory)
         output_filename = f"Chapter_{chapter.chapter_number:02d}_RESTITCHED_{timestamp}.wav"
         output_path = chunks_dir / output_filename
         
-        self.audio_processor.save_wav_file(final_audio, output_path)
+        self.audio_processor.concatenate_wav_files(audio_chunks, output_path)
         
         # Register the new stitched audio version in the database
         chunk_ids = [chunk.id for chunk in chunks if chunk.id not in exclude_chunk_ids]
@@ -347,54 +349,6 @@ class ChunkManager:
         self.logger.info(f"Batch reprocessing complete: {results['reprocessed']} success, {results['failed']} failed")
         return results
     
-    def _generate_html_diff(self, original_text: str, transcribed_text: str, 
-                           diff_file: Path, chunk_title: str):
-        """Generate HTML diff file for chunk comparison"""
-        import difflib
-        
-        original_words = original_text.split()
-        transcribed_words = transcribed_text.split()
-        
-        differ = difflib.HtmlDiff(tabsize=2)
-        diff_html = differ.make_file(
-            original_words,
-            transcribed_words,
-            fromdesc=f"Original Text ({chunk_title})",
-            todesc=f"Transcribed Audio ({chunk_title})",
-            context=True,
-            numlines=3
-        )
-        
-        # Add custom CSS
-        custom_css = """
-        <style>
-        body { font-family: Arial, sans-serif; margin: 20px; }
-        .diff_header { background-color: #f0f0f0; padding: 10px; border-radius: 5px; margin-bottom: 10px; }
-        table.diff { border-collapse: collapse; width: 100%; }
-        .diff_add { background-color: #aaffaa; }
-        .diff_chg { background-color: #ffff77; }
-        .diff_sub { background-color: #ffaaaa; }
-        .summary { background-color: #e8f4fd; padding: 15px; border-radius: 5px; margin: 10px 0; }
-        </style>
-        """
-        
-        # Calculate accuracy
-        comparison = self.audio_verifier._compare_texts(original_text, transcribed_text)
-        
-        summary_html = f"""
-        <div class="summary">
-            <h3>Verification Summary - {chunk_title}</h3>
-            <p><strong>Accuracy Score:</strong> {comparison.accuracy_score:.2%}</p>
-            <p><strong>Status:</strong> {'✅ PASSED' if comparison.accuracy_score >= 0.85 else '❌ FAILED'}</p>
-        </div>
-        """
-        
-        diff_html = diff_html.replace('<head>', f'<head>{custom_css}')
-        diff_html = diff_html.replace('<body>', f'<body>{summary_html}')
-        
-        with open(diff_file, 'w', encoding='utf-8') as f:
-            f.write(diff_html)
-    
     def mark_chunk_for_reprocessing(self, chunk_id: int, reason: str = "User requested"):
         """Mark a specific chunk for reprocessing"""
         self.db.mark_chunk_for_reprocessing(chunk_id, reason)
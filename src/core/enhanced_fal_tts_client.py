@@ -13,6 +13,10 @@ import logging
 from .fal_tts_client import FalTTSClient
 from .chunk_database import ChunkDatabase
 
+# Runs of letters and digits; runs containing an underscore are not words
+_WORD_RE = re.compile(r'\w+')
+_NON_WORD_RE = re.compile(r'\W+')
+
 
 class EnhancedFalTTSClient(FalTTSClient):
     """Enhanced TTS client with word timing extraction capabilities"""
@@ -189,26 +193,24 @@ class EnhancedFalTTSClient(FalTTSClient):
     
     def tokenize_text(self, text: str) -> List[Dict[str, str]]:
         """Tokenize text into words, preserving punctuation context"""
-        # Simple word tokenization that maintains punctuation
-        words = []
-        word_pattern = re.compile(r'\b\w+\b|\S')
-        
-        for match in word_pattern.finditer(text):
-            word = match.group()
-            if word.isalpha() or word.isalnum():  # Only include actual words
-                words.append({
-                    'word': word,
-                    'start_pos': match.start(),
-                    'end_pos': match.end()
-                })
-        
-        return words
+        # Simple word tokenization that maintains punctuation positions
+        return [
+            {'word': match.group(), 'start_pos': match.start(), 'end_pos': match.end()}
+            for match in _WORD_RE.finditer(text)
+            if '_' not in match.group()  # Only include actual words
+        ]
     
     def words_match(self, original: str, transcribed: str, threshold: float = 0.8) -> bool:
         """Check if two words match closely enough for alignment"""
+        # Most aligned pairs differ at most in case, which one C-level compare settles
+        orig_folded = original.casefold()
+        trans_folded = transcribed.casefold()
+        if orig_folded == trans_folded:
+            return True
+        
         # Normalize words for comparison
-        orig_clean = re.sub(r'[^\w]', '', original.lower())
-        trans_clean = re.sub(r'[^\w]', '', transcribed.lower())
+        orig_clean = _NON_WORD_RE.sub('', orig_folded)
+        trans_clean = _NON_WORD_RE.sub('', trans_folded)
         
         if orig_clean == trans_clean:
             return True
@@ -19,8 +19,9 @@ class EnhancedBook2AudioProcessor(Book2AudioProcessor):
         # Initialize chunk management
         self.enable_chunk_tracking = enable_chunk_tracking
         if enable_chunk_tracking:
+            # Hand over the processor's lazy client, so neither builds one until a chunk needs audio
             self.chunk_manager = ChunkManager(
-                tts_client=self.tts_client,
+                tts_client_factory=lambda: self.tts_client,
                 audio_processor=self.audio_processor,
                 audio_verifier=self.audio_verifier
             )
@@ -5,7 +5,7 @@ import os
 import requests
 import time
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from pathlib import Path
 
 try:
@@ -15,6 +15,9 @@ except ImportError:
 
 from .config import config
 
+# How often a batched request's status is polled while waiting for its result
+_RESULT_POLL_INTERVAL = 0.25
+
 class FalTTSClient:
     """Client for Fal.ai Orpheus TTS API"""
     
@@ -37,6 +40,9 @@ class FalTTSClient:
         # Set the API key for fal_client
         os.environ['FAL_KEY'] = self.api_key
         
+        # Keep-alive pool for audio downloads, reused across chunks
+        self.session = requests.Session()
+        
         self.logger.info("Fal.ai TTS client initialized")
     
     def generate_audio(self, text: str, voice: str = None) -> bytes:
@@ -45,14 +51,7 @@ class FalTTSClient:
             raise ValueError("Text cannot be empty")
         
         voice = voice or config.tts_settings.get("voice", "tara")
-        
-        # Fal.ai API parameters
-        arguments = {
-            "text": text,
-            "voice": voice,
-            "temperature": config.tts_settings.get("temperature", 0.7),
-            "repetition_penalty": config.tts_settings.get("repetition_penalty", 1.2)
-        }
+        arguments = self._build_arguments(text, voice)
         
         for attempt in range(self.retry_attempts):
             try:
@@ -60,9 +59,7 @@ class FalTTSClient:
                 self.logger.debug(f"Text length: {len(text)} characters")
                 self.logger.debug(f"Voice: {voice}")
                 
-                # Dynamic timeout based on text length
-                dynamic_timeout = max(self.timeout, len(text) * 0.3)  # 0.3s per character for Fal.ai
-                dynamic_timeout = min(dynamic_timeout, 300)  # Cap at 5 minutes
+                dynamic_timeout = self._request_timeout(text)
                 
                 self.logger.debug(f"Using timeout: {dynamic_timeout}s for {len(text)} character text")
                 
@@ -76,35 +73,7 @@ class FalTTSClient:
                 generation_time = time.time() - start_time
                 self.logger.info(f"Audio generation completed in {generation_time:.1f}s")
                 
-                # Check if result contains audio URL
-                if not result or 'audio' not in result:
-                    raise Exception(f"Invalid response from Fal.ai API: {result}")
-                
-                audio_info = result['audio']
-                # Handle both string URL and dict response formats
-                if isinstance(audio_info, str):
-                    audio_url = audio_info
-                elif isinstance(audio_info, dict) and 'url' in audio_info:
-                    audio_url = audio_info['url']
-                else:
-                    raise Exception(f"Unexpected audio format in response: {audio_info}")
-                
-                self.logger.debug(f"Audio URL received: {audio_url}")
-                
-                # Download the audio file
-                download_start = time.time()
-                audio_response = requests.get(audio_url, timeout=60)
-                audio_response.raise_for_status()
-                
-                download_time = time.time() - download_start
-                self.logger.info(f"Audio download completed in {download_time:.1f}s")
-                self.logger.debug(f"Audio file size: {len(audio_response.content)} bytes")
-                
-                # Validate audio content
-                if len(audio_response.content) < 1000:  # Less than 1KB is suspicious
-                    self.logger.warning(f"Small audio file received: {len(audio_response.content)} bytes")
-                
-                return audio_response.content
+                return self._download_audio(result)
                 
             except Exception as e:
                 error_msg = str(e)
@@ -140,6 +109,107 @@ class FalTTSClient:
         
         raise Exception("All retry attempts failed")
     
+    def _request_timeout(self, text: str) -> float:
+        """Dynamic timeout based on text length"""
+        dynamic_timeout = max(self.timeout, len(text) * 0.3)  # 0.3s per character for Fal.ai
+        return min(dynamic_timeout, 300)  # Cap at 5 minutes
+    
+    def _wait_for_result(self, handle, timeout: float) -> Dict[str, Any]:
+        """Result of a submitted request, raising TimeoutError if it is not done after timeout seconds"""
+        # handle.get() polls until the request completes with no limit, so wait for completion here first
+        deadline = time.monotonic() + timeout
+        while not isinstance(handle.status(), fal_client.Completed):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Fal.ai request timed out after {timeout:.0f}s")
+            time.sleep(_RESULT_POLL_INTERVAL)
+        return handle.get()
+    
+    def _build_arguments(self, text: str, voice: str) -> Dict[str, Any]:
+        """Build Fal.ai API parameters for a text chunk"""
+        return {
+            "text": text,
+            "voice": voice,
+            "temperature": config.tts_settings.get("temperature", 0.7),
+            "repetition_penalty": config.tts_settings.get("repetition_penalty", 1.2)
+        }
+    
+    def _download_audio(self, result: Dict[str, Any]) -> bytes:
+        """Download the audio file referenced by a Fal.ai result"""
+        # Check if result contains audio URL
+        if not result or 'audio' not in result:
+            raise Exception(f"Invalid response from Fal.ai API: {result}")
+        
+        audio_info = result['audio']
+        # Handle both string URL and dict response formats
+        if isinstance(audio_info, str):
+            audio_url = audio_info
+        elif isinstance(audio_info, dict) and 'url' in audio_info:
+            audio_url = audio_info['url']
+        else:
+            raise Exception(f"Unexpected audio format in response: {audio_info}")
+        
+        self.logger.debug(f"Audio URL received: {audio_url}")
+        
+        # Download the audio file
+        download_start = time.time()
+        audio_response = self.session.get(audio_url, timeout=60)
+        audio_response.raise_for_status()
+        
+        download_time = time.time() - download_start
+        self.logger.info(f"Audio download completed in {download_time:.1f}s")
+        self.logger.debug(f"Audio file size: {len(audio_response.content)} bytes")
+        
+        # Validate audio content
+        if len(audio_response.content) < 1000:  # Less than 1KB is suspicious
+            self.logger.warning(f"Small audio file received: {len(audio_response.content)} bytes")
+        
+        return audio_response.content
+    
+    def generate_audio_batch(self, texts: List[str], voice: str = None,
+                             submit_interval: float = 0) -> List[Union[bytes, Exception]]:
+        """Generate audio for several chunks in one provider round-trip
+        
+        Orpheus has no multi-text endpoint, so all requests are queued with
+        fal_client.submit before any result is awaited, letting the backend
+        work on them together. Submissions are spaced submit_interval seconds
+        apart so the caller's rate limiting still holds. Items that fail or
+        time out fall back to generate_audio and its retry handling; an item
+        that still fails is returned as its exception so only that chunk fails.
+        """
+        if any(not text.strip() for text in texts):
+            raise ValueError("Text cannot be empty")
+        
+        voice = voice or config.tts_settings.get("voice", "tara")
+        self.logger.info(f"Submitting batch of {len(texts)} chunks to Fal.ai")
+        
+        start_time = time.time()
+        handles = []
+        for n, text in enumerate(texts):
+            if n and submit_interval:
+                time.sleep(submit_interval)
+            try:
+                handles.append(fal_client.submit(self.model_id, arguments=self._build_arguments(text, voice)))
+            except Exception as e:
+                self.logger.warning(f"Batch submission failed: {e}")
+                handles.append(None)
+        
+        audio_chunks = []
+        for i, (text, handle) in enumerate(zip(texts, handles)):
+            try:
+                if handle is None:
+                    raise Exception("request was not submitted")
+                audio_chunks.append(self._download_audio(self._wait_for_result(handle, self._request_timeout(text))))
+            except Exception as e:
+                self.logger.warning(f"Batch item {i + 1}/{len(texts)} failed ({e}), retrying individually")
+                try:
+                    audio_chunks.append(self.generate_audio(text, voice))
+                except Exception as retry_error:
+                    self.logger.error(f"Batch item {i + 1}/{len(texts)} failed after retries: {retry_error}")
+                    audio_chunks.append(retry_error)
+        
+        self.logger.info(f"Batch of {len(texts)} chunks completed in {time.time() - start_time:.1f}s")
+        return audio_chunks
+    
     def batch_generate(self, text_chunks: List[str], voice: str = None) -> List[bytes]:
         """Generate audio for multiple text chunks"""
         self.logger.info(f"Starting batch generation for {len(text_chunks)} chunks")
@@ -158,6 +228,10 @@ class FalTTSClient:
         self.logger.info("Batch generation completed")
         return audio_chunks
     
+    def close(self):
+        """Close pooled download connections"""
+        self.session.close()
+    
     def test_connection(self) -> bool:
         """Test API connection with a simple request"""
         try:
@@ -0,0 +1,183 @@
+"""
+HTML diff pages comparing chunk text with its transcription
+
+Kept free of heavy imports so it can run in worker processes.
+"""
+import difflib
+import html
+import string
+from bisect import bisect_left
+from collections import Counter
+from pathlib import Path
+from typing import List, Dict, Any, Tuple, Union
+
+from ..utils.text_io import write_text
+
+# Custom CSS and summary block injected into every HTML diff page
+_DIFF_CSS = """
+        <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .diff_header { background-color: #f0f0f0; padding: 10px; border-radius: 5px; margin-bottom: 10px; }
+        .diff { line-height: 1.8; }
+        .diff_add { background-color: #aaffaa; }
+        .diff_chg { background-color: #ffff77; }
+        .diff_sub { background-color: #ffaaaa; }
+        .diff_skip { color: #888888; font-style: italic; }
+        .diff_chg del, .diff_sub { text-decoration: line-through; }
+        .diff_chg ins { text-decoration: none; font-weight: bold; }
+        .summary { background-color: #e8f4fd; padding: 15px; border-radius: 5px; margin: 10px 0; }
+        </style>
+        """
+
+_DIFF_SUMMARY_TEMPLATE = string.Template("""
+        <div class="summary">
+            <h3>Verification Summary - Chunk $chunk</h3>
+            <p><strong>Accuracy Score:</strong> $accuracy</p>
+            <p><strong>Word Error Rate:</strong> $wer</p>
+            <p><strong>Character Error Rate:</strong> $cer</p>
+            <p><strong>Missing Words:</strong> $missing</p>
+            <p><strong>Extra Words:</strong> $extra</p>
+            <p><strong>Status:</strong> $status</p>
+        </div>
+        """)
+
+def _unique_anchors(original_words: List[str], transcribed_words: List[str]) -> List[Tuple[int, int]]:
+    """Positions of words occurring exactly once in both texts, reduced to the longest in-order run"""
+    original_counts = Counter(original_words)
+    transcribed_counts = Counter(transcribed_words)
+    transcribed_pos = {word: j for j, word in enumerate(transcribed_words) if transcribed_counts[word] == 1}
+    pairs = [(i, transcribed_pos[word]) for i, word in enumerate(original_words)
+             if original_counts[word] == 1 and word in transcribed_pos]
+    
+    # Longest increasing subsequence of transcribed positions (patience sorting)
+    tails: List[int] = []
+    tail_values: List[int] = []
+    previous = [-1] * len(pairs)
+    for k, (_, j) in enumerate(pairs):
+        slot = bisect_left(tail_values, j)
+        if slot:
+            previous[k] = tails[slot - 1]
+        if slot == len(tails):
+            tails.append(k)
+            tail_values.append(j)
+        else:
+            tails[slot] = k
+            tail_values[slot] = j
+    
+    anchors = []
+    k = tails[-1] if tails else -1
+    while k >= 0:
+        anchors.append(pairs[k])
+        k = previous[k]
+    anchors.reverse()
+    return anchors
+
+def _word_opcodes(original_words: List[str], transcribed_words: List[str]) -> List[Tuple[str, int, int, int, int]]:
+    """SequenceMatcher opcodes computed separately between unique-word anchors"""
+    # Running Ratcliff-Obershelp over a whole chapter degrades badly when common words repeat;
+    # splitting at words unique to both sides keeps every matcher call small
+    opcodes = []
+    start_i = start_j = 0
+    end = (len(original_words), len(transcribed_words))
+    for anchor_i, anchor_j in _unique_anchors(original_words, transcribed_words) + [end]:
+        if start_i < anchor_i or start_j < anchor_j:
+            matcher = difflib.SequenceMatcher(a=original_words[start_i:anchor_i],
+                                              b=transcribed_words[start_j:anchor_j], autojunk=True)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                opcodes.append((tag, i1 + start_i, i2 + start_i, j1 + start_j, j2 + start_j))
+        if (anchor_i, anchor_j) != end:
+            opcodes.append(('equal', anchor_i, anchor_i + 1, anchor_j, anchor_j + 1))
+        start_i, start_j = anchor_i + 1, anchor_j + 1
+    
+    # Fold neighbouring equal runs (an anchor next to a matched segment) into one
+    merged = []
+    for opcode in opcodes:
+        if merged and opcode[0] == 'equal' and merged[-1][0] == 'equal':
+            previous_opcode = merged[-1]
+            merged[-1] = ('equal', previous_opcode[1], opcode[2], previous_opcode[3], opcode[4])
+        else:
+            merged.append(opcode)
+    return merged
+
+def render_word_diff(original_words: List[str], transcribed_words: List[str], context: int = 3) -> str:
+    """Render a word-level diff as inline spans, keeping `context` unchanged words around each edit"""
+    opcodes = _word_opcodes(original_words, transcribed_words)
+    if all(tag == 'equal' for tag, *_ in opcodes):
+        return '<p class="diff">No Differences Found</p>'
+
+    last = len(opcodes) - 1
+    parts = []
+    for index, (tag, i1, i2, j1, j2) in enumerate(opcodes):
+        if tag == 'equal':
+            words = original_words[i1:i2]
+            if 0 < index < last and len(words) <= 2 * context:
+                parts.append(html.escape(' '.join(words)))
+                continue
+            head = words[:context] if index > 0 else []
+            tail = words[-context:] if index < last else []
+            if head:
+                parts.append(html.escape(' '.join(head)))
+            skipped = len(words) - len(head) - len(tail)
+            if skipped > 0:
+                parts.append(f'<span class="diff_skip">[{skipped} matching words]</span>')
+            if tail:
+                parts.append(html.escape(' '.join(tail)))
+        elif tag == 'delete':
+            parts.append(f'<span class="diff_sub">{html.escape(" ".join(original_words[i1:i2]))}</span>')
+        elif tag == 'insert':
+            parts.append(f'<span class="diff_add">{html.escape(" ".join(transcribed_words[j1:j2]))}</span>')
+        else:
+            parts.append(
+                f'<span class="diff_chg"><del>{html.escape(" ".join(original_words[i1:i2]))}</del> '
+                f'<ins>{html.escape(" ".join(transcribed_words[j1:j2]))}</ins></span>'
+            )
+
+    return f'<p class="diff">{" ".join(parts)}</p>'
+
+def verification_scores(result) -> Dict[str, Any]:
+    """Summary numbers for the diff page from a VerificationResult or ComparisonResult"""
+    return {
+        'accuracy_score': result.accuracy_score,
+        'word_error_rate': result.word_error_rate,
+        'character_error_rate': result.character_error_rate,
+        'missing_words_count': len(result.missing_words),
+        'extra_words_count': len(result.extra_words),
+    }
+
+def write_html_diff(original_text: str, transcribed_text: str, diff_file: Union[str, Path],
+                    chunk_num: Union[int, str], scores: Dict[str, Any]) -> str:
+    """Write the diff page for one chunk and return its path
+
+    `scores` uses the keys of a chunk result's 'verification' dict (accuracy_score, word_error_rate,
+    character_error_rate, missing_words_count, extra_words_count).
+    """
+    # Split into words for better diff visualization
+    diff_body = render_word_diff(original_text.split(), transcribed_text.split())
+
+    # Add summary section
+    summary_html = _DIFF_SUMMARY_TEMPLATE.substitute(
+        chunk=chunk_num,
+        accuracy=f"{scores['accuracy_score']:.2%}",
+        wer=f"{scores['word_error_rate']:.2%}",
+        cer=f"{scores['character_error_rate']:.2%}",
+        missing=scores['missing_words_count'],
+        extra=scores['extra_words_count'],
+        status='✅ PASSED' if scores['accuracy_score'] >= 0.85 else '❌ FAILED'
+    )
+
+    legend = (
+        f'<div class="diff_header"><strong>Original Text (Chunk {chunk_num})</strong> vs '
+        f'<strong>Transcribed Audio (Chunk {chunk_num})</strong> - '
+        '<span class="diff_sub">missing</span> <span class="diff_add">extra</span> '
+        '<span class="diff_chg"><del>original</del> <ins>heard</ins></span></div>'
+    )
+    diff_html = (
+        '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+        f'<title>Chunk {chunk_num} Diff</title>{_DIFF_CSS}</head>\n'
+        f'<body>{summary_html}{legend}\n{diff_body}\n</body>\n</html>\n'
+    )
+
+    # Save the HTML diff file
+    write_text(diff_file, diff_html)
+
+    return str(diff_file)
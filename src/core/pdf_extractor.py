@@ -3,13 +3,36 @@
 PDF Extractor - Extract chapters from PDF books
 Handles chapter detection, text cleaning, and output generation
 """
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 import fitz  # PyMuPDF
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Iterable, Iterator
 import logging
 from dataclasses import dataclass
 
+# Blank-line runs and horizontal whitespace collapsed by _clean_content
+_BLANK_LINE_RUN_RE = re.compile(r'\n\s*\n\s*\n')
+_HORIZONTAL_SPACE_RE = re.compile(r'[ \t]+')
+
+# Text extraction is ~2ms a page, so a worker process only pays for its startup past this many pages
+_MIN_PAGES_PER_WORKER = 100
+
+
+def _page_lines(doc, page_num: int) -> Iterator[Tuple[str, int]]:
+    """Stripped, non-empty lines of one page with its 1-based page number"""
+    for line in doc[page_num].get_text().split('\n'):
+        line = line.strip()
+        if line:  # Skip empty lines
+            yield line, page_num + 1
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[Tuple[str, int]]:
+    """Lines of pages [start, stop), run in a worker process with its own document handle"""
+    with fitz.open(pdf_path) as doc:
+        return [item for page_num in range(start, stop) for item in _page_lines(doc, page_num)]
+
 @dataclass
 class ChapterInfo:
     """Information about an extracted chapter"""
@@ -42,6 +65,10 @@ class PDFExtractor:
         r'^\s*[ivx]+\s*$'  # Roman numerals with whitespace
     ]
     
+    # Each list as one alternation, so a line is tested with a single match() call
+    _CHAPTER_HEADER_RE = re.compile('|'.join(f'(?:{p})' for p in CHAPTER_PATTERNS), re.IGNORECASE)
+    _HEADER_FOOTER_RE = re.compile('|'.join(f'(?:{p})' for p in HEADER_FOOTER_PATTERNS), re.IGNORECASE)
+    
     def __init__(self, log_level: str = "INFO"):
         """Initialize PDF extractor"""
         self.logger = logging.getLogger(__name__)
@@ -71,7 +98,7 @@ class PDFExtractor:
             raise Exception(f"Failed to open PDF: {e}")
         
         # Extract all text with page info
-        full_text = self._extract_full_text(doc)
+        full_text = self._extract_full_text(doc, pdf_path)
         
         # Detect chapter breaks
         chapters = self._detect_chapters(full_text)
@@ -87,23 +114,36 @@ class PDFExtractor:
         self.logger.info(f"Extraction complete: {len(saved_chapters)} chapters extracted")
         return stats
     
-    def _extract_full_text(self, doc) -> List[Tuple[str, int]]:
-        """Extract text from all pages with page numbers"""
-        full_text = []
+    def _extract_full_text(self, doc, pdf_path: Path = None) -> Iterator[Tuple[str, int]]:
+        """Yield stripped, non-empty lines with their page numbers
         
-        for page_num in range(doc.page_count):
-            page = doc[page_num]
-            text = page.get_text()
-            
-            # Split into lines and add page info
-            lines = text.split('\n')
-            for line in lines:
-                if line.strip():  # Skip empty lines
-                    full_text.append((line.strip(), page_num + 1))
+        Large PDFs are split into page ranges extracted in parallel processes; otherwise
+        pages are read one at a time.
+        """
+        workers = min(os.cpu_count() or 1, doc.page_count // _MIN_PAGES_PER_WORKER)
+        if pdf_path is not None and workers > 1:
+            shard_size = -(-doc.page_count // workers)
+            starts = range(0, doc.page_count, shard_size)
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    shards = list(executor.map(
+                        _extract_page_range,
+                        [str(pdf_path)] * len(starts),
+                        starts,
+                        [min(start + shard_size, doc.page_count) for start in starts]
+                    ))
+            except (OSError, NotImplementedError) as e:
+                self.logger.warning(f"Parallel extraction unavailable ({e}), reading pages sequentially")
+            else:
+                self.logger.info(f"Extracted {doc.page_count} pages in {len(shards)} parallel shards")
+                for shard in shards:
+                    yield from shard
+                return
         
-        return full_text
+        for page_num in range(doc.page_count):
+            yield from _page_lines(doc, page_num)
     
-    def _detect_chapters(self, full_text: List[Tuple[str, int]]) -> List[ChapterInfo]:
+    def _detect_chapters(self, full_text: Iterable[Tuple[str, int]]) -> List[ChapterInfo]:
         """Detect chapter boundaries and extract content"""
         chapters = []
         current_chapter = None
@@ -149,32 +189,20 @@ class PDFExtractor:
     
     def _is_chapter_header(self, line: str) -> bool:
         """Check if line matches chapter header patterns"""
-        for pattern in self.CHAPTER_PATTERNS:
-            if re.match(pattern, line.strip(), re.IGNORECASE):
-                return True
-        return False
+        return self._CHAPTER_HEADER_RE.match(line.strip()) is not None
     
     def _is_header_footer(self, line: str) -> bool:
         """Check if line is header/footer that should be removed"""
-        for pattern in self.HEADER_FOOTER_PATTERNS:
-            if re.match(pattern, line.strip(), re.IGNORECASE):
-                return True
-        return False
+        return self._HEADER_FOOTER_RE.match(line.strip()) is not None
     
-    def _clean_content(self, content_lines: List[str]) -> str:
+    def _clean_content(self, content_lines: Iterable[str]) -> str:
         """Clean and format chapter content"""
-        # Filter out headers/footers
-        clean_lines = []
-        for line in content_lines:
-            if not self._is_header_footer(line):
-                clean_lines.append(line)
-        
-        # Join lines and clean up spacing
-        content = '\n'.join(clean_lines)
+        # Filter out headers/footers while joining, without an intermediate list
+        content = '\n'.join(line for line in content_lines if not self._is_header_footer(line))
         
         # Remove excessive whitespace
-        content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
-        content = re.sub(r'[ \t]+', ' ', content)
+        content = _BLANK_LINE_RUN_RE.sub('\n\n', content)
+        content = _HORIZONTAL_SPACE_RE.sub(' ', content)
         
         return content.strip()
     
@@ -1,12 +1,21 @@
 """
 Text processing for Book2Audible - Chapter detection and text cleaning
 """
+import mmap
+import os
 import re
 import nltk
+from functools import lru_cache
 from typing import List, Tuple, Dict, Optional, Union
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    from nltk.tokenize.punkt import PunktTokenizer
+except ImportError:
+    # NLTK < 3.8.2 ships the pickled model only
+    PunktTokenizer = None
+
 # Download required NLTK data
 try:
     nltk.data.find('tokenizers/punkt_tab')
@@ -18,6 +27,111 @@ try:
 except LookupError:
     nltk.download('punkt')
 
+@lru_cache(maxsize=None)
+def _sentence_tokenizer():
+    """Load the English Punkt model once per process rather than on every sent_tokenize call"""
+    if PunktTokenizer is None:
+        return nltk.data.load('tokenizers/punkt/english.pickle')
+    return PunktTokenizer('english')
+
+# Chapter/CHAPTER/Part/PART N, Ch. N, or a bare leading number - one alternation, matched once per line
+_CHAPTER_HEADING_RE = re.compile(
+    r'^(?:(?:chapter|part)\s+|ch\.\s*)(\d+)[\.\:\-\s]*(.*)$'
+    r'|^(\d+)[\.\:\-\s]+(.*)$',
+    re.IGNORECASE
+)
+_CHAPTER_HEADING_FIRST_CHARS = frozenset('CcPp')
+
+# Byte-level pre-filter for mapped files: lines whose first non-blank byte could start a heading.
+# Any non-ASCII lead byte is let through so Unicode whitespace and digits get the full str check.
+_CHAPTER_CANDIDATE_LINE_RE = re.compile(rb'^[ \t\r\f\v\x1c-\x1f]*[0-9CcPp\x80-\xff]', re.MULTILINE)
+
+# Smart quotes to plain quotes and en/em dashes to hyphens
+_QUOTE_DASH_REPLACEMENTS = (
+    ('\u201c', '"'), ('\u201d', '"'), ('\u201e', '"'), ('\u00ab', '"'), ('\u00bb', '"'),
+    ('\u2018', "'"), ('\u2019', "'"),
+    ('\u2013', '-'), ('\u2014', '-'),
+)
+
+_DISALLOWED_CHAR_RE = re.compile(r'[^\w\s.,!?;:()\'-]')
+
+
+class _StripDisallowedTable(dict):
+    """Translate table deleting characters that confuse TTS, filled lazily per code point"""
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        value = None if _DISALLOWED_CHAR_RE.match(chr(codepoint)) else codepoint
+        self[codepoint] = value
+        return value
+
+
+_STRIP_DISALLOWED_TABLE = _StripDisallowedTable()
+
+
+def _normalize_quotes_and_dashes(text: str) -> str:
+    """Map typographic quotes and dashes to ASCII (plain ASCII text is returned untouched)"""
+    if text.isascii():
+        return text
+    # str.replace is a C-level scan that returns the same object when nothing matches,
+    # which beats both a character-class re.sub and str.translate's per-character path
+    for char, replacement in _QUOTE_DASH_REPLACEMENTS:
+        text = text.replace(char, replacement)
+    return text
+
+
+def _strip_disallowed_chars(text: str) -> str:
+    """Delete characters outside the TTS-safe whitelist"""
+    # translate only has a fast path for ASCII input; the regex is quicker otherwise
+    if text.isascii():
+        return text.translate(_STRIP_DISALLOWED_TABLE)
+    return _DISALLOWED_CHAR_RE.sub('', text)
+
+
+# Remaining clean_text passes, compiled once at import
+_ELLIPSIS_RE = re.compile(r'\.{2,}')
+_SPACE_BEFORE_PUNCT_RE = re.compile(r'\s+([,.!?;:])')
+_SENTENCE_GAP_RE = re.compile(r'([.!?])\s*([A-Z])')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPACE_RUN_RE = re.compile(r' {2,}')
+_OPEN_PAREN_SPACE_RE = re.compile(r'\(\s+')
+_CLOSE_PAREN_SPACE_RE = re.compile(r'\s+\)')
+
+# Australian English specific terms to preserve
+_AU_SPELLINGS = {
+    'color': 'colour', 'favor': 'favour', 'honor': 'honour',
+    'labor': 'labour', 'organize': 'organise', 'recognize': 'recognise',
+    'realize': 'realise', 'analyze': 'analyse', 'center': 'centre',
+    'theater': 'theatre',
+}
+# The first-letter lookahead rejects most word starts before the alternation is tried branch by branch
+_AU_SPELLING_RE = re.compile(
+    r'\b(?=[' + ''.join(sorted({word[0] for word in _AU_SPELLINGS})) + r'])'
+    r'(' + '|'.join(map(re.escape, _AU_SPELLINGS)) + r')\b',
+    re.IGNORECASE
+)
+
+
+def _au_spelling_replacement(match: re.Match) -> str:
+    """Swap a US spelling for the AU one, keeping the capitalisation of the original word"""
+    word = match.group(1)
+    replacement = _AU_SPELLINGS[word.lower()]
+    if word.isupper():
+        return replacement.upper()
+    if word[0].isupper():
+        return replacement.capitalize()
+    return replacement
+
+def _iter_lines(text: str):
+    """Yield (offset, line) for each '\\n'-separated line, like text.split('\\n') without building the list"""
+    start = 0
+    while True:
+        end = text.find('\n', start)
+        if end < 0:
+            yield start, text[start:]
+            return
+        yield start, text[start:end]
+        start = end + 1
+
 @dataclass
 class Chapter:
     """Represents a book chapter"""
@@ -34,33 +148,17 @@ class TextProcessor:
     def __init__(self):
         import logging
         self.logger = logging.getLogger(__name__)
-        
-        self.chapter_patterns = [
-            r'^Chapter\s+(\d+)[\.\:\-\s]*(.*)$',
-            r'^CHAPTER\s+(\d+)[\.\:\-\s]*(.*)$',
-            r'^Ch\.\s*(\d+)[\.\:\-\s]*(.*)$',
-            r'^(\d+)[\.\:\-\s]+(.*)$',
-            r'^Part\s+(\d+)[\.\:\-\s]*(.*)$',
-            r'^PART\s+(\d+)[\.\:\-\s]*(.*)$',
-        ]
-        
-        # Australian English specific terms to preserve
-        self.au_spellings = {
-            'color': 'colour', 'favor': 'favour', 'honor': 'honour',
-            'labor': 'labour', 'organize': 'organise', 'recognize': 'recognise',
-            'realize': 'realise', 'analyze': 'analyse', 'center': 'centre',
-            'theater': 'theatre',
-        }
     
     def detect_chapters(self, text: str) -> List[Chapter]:
         """Detect chapters in the text"""
         chapters = []
-        lines = text.split('\n')
         current_chapter = None
         current_content = []
         
-        for i, line in enumerate(lines):
-            line = line.strip()
+        for line_start, raw_line in _iter_lines(text):
+            line = raw_line.strip()
+            # The separator before this line (0 for the first line), as positions have always been reported
+            boundary = line_start - 1 if line_start else 0
             
             # Check if line matches chapter pattern
             chapter_match = self._is_chapter_heading(line)
@@ -70,7 +168,7 @@ class TextProcessor:
                 if current_chapter:
                     chapter_content = '\n'.join(current_content).strip()
                     current_chapter.content = chapter_content
-                    current_chapter.end_position = len('\n'.join(lines[:i]))
+                    current_chapter.end_position = boundary
                     current_chapter.word_count = len(chapter_content.split())
                     chapters.append(current_chapter)
                 
@@ -79,7 +177,7 @@ class TextProcessor:
                     number=chapter_match[0],
                     title=chapter_match[1],
                     content="",
-                    start_position=len('\n'.join(lines[:i])),
+                    start_position=boundary,
                     end_position=0,
                     word_count=0
                 )
@@ -100,8 +198,7 @@ class TextProcessor:
         # If no chapters were detected, treat entire text as single chapter
         if not chapters and text.strip():
             # Use first line as title if available, otherwise use filename-based title
-            lines = text.strip().split('\n')
-            first_line = lines[0].strip() if lines else "Content"
+            first_line = text.strip().partition('\n')[0].strip()
             
             # If first line looks like a title (short and not ending with period), use it
             if len(first_line) < 100 and not first_line.endswith('.'):
@@ -124,47 +221,98 @@ class TextProcessor:
         
         return chapters
 
+    def detect_chapters_from_path(self, path: Union[str, Path]) -> List[Chapter]:
+        """Detect chapters in a UTF-8 text file without holding the whole book as a str
+
+        Gives the same chapters as detect_chapters(path.read_text('utf-8')).
+        """
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return self._detect_chapters_mapped(mm)
+
+    def _detect_chapters_mapped(self, mm: mmap.mmap) -> List[Chapter]:
+        """Find heading lines in the mapped bytes, then decode one chapter at a time"""
+        headings = []
+        for candidate in _CHAPTER_CANDIDATE_LINE_RE.finditer(mm):
+            line_start = candidate.start()
+            line_end = mm.find(b'\n', line_start)
+            if line_end < 0:
+                line_end = len(mm)
+            chapter_match = self._is_chapter_heading(mm[line_start:line_end].decode('utf-8').strip())
+            if chapter_match:
+                headings.append((line_start, chapter_match))
+        
+        if not headings:
+            # Single-chapter fallback needs the full text anyway
+            return self.detect_chapters(mm[:].decode('utf-8'))
+        
+        # Positions stay in characters, so keep a running count of decoded text
+        char_pos = len(mm[:headings[0][0]].decode('utf-8'))
+        next_starts = [line_start for line_start, _ in headings[1:]] + [len(mm)]
+        chapters = []
+        for (line_start, (number, title)), next_start in zip(headings, next_starts):
+            section = mm[line_start:next_start].decode('utf-8')
+            body = section.partition('\n')[2]
+            chapter_content = '\n'.join(line.strip() for line in body.split('\n')).strip()
+            boundary = char_pos - 1 if char_pos else 0
+            if chapters:
+                chapters[-1].end_position = boundary
+            chapters.append(Chapter(
+                number=number,
+                title=title,
+                content=chapter_content,
+                start_position=boundary,
+                end_position=0,
+                word_count=len(chapter_content.split())
+            ))
+            char_pos += len(section)
+        
+        chapters[-1].end_position = char_pos
+        return chapters
+
     def _is_chapter_heading(self, line: str) -> Optional[Tuple[int, str]]:
         """Check if line is a chapter heading"""
-        for pattern in self.chapter_patterns:
-            match = re.match(pattern, line, re.IGNORECASE)
-            if match:
-                try:
-                    chapter_num = int(match.group(1))
-                    title = match.group(2).strip() if len(match.groups()) > 1 else ""
-                    return (chapter_num, title)
-                except (ValueError, IndexError):
-                    continue
+        # Cheap reject for ordinary prose lines before touching the regex engine
+        if not line or not (line[0].isdigit() or line[0] in _CHAPTER_HEADING_FIRST_CHARS):
+            return None
+        
+        match = _CHAPTER_HEADING_RE.match(line)
+        if match:
+            if match.group(1) is not None:
+                return (int(match.group(1)), match.group(2).strip())
+            return (int(match.group(3)), match.group(4).strip())
         return None
     
     def clean_text(self, text: str) -> str:
         """Aggressively clean text for TTS processing to prevent hallucinations"""
         # Normalize quotes - replace smart quotes with regular quotes
-        text = re.sub(r'[""''„"«»]', '"', text)
-        
         # Normalize dashes - replace em-dashes and en-dashes with hyphens
-        text = re.sub(r'[–—]', '-', text)
+        text = _normalize_quotes_and_dashes(text)
         
         # Fix ellipsis - replace multiple dots with single period
-        text = re.sub(r'\.{2,}', '.', text)
+        text = _ELLIPSIS_RE.sub('.', text)
         
         # Remove orphaned punctuation and fix spacing
-        text = re.sub(r'\s+([,.!?;:])', r'\1', text)  # Remove space before punctuation
-        text = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', text)  # Ensure space after sentence end
+        text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)  # Remove space before punctuation
+        text = _SENTENCE_GAP_RE.sub(r'\1 \2', text)  # Ensure space after sentence end
         
         # Normalize whitespace - remove double spaces and normalize to single spaces
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Remove special characters that confuse TTS
-        text = re.sub(r'[^\w\s.,!?;:()\'-]', '', text)
+        text = _strip_disallowed_chars(text)
+        if '  ' in text:
+            # A character deleted from between two spaces leaves a double space behind
+            text = _SPACE_RUN_RE.sub(' ', text)
         
         # Fix common formatting issues
-        text = re.sub(r'\(\s+', '(', text)  # Fix "( text" to "(text"
-        text = re.sub(r'\s+\)', ')', text)  # Fix "text )" to "text)"
+        text = _OPEN_PAREN_SPACE_RE.sub('(', text)  # Fix "( text" to "(text"
+        text = _CLOSE_PAREN_SPACE_RE.sub(')', text)  # Fix "text )" to "text)"
         
         # Preserve Australian English spellings
-        for us_spelling, au_spelling in self.au_spellings.items():
-            text = re.sub(r'\b' + us_spelling + r'\b', au_spelling, text, flags=re.IGNORECASE)
+        text = _AU_SPELLING_RE.sub(_au_spelling_replacement, text)
         
         # Final cleanup
         text = text.strip()
@@ -175,31 +323,43 @@ class TextProcessor:
             
         return text
     
+    @staticmethod
+    def count_words(cleaned_text: str) -> int:
+        """Word count for clean_text/chunk_long_text output, which is single-space separated"""
+        # Equivalent to len(text.split()) for that text, without building the word list
+        return cleaned_text.count(' ') + 1 if cleaned_text else 0
+    
     def chunk_long_text(self, text: str, max_length: int = 150) -> List[str]:
         """Split text at sentence boundaries ONLY - never mid-sentence to prevent hallucinations"""
         if len(text) <= max_length:
             return [text]
         
-        sentences = nltk.sent_tokenize(text)
+        sentences = _sentence_tokenizer().tokenize(text)
         chunks = []
-        current_chunk = ""
+        # Sentences of the chunk being built and its joined length, joined only when flushed
+        current_chunk: List[str] = []
+        current_length = 0
         
-        for i, sentence in enumerate(sentences):
+        for sentence in sentences:
             # Always keep complete sentences together
             if not current_chunk:
                 # Starting new chunk
-                current_chunk = sentence
-            elif len(current_chunk + " " + sentence) <= max_length:
+                current_chunk = [sentence]
+                current_length = len(sentence)
+            elif current_length + 1 + len(sentence) <= max_length:
                 # Add sentence to current chunk
-                current_chunk += " " + sentence
+                current_chunk.append(sentence)
+                current_length += 1 + len(sentence)
             else:
                 # Current chunk is full, save it and start new one
-                chunks.append(current_chunk.strip())
-                current_chunk = sentence
+                chunks.append(" ".join(current_chunk).strip())
+                current_chunk = [sentence]
+                current_length = len(sentence)
         
         # Don't forget the last chunk
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+        last_chunk = " ".join(current_chunk).strip()
+        if last_chunk:
+            chunks.append(last_chunk)
         
         # If any single sentence is longer than max_length, keep it as its own chunk
         # (Don't split mid-sentence as this causes hallucinations)
@@ -224,21 +384,24 @@ class TextProcessor:
             if pattern in sentence:
                 parts = sentence.split(pattern)
                 chunks = []
-                current = ""
+                current: List[str] = []
+                current_length = 0
                 
                 for i, part in enumerate(parts):
                     # Restore the break pattern (except for last part)
                     restored_part = part + (pattern if i < len(parts) - 1 else "")
                     
-                    if len(current + restored_part) <= max_length:
-                        current += restored_part
+                    if current_length + len(restored_part) <= max_length:
+                        current.append(restored_part)
+                        current_length += len(restored_part)
                     else:
-                        if current:
-                            chunks.append(current.strip())
-                        current = restored_part
+                        if current_length:
+                            chunks.append("".join(current).strip())
+                        current = [restored_part]
+                        current_length = len(restored_part)
                 
-                if current:
-                    chunks.append(current.strip())
+                if current_length:
+                    chunks.append("".join(current).strip())
                 
                 # If we successfully split, return the chunks
                 if len(chunks) > 1:
@@ -247,17 +410,21 @@ class TextProcessor:
         # If no natural breakpoints, split by words as last resort
         words = sentence.split()
         chunks = []
-        current = ""
+        current = []
+        current_length = 0
         
         for word in words:
-            if len(current + word + " ") <= max_length:
-                current += word + " "
+            # Each word counts with its trailing space, as in "word word "
+            if current_length + len(word) + 1 <= max_length:
+                current.append(word)
+                current_length += len(word) + 1
             else:
                 if current:
-                    chunks.append(current.strip())
-                current = word + " "
+                    chunks.append(" ".join(current))
+                current = [word]
+                current_length = len(word) + 1
         
         if current:
-            chunks.append(current.strip())
+            chunks.append(" ".join(current))
         
         return chunks
@@ -0,0 +1,67 @@
+"""
+Persistent on-disk cache for synthesized TTS chunks
+"""
+import hashlib
+import json
+import logging
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+
+@lru_cache(maxsize=512)
+def _hash_key(text: str, params_json: str) -> str:
+    """Hash chunk text and serialized TTS parameters (memoized for repeats within a run)"""
+    return hashlib.sha256(text.encode('utf-8') + b'\0' + params_json.encode('utf-8')).hexdigest()
+
+
+class TTSCache:
+    """Stores generated WAV bytes keyed by chunk text, voice and model parameters"""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(text: str, voice: str, params: Dict[str, Any] = None) -> str:
+        """Build a cache key from chunk text, voice and any parameters affecting the audio"""
+        params_json = json.dumps({'voice': voice, **(params or {})}, sort_keys=True, default=str)
+        return _hash_key(text, params_json)
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.wav"
+
+    def __contains__(self, key: str) -> bool:
+        return self._path_for(key).exists()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached WAV bytes, or None on a miss"""
+        try:
+            with open(self._path_for(key), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except OSError as e:
+            self.logger.warning(f"Failed to read TTS cache entry {key[:12]}: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return data
+
+    def put(self, key: str, wav_bytes: bytes) -> None:
+        """Store WAV bytes atomically so a crash never leaves a truncated entry"""
+        path = self._path_for(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(wav_bytes)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write TTS cache entry {key[:12]}: {e}")
+            tmp_path.unlink(missing_ok=True)
@@ -1,16 +1,62 @@
 """
 Baseten TTS Client for Orpheus model integration
 """
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+import threading
 import time
 import json
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 import logging
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 from .config import config
 
+class _TokenBucket:
+    """Thread-safe token bucket: allows bursts up to capacity, refilled at refill_rate tokens per second"""
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: float = 1) -> None:
+        """Take tokens from the bucket, sleeping until enough have accumulated"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+                self.last_refill = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                sleep_needed = (tokens - self.tokens) / self.refill_rate
+            # Sleep outside the lock so other threads can refill and re-check
+            time.sleep(sleep_needed)
+    
+    async def acquire_async(self, tokens: float = 1) -> None:
+        """Like acquire, but yields to the event loop while waiting"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+                self.last_refill = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                sleep_needed = (tokens - self.tokens) / self.refill_rate
+            await asyncio.sleep(sleep_needed)
+
 class BaseTenTTSClient:
     """Client for Baseten Orpheus TTS API"""
     
@@ -21,33 +67,55 @@ class BaseTenTTSClient:
         self.timeout = config.baseten_config.get("timeout", 60)
         self.retry_attempts = config.baseten_config.get("retry_attempts", 3)
         self.rate_limit = config.baseten_config.get("rate_limit_per_minute", 60)
+        self.max_workers = config.baseten_config.get("max_concurrent", 4)
+        self.bucket = _TokenBucket(self.rate_limit, self.rate_limit / 60.0)
         
         self.logger = logging.getLogger(__name__)
         
         # Validate configuration
         if not self.api_key or self.api_key.startswith("${"):
             raise ValueError("Baseten API key not configured. Set BASETEN_API_KEY environment variable.")
-    
-    def generate_audio(self, text: str, voice: str = None) -> bytes:
-        """Generate audio for a single text chunk"""
-        if not text.strip():
-            raise ValueError("Text cannot be empty")
         
-        voice = voice or config.tts_settings.get("voice", "tara")
+        # One keep-alive connection pool for every chunk instead of a TLS handshake per request
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=max(16, self.rate_limit),
+                                                   max_retries=0))
+        self.session.headers.update({
+            "Authorization": f"Api-Key {self.api_key}",
+            "Content-Type": "application/json"
+        })
         
-        # Match exact Baseten API format with LLM generation parameters
-        payload = {
-            "voice": voice,
-            "prompt": text,
+        # aiohttp session for the async API, created inside the running loop on first use
+        self._async_session = None
+        self._async_loop = None
+        self._async_semaphore = None
+        self._async_shutdown = None
+        
+        # Set by shutdown() to cut every pending retry backoff short
+        self._shutdown = threading.Event()
+        
+        # Generation settings are fixed for the client's lifetime, so read them from config once
+        self._payload_template = {
+            "voice": config.tts_settings.get("voice", "tara"),
             "temperature": config.tts_settings.get("temperature", 0.7),
             "top_p": config.tts_settings.get("top_p", 0.9),
             "repetition_penalty": config.tts_settings.get("repetition_penalty", 1.1)
         }
+    
+    def _build_payload(self, text: str, voice: Optional[str] = None) -> Dict[str, Any]:
+        """Build the Baseten request body, matching its API format with LLM generation parameters"""
+        # A fresh dict per request, since worker threads build payloads concurrently
+        payload = {**self._payload_template, "prompt": text}
+        if voice:
+            payload["voice"] = voice
+        return payload
+    
+    def generate_audio(self, text: str, voice: str = None) -> bytes:
+        """Generate audio for a single text chunk"""
+        if not text.strip():
+            raise ValueError("Text cannot be empty")
         
-        headers = {
-            "Authorization": f"Api-Key {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        payload = self._build_payload(text, voice)
         
         for attempt in range(self.retry_attempts):
             try:
@@ -60,45 +128,23 @@ class BaseTenTTSClient:
                 
                 self.logger.debug(f"Using timeout: {dynamic_timeout}s for {len(text)} character text")
                 
-                response = requests.post(
+                # Shared across batch worker threads so the combined request rate stays in budget
+                self.bucket.acquire()
+                response = self.session.post(
                     self.base_url,
                     json=payload,
-                    headers=headers,
-                    timeout=dynamic_timeout
+                    timeout=dynamic_timeout,
+                    stream=True
                 )
                 
                 if response.status_code == 200:
-                    self.logger.info("Audio generation successful")
-                    self.logger.debug(f"Response content type: {response.headers.get('content-type', 'unknown')}")
-                    self.logger.debug(f"Response size: {len(response.content)} bytes")
-                    
-                    # Check if response is JSON (common with some APIs)
-                    content_type = response.headers.get('content-type', '').lower()
-                    if 'application/json' in content_type:
-                        try:
-                            json_response = response.json()
-                            self.logger.debug(f"JSON response keys: {list(json_response.keys()) if isinstance(json_response, dict) else 'not dict'}")
-                            # Handle different JSON response formats
-                            if isinstance(json_response, dict):
-                                if 'audio' in json_response:
-                                    # Base64 encoded audio
-                                    return base64.b64decode(json_response['audio'])
-                                elif 'url' in json_response:
-                                    # URL to audio file
-                                    audio_response = requests.get(json_response['url'])
-                                    return audio_response.content
-                                elif 'data' in json_response:
-                                    return json_response['data']
-                        except Exception as e:
-                            self.logger.warning(f"Failed to parse JSON response: {e}")
-                    
-                    self.logger.debug(f"First 16 bytes (hex): {response.content[:16].hex()}")
-                    return response.content
+                    return self._read_audio(response)
                 elif response.status_code == 429:
                     # Rate limit hit
                     wait_time = (2 ** attempt) * 5  # Exponential backoff
                     self.logger.warning(f"Rate limit hit. Waiting {wait_time} seconds...")
-                    time.sleep(wait_time)
+                    response.close()
+                    self._backoff(wait_time)
                 else:
                     self.logger.error(f"API error {response.status_code}: {response.text}")
                     if attempt == self.retry_attempts - 1:
@@ -112,7 +158,7 @@ class BaseTenTTSClient:
                 if attempt < self.retry_attempts - 1:
                     backoff_time = (2 ** attempt) + (attempt * 2)  # More aggressive backoff
                     self.logger.info(f"Retrying in {backoff_time} seconds...")
-                    time.sleep(backoff_time)
+                    self._backoff(backoff_time)
                 else:
                     self.logger.error(f"All retry attempts failed due to timeout. Text length: {len(text)} chars")
                     raise TimeoutError(f"TTS generation failed after {self.retry_attempts} attempts: {str(e)}")
@@ -129,36 +175,218 @@ class BaseTenTTSClient:
                 
                 if attempt < self.retry_attempts - 1:
                     self.logger.info(f"Retrying in {backoff_time} seconds...")
-                    time.sleep(backoff_time)
+                    self._backoff(backoff_time)
                 else:
                     self.logger.error(f"All retry attempts exhausted. Final error: {str(e)}")
                     raise
         
         raise Exception("All retry attempts failed")
     
+    def _backoff(self, seconds: float):
+        """Wait out a retry backoff against a monotonic deadline, raising if the client shuts down"""
+        deadline = time.monotonic() + seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if self._shutdown.wait(remaining):
+                raise RuntimeError("TTS client shut down during retry backoff")
+    
+    def _read_audio(self, response: requests.Response) -> bytes:
+        """Audio bytes from a successful response"""
+        self.logger.info("Audio generation successful")
+        # Diagnostics below format non-trivial values, so skip them outright at INFO
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        content_type = response.headers.get('content-type', '').lower()
+        if debug:
+            self.logger.debug(f"Response content type: {content_type or 'unknown'}")
+        
+        # Check if response is JSON (common with some APIs); audio/* bodies go straight to reading
+        if not content_type.startswith('audio/') and 'application/json' in content_type:
+            try:
+                json_response = response.json()
+                if debug:
+                    self.logger.debug(f"JSON response keys: {list(json_response.keys()) if isinstance(json_response, dict) else 'not dict'}")
+                # Handle different JSON response formats
+                if isinstance(json_response, dict):
+                    if 'audio' in json_response:
+                        # Base64 encoded audio
+                        return base64.b64decode(json_response['audio'])
+                    elif 'url' in json_response:
+                        # URL to audio file
+                        with self.session.get(json_response['url'], stream=True) as audio_response:
+                            return self._read_body(audio_response)
+                    elif 'data' in json_response:
+                        # Base64 encoded audio under the other common key
+                        return base64.b64decode(json_response['data'])
+            except Exception as e:
+                self.logger.warning(f"Failed to parse JSON response: {e}")
+        
+        audio_data = self._read_body(response)
+        if debug:
+            self.logger.debug(f"Response size: {len(audio_data)} bytes")
+            self.logger.debug(f"First 16 bytes (hex): {audio_data[:16].hex()}")
+        return audio_data
+    
+    @staticmethod
+    def _read_body(response: requests.Response) -> bytes:
+        """Read a streamed body in one allocation
+        
+        response.content joins 10KB reads, briefly holding the audio twice; with chunk_size=None
+        urllib3 returns the whole (Content-Length sized) body from a single read, and joining
+        one bytes object returns it without a copy.
+        """
+        return b''.join(response.iter_content(chunk_size=None))
+    
     def batch_generate(self, text_chunks: List[str], voice: str = None) -> List[bytes]:
         """Generate audio for multiple text chunks"""
-        self.logger.info(f"Starting batch generation for {len(text_chunks)} chunks")
-        audio_chunks = []
+        self.logger.info(f"Starting batch generation for {len(text_chunks)} chunks "
+                         f"({self.max_workers} concurrent requests)")
         
-        for i, text_chunk in enumerate(text_chunks):
+        def generate(indexed_chunk):
+            i, text_chunk = indexed_chunk
             self.logger.info(f"Processing chunk {i + 1}/{len(text_chunks)}")
-            audio_data = self.generate_audio(text_chunk, voice)
-            audio_chunks.append(audio_data)
-            
-            # Rate limiting
-            if i < len(text_chunks) - 1:  # Don't sleep after last chunk
-                sleep_time = 60 / self.rate_limit  # Respect rate limit
-                time.sleep(sleep_time)
+            return self.generate_audio(text_chunk, voice)
+        
+        # Requests are blocking I/O, so threads overlap them; map keeps results in chunk order
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            audio_chunks = list(executor.map(generate, enumerate(text_chunks)))
         
         self.logger.info("Batch generation completed")
         return audio_chunks
     
-    def test_connection(self) -> bool:
-        """Test API connection with a simple request"""
+    async def _get_async_session(self):
+        """aiohttp session bound to the running event loop (a session from another loop is unusable)"""
+        loop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_session.closed or self._async_loop is not loop:
+            self._async_loop = loop
+            self._async_semaphore = asyncio.Semaphore(self.max_workers)
+            # Mirrors _shutdown for coroutines on this loop, which cannot wait on a threading.Event
+            self._async_shutdown = asyncio.Event()
+            if self._shutdown.is_set():
+                self._async_shutdown.set()
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_workers, keepalive_timeout=60),
+                headers=dict(self.session.headers)
+            )
+        return self._async_session
+    
+    async def generate_audio_async(self, text: str, voice: str = None) -> bytes:
+        """Generate audio for a single text chunk without blocking the event loop"""
+        if aiohttp is None:
+            raise ImportError("aiohttp not installed. Run: pip install aiohttp")
+        if not text.strip():
+            raise ValueError("Text cannot be empty")
+        
+        payload = self._build_payload(text, voice)
+        dynamic_timeout = min(max(self.timeout, len(text) * 0.5), 300)
+        session = await self._get_async_session()
+        
+        for attempt in range(self.retry_attempts):
+            backoff_time = None
+            try:
+                self.logger.info(f"Generating audio for text chunk (attempt {attempt + 1}/{self.retry_attempts})")
+                async with self._async_semaphore:
+                    await self.bucket.acquire_async()
+                    async with session.post(self.base_url, json=payload,
+                                            timeout=aiohttp.ClientTimeout(total=dynamic_timeout)) as response:
+                        if response.status == 200:
+                            self.logger.info("Audio generation successful")
+                            if 'application/json' in response.content_type:
+                                try:
+                                    json_response = await response.json()
+                                    if isinstance(json_response, dict):
+                                        if 'audio' in json_response:
+                                            return base64.b64decode(json_response['audio'])
+                                        elif 'url' in json_response:
+                                            async with session.get(json_response['url']) as audio_response:
+                                                return await audio_response.read()
+                                        elif 'data' in json_response:
+                                            return base64.b64decode(json_response['data'])
+                                except Exception as e:
+                                    self.logger.warning(f"Failed to parse JSON response: {e}")
+                            return await response.read()
+                        elif response.status == 429:
+                            backoff_time = (2 ** attempt) * 5
+                            self.logger.warning(f"Rate limit hit. Waiting {backoff_time} seconds...")
+                        else:
+                            self.logger.error(f"API error {response.status}: {await response.text()}")
+                            if attempt == self.retry_attempts - 1:
+                                response.raise_for_status()
+            
+            except asyncio.TimeoutError as e:
+                self.logger.warning(f"Request timeout after {dynamic_timeout}s (attempt {attempt + 1}/{self.retry_attempts})")
+                if attempt == self.retry_attempts - 1:
+                    raise TimeoutError(f"TTS generation failed after {self.retry_attempts} attempts: {str(e)}")
+                backoff_time = (2 ** attempt) + (attempt * 2)
+            
+            except aiohttp.ClientError as e:
+                self.logger.error(f"Request failed: {e}")
+                if attempt == self.retry_attempts - 1:
+                    raise
+                backoff_time = (2 ** attempt) * 3 if isinstance(e, aiohttp.ClientConnectionError) else 2 ** attempt
+            
+            # Back off outside the semaphore so other chunks keep the connection slots busy
+            if backoff_time:
+                await self._backoff_async(backoff_time)
+        
+        raise Exception("All retry attempts failed")
+    
+    async def _backoff_async(self, seconds: float):
+        """Like _backoff, for the async API: wait out a retry backoff unless the client shuts down"""
+        try:
+            await asyncio.wait_for(self._async_shutdown.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            return
+        raise RuntimeError("TTS client shut down during retry backoff")
+    
+    async def batch_generate_async(self, text_chunks: List[str], voice: str = None) -> List[bytes]:
+        """Generate audio for multiple text chunks concurrently, results in chunk order"""
+        self.logger.info(f"Starting async batch generation for {len(text_chunks)} chunks "
+                         f"({self.max_workers} concurrent requests)")
+        audio_chunks = await asyncio.gather(*(self.generate_audio_async(text_chunk, voice)
+                                              for text_chunk in text_chunks))
+        self.logger.info("Batch generation completed")
+        return list(audio_chunks)
+    
+    async def aclose(self):
+        """Close the aiohttp session used by the async API"""
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+    
+    def shutdown(self):
+        """Abort retry backoffs in every thread and coroutine using this client; their requests raise RuntimeError"""
+        self._shutdown.set()
+        if self._async_shutdown is not None:
+            try:
+                self._async_loop.call_soon_threadsafe(self._async_shutdown.set)
+            except RuntimeError:
+                # The loop has already closed, so no coroutine is waiting on it
+                pass
+    
+    def close(self):
+        """Close pooled connections to the Baseten endpoint"""
+        self.shutdown()
+        self.session.close()
+    
+    def test_connection(self, deep: bool = False) -> bool:
+        """Test API connection with a cheap probe; deep=True synthesizes a short clip end to end"""
         try:
-            test_audio = self.generate_audio("Test connection.", "tara")
-            return len(test_audio) > 0
+            if deep:
+                test_audio = self.generate_audio("Test connection.", "tara")
+                return len(test_audio) > 0
+            
+            # Reaching the endpoint with an accepted key is enough; no model time or rate budget used
+            with self.session.head(self.base_url, timeout=5) as response:
+                status = response.status_code
+            if status == 405:
+                with self.session.get(self.base_url, headers={"Range": "bytes=0-0"}, timeout=5) as response:
+                    status = response.status_code
+            if status in (401, 403):
+                self.logger.error(f"Connection test failed: API key rejected ({status})")
+                return False
+            return status < 500
         except Exception as e:
             self.logger.error(f"Connection test failed: {e}")
             return False
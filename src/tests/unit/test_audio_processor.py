@@ -3,9 +3,24 @@ Unit tests for audio processor
 """
 import pytest
 import io
+import wave
+from pathlib import Path
 from unittest.mock import Mock, patch
 from src.core.audio_processor import AudioProcessor
 
+def _write_tone(path, amplitude, frames=4410):
+    """Write a short 16-bit stereo WAV with a constant-amplitude square wave"""
+    samples = b''.join(
+        (amplitude if (n // 50) % 2 else -amplitude).to_bytes(2, 'little', signed=True) * 2
+        for n in range(frames)
+    )
+    with wave.open(str(path), 'wb') as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(44100)
+        w.writeframes(samples)
+    return path
+
 class TestAudioProcessor:
     def setup_method(self):
         self.processor = AudioProcessor()
@@ -26,6 +41,16 @@ class TestAudioProcessor:
         
         assert result == b'fake_audio_data'
     
+    @patch('src.core.audio_processor.AudioSegment')
+    def test_stitch_reads_chunk_paths_from_disk(self, mock_audio_segment):
+        """Test that WAV paths are decoded from disk rather than passed as bytes"""
+        chunk_paths = [Path('chunk_001.wav'), Path('chunk_002.wav')]
+        
+        self.processor.stitch_audio_chunks(chunk_paths)
+        
+        mock_audio_segment.from_wav.assert_any_call('chunk_001.wav')
+        mock_audio_segment.from_wav.assert_any_call('chunk_002.wav')
+    
     def test_empty_chunks_raises_error(self):
         """Test that empty chunks list raises ValueError"""
         with pytest.raises(ValueError, match="No audio chunks provided"):
@@ -41,3 +66,15 @@ class TestAudioProcessor:
             result = self.processor._export_to_bytes(mock_audio)
             
         mock_audio.export.assert_called_once_with(mock_buffer, format="wav")
+    
+    def test_concatenate_wav_files_matches_in_memory_stitch(self, tmp_path):
+        """Test streaming concatenation produces the same audio as stitch_audio_chunks"""
+        chunk_paths = [_write_tone(tmp_path / f"chunk_{i}.wav", amp) for i, amp in enumerate((2000, 8000, 4000))]
+        output_path = tmp_path / "final.wav"
+        
+        self.processor.concatenate_wav_files(chunk_paths, output_path)
+        
+        with wave.open(io.BytesIO(self.processor.stitch_audio_chunks(chunk_paths))) as expected, \
+                wave.open(str(output_path)) as actual:
+            assert actual.getnframes() == expected.getnframes()
+            assert actual.readframes(actual.getnframes()) == expected.readframes(expected.getnframes())
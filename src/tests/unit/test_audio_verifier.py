@@ -0,0 +1,33 @@
+"""
+Unit tests for transcription comparison in the audio verifier
+"""
+import pytest
+from src.core import audio_verifier
+from src.core.audio_verifier import AudioVerifier
+
+class TestCompareTexts:
+    def setup_method(self):
+        self.verifier = AudioVerifier()
+    
+    @pytest.mark.parametrize("use_rapidfuzz", [True, False])
+    def test_word_errors_are_reported(self, monkeypatch, use_rapidfuzz):
+        """Test that missing/extra words and WER reflect a substitution and a deletion"""
+        if use_rapidfuzz and not audio_verifier.RAPIDFUZZ_AVAILABLE:
+            pytest.skip("rapidfuzz not installed")
+        monkeypatch.setattr(audio_verifier, "RAPIDFUZZ_AVAILABLE", use_rapidfuzz)
+        
+        result = self.verifier._compare_texts("The ship sailed on the blue sea.", "the ship sailed on blew sea")
+        
+        assert result.missing_words == ["the", "blue"]
+        assert result.extra_words == ["blew"]
+        assert result.word_error_rate == pytest.approx(2 / 7)
+        assert 0.8 < result.accuracy_score < 1.0
+    
+    def test_identical_text_after_normalisation(self):
+        """Test that case, punctuation and AU/US spelling differences are not errors"""
+        result = self.verifier._compare_texts("The Colour, of it!", "the color of it")
+        
+        assert result.accuracy_score == 1.0
+        assert result.word_error_rate == 0.0
+        assert result.missing_words == []
+        assert result.extra_words == []
@@ -0,0 +1,37 @@
+"""
+Unit tests for text file encoding detection
+"""
+import pytest
+from src.utils.file_handler import FileHandler, _ENCODING_SAMPLE_BYTES
+
+class TestFileHandler:
+    @pytest.fixture
+    def handler(self):
+        return FileHandler()
+
+    @pytest.mark.parametrize("encoding", ["utf-8-sig", "utf-16", "utf-32"])
+    def test_bom_decides_encoding(self, handler, tmp_path, encoding):
+        """Test that a byte-order mark is honoured and not left in the text"""
+        book = tmp_path / "book.txt"
+        book.write_bytes("Chapter 1\nCafé “quoted”.".encode(encoding))
+
+        assert handler.read_file(book) == "Chapter 1\nCafé “quoted”."
+
+    def test_non_ascii_after_ascii_sample(self, handler, tmp_path):
+        """Test that UTF-8 beyond the detection sample still decodes cleanly"""
+        text = "a" * _ENCODING_SAMPLE_BYTES + "\nNaïve café – done."
+        book = tmp_path / "book.txt"
+        book.write_bytes(text.encode('utf-8'))
+
+        assert handler.read_file(book) == text
+
+    def test_legacy_bytes_after_ascii_sample(self, handler, tmp_path):
+        """Test that cp1252 text beyond the detection sample is re-detected, not replaced"""
+        text = "a" * _ENCODING_SAMPLE_BYTES + "\nCafé naïve façade."
+        book = tmp_path / "book.txt"
+        book.write_bytes(text.encode('cp1252'))
+
+        content = handler.read_file(book)
+
+        assert "�" not in content
+        assert content.endswith("Café naïve façade.")
@@ -0,0 +1,19 @@
+"""
+Unit tests for the processor helpers
+"""
+from src.core.helpers import ProcessorHelpers
+
+class TestProcessorHelpers:
+    def test_coverage_counts_only_included_chunks(self):
+        """Test that excluded chunks are left out of the words and rejoined length"""
+        coverage = ProcessorHelpers.compute_coverage([10, 20, 30], [2, 4, 6], [True, False, True], 12)
+
+        assert coverage['covered_words'] == 8
+        assert coverage['reconstructed_length'] == 10 + 30 + 1
+        assert coverage['coverage_percentage'] == 8 / 12 * 100
+
+    def test_coverage_with_nothing_included(self):
+        """Test that an empty mask and an empty text give zero coverage"""
+        coverage = ProcessorHelpers.compute_coverage([10, 20], [2, 4], [False, False], 0)
+
+        assert coverage == {'covered_words': 0, 'coverage_percentage': 0, 'reconstructed_length': 0}
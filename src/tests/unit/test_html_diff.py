@@ -0,0 +1,40 @@
+"""
+Unit tests for the word-level HTML diff renderer
+"""
+from src.core.html_diff import render_word_diff, _word_opcodes
+
+class TestRenderWordDiff:
+    def test_identical_text(self):
+        """Test that identical word lists report no differences"""
+        words = "The quick brown fox.".split()
+        
+        assert "No Differences Found" in render_word_diff(words, words)
+    
+    def test_edits_are_marked_and_context_trimmed(self):
+        """Test that edits get spans and long unchanged runs are collapsed"""
+        original = "one two three four five six seven eight nine ten eleven <b>".split()
+        transcribed = "one two three four five six seven eight nine tin eleven".split()
+        
+        diff = render_word_diff(original, transcribed, context=3)
+        
+        assert '<span class="diff_chg"><del>ten</del> <ins>tin</ins></span>' in diff
+        assert '<span class="diff_sub">&lt;b&gt;</span>' in diff
+        assert '[6 matching words]' in diff
+        assert 'seven eight nine' in diff
+        assert 'one two' not in diff
+    
+    def test_anchored_opcodes_cover_both_texts(self):
+        """Test that opcodes from anchored segments tile both word lists in order"""
+        original = "the cat sat on the mat while the dog slept by the door".split()
+        transcribed = "the cat sat on a mat while the dog slept near the door today".split()
+        
+        opcodes = _word_opcodes(original, transcribed)
+        
+        position = (0, 0)
+        for tag, i1, i2, j1, j2 in opcodes:
+            assert (i1, j1) == position
+            if tag == 'equal':
+                assert original[i1:i2] == transcribed[j1:j2]
+            position = (i2, j2)
+        assert position == (len(original), len(transcribed))
+        assert [tag for tag, *_ in opcodes] == ['equal', 'replace', 'equal', 'replace', 'equal', 'insert']
@@ -2,6 +2,7 @@
 Unit tests for text processor
 """
 import pytest
+from src.core import text_processor
 from src.core.text_processor import TextProcessor, Chapter
 
 class TestTextProcessor:
@@ -66,3 +67,76 @@ class TestTextProcessor:
         assert "color" not in cleaned
         assert "prioritize" not in cleaned
         assert "center" not in cleaned
+    
+    def test_smart_quote_and_dash_normalisation(self):
+        """Test that typographic quotes and dashes become ASCII and apostrophes survive"""
+        text = "“I don’t know,” she said — quietly – and left… #"
+        
+        cleaned = self.processor.clean_text(text)
+        
+        assert "don't" in cleaned
+        assert "said - quietly - and" in cleaned
+        assert cleaned.isascii()
+        assert "#" not in cleaned
+    
+    def test_australian_spelling_keeps_case(self):
+        """Test that US to AU spelling swaps keep the original capitalisation"""
+        cleaned = self.processor.clean_text("Color theory. The THEATER is near the center")
+        
+        assert cleaned == "Colour theory. The THEATRE is near the centre."
+    
+    def test_chunk_packing_length_boundaries(self, monkeypatch):
+        """Test that whole sentences are packed up to max_length, with an over-long one kept intact"""
+        sentences = ["Aaaa.", "Bbbb.", "Cccc.", "Dddddddddddddddd.", "Ee."]
+        
+        class FixedTokenizer:
+            def tokenize(self, text):
+                return sentences
+        
+        # Sentence splitting itself is Punkt's job; this pins the packing around it
+        monkeypatch.setattr(text_processor, "_sentence_tokenizer", FixedTokenizer)
+        text = " ".join(sentences)
+        
+        assert self.processor.chunk_long_text(text, 11) == ["Aaaa. Bbbb.", "Cccc.", "Dddddddddddddddd.", "Ee."]
+        assert self.processor.chunk_long_text(text, 10) == ["Aaaa.", "Bbbb.", "Cccc.", "Dddddddddddddddd.", "Ee."]
+        assert self.processor.chunk_long_text(text, 17) == ["Aaaa. Bbbb. Cccc.", "Dddddddddddddddd.", "Ee."]
+    
+    def test_split_long_sentence_length_boundaries(self):
+        """Test that pieces are packed right up to max_length and no further"""
+        sentence = "aaaa, bbbb, cccc, dddd"
+        
+        assert self.processor._split_long_sentence(sentence, 12) == ["aaaa, bbbb,", "cccc, dddd"]
+        assert self.processor._split_long_sentence(sentence, 11) == ["aaaa,", "bbbb,", "cccc, dddd"]
+        
+        # Word fallback counts each word with its trailing space
+        assert self.processor._split_long_sentence("aaa bbb ccc ddd", 8) == ["aaa bbb", "ccc ddd"]
+        assert self.processor._split_long_sentence("aaa bbb ccc ddd", 7) == ["aaa", "bbb", "ccc", "ddd"]
+    
+    def test_cleaned_text_word_count(self):
+        """Test that stripped symbols leave single spaces and count_words matches split()"""
+        cleaned = self.processor.clean_text("Tom & Jerry # ran   home\n\nquickly")
+        
+        assert cleaned == "Tom Jerry ran home quickly."
+        assert TextProcessor.count_words(cleaned) == len(cleaned.split()) == 5
+        assert TextProcessor.count_words("") == 0
+    
+    def test_chapter_heading_first_char_gate(self):
+        """Test that the first-character pre-check rejects prose but keeps every heading form"""
+        assert self.processor._is_chapter_heading("Chapter 3: The Return") == (3, "The Return")
+        assert self.processor._is_chapter_heading("PART 2") == (2, "")
+        assert self.processor._is_chapter_heading("ch. 7 - Aftermath") == (7, "Aftermath")
+        assert self.processor._is_chapter_heading("12. Twelve") == (12, "Twelve")
+        assert self.processor._is_chapter_heading("٣ Arabic-Indic digit") == (3, "Arabic-Indic digit")
+        
+        assert self.processor._is_chapter_heading("") is None
+        assert self.processor._is_chapter_heading("the chapter 3 ended") is None
+        assert self.processor._is_chapter_heading("Character 5 spoke") is None
+        assert self.processor._is_chapter_heading("“Chapter 1” was quoted") is None
+    
+    def test_detect_chapters_from_path_matches_str(self, tmp_path):
+        """Mapped-file detection gives the same chapters and character positions"""
+        text = "Préface\n\nChapter 1: Début\nIt’s here.\r\n　Part 2\nMore text\n3. Three\n"
+        book = tmp_path / "book.txt"
+        book.write_bytes(text.encode('utf-8'))
+        
+        assert self.processor.detect_chapters_from_path(book) == self.processor.detect_chapters(text)
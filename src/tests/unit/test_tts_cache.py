@@ -0,0 +1,29 @@
+"""
+Unit tests for the TTS chunk cache
+"""
+import pytest
+from src.core.tts_cache import TTSCache
+
+class TestTTSCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return TTSCache(tmp_path / ".tts_cache")
+
+    def test_miss_then_hit(self, cache):
+        """Test that stored audio is returned for the same key"""
+        key = TTSCache.make_key("Chapter One.", "tara", {'temperature': 0.7})
+
+        assert cache.get(key) is None
+        cache.put(key, b'RIFF_fake_wav')
+
+        assert cache.get(key) == b'RIFF_fake_wav'
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_key_depends_on_voice_and_params(self):
+        """Test that changing voice or parameters changes the key"""
+        base = TTSCache.make_key("Same text.", "tara", {'temperature': 0.7})
+
+        assert base == TTSCache.make_key("Same text.", "tara", {'temperature': 0.7})
+        assert base != TTSCache.make_key("Same text.", "leo", {'temperature': 0.7})
+        assert base != TTSCache.make_key("Same text.", "tara", {'temperature': 0.9})
@@ -0,0 +1,108 @@
+"""
+Unit tests for the Baseten TTS client rate limiter, retry backoff and batch generation
+"""
+import asyncio
+import logging
+import threading
+import pytest
+from src.core import tts_client
+from src.core.tts_client import _TokenBucket, BaseTenTTSClient
+
+class TestTokenBucket:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Fake monotonic clock advanced only by time.sleep"""
+        now = [100.0]
+        monkeypatch.setattr(tts_client.time, 'monotonic', lambda: now[0])
+        monkeypatch.setattr(tts_client.time, 'sleep', lambda seconds: now.__setitem__(0, now[0] + seconds))
+        return now
+
+    def test_burst_up_to_capacity_without_waiting(self, clock):
+        """Test that a full bucket lets capacity calls through immediately"""
+        bucket = _TokenBucket(3, 1.0)
+
+        for _ in range(3):
+            bucket.acquire()
+
+        assert clock[0] == 100.0
+
+    def test_waits_for_refill_when_empty(self, clock):
+        """Test that an empty bucket sleeps just long enough for one token"""
+        bucket = _TokenBucket(2, 0.5)
+        bucket.acquire()
+        bucket.acquire()
+
+        bucket.acquire()
+
+        assert clock[0] == pytest.approx(102.0)
+        assert bucket.tokens == pytest.approx(0.0)
+
+    def test_refill_is_capped_at_capacity(self, clock):
+        """Test that idle time never banks more than capacity tokens"""
+        bucket = _TokenBucket(2, 1.0)
+        bucket.acquire()
+        clock[0] += 60
+
+        for _ in range(2):
+            bucket.acquire()
+
+        assert clock[0] == 160.0
+        assert bucket.tokens == pytest.approx(0.0)
+
+
+class TestRetryBackoff:
+    @pytest.fixture
+    def client(self):
+        """Client with only the shutdown events set up"""
+        client = BaseTenTTSClient.__new__(BaseTenTTSClient)
+        client._shutdown = threading.Event()
+        client._async_shutdown = None
+        return client
+
+    def test_backoff_waits_until_deadline(self, client):
+        """Test that an uninterrupted backoff returns after its delay"""
+        start = tts_client.time.monotonic()
+        client._backoff(0.05)
+
+        assert tts_client.time.monotonic() - start >= 0.05
+
+    def test_shutdown_interrupts_backoff(self, client):
+        """Test that shutdown() wakes a thread waiting out a long backoff"""
+        threading.Timer(0.05, client.shutdown).start()
+        start = tts_client.time.monotonic()
+
+        with pytest.raises(RuntimeError):
+            client._backoff(30)
+
+        assert tts_client.time.monotonic() - start < 5
+
+    def test_shutdown_interrupts_async_backoff(self, client):
+        """Test that shutdown() from another thread wakes a coroutine waiting out a long backoff"""
+        async def back_off():
+            client._async_loop = asyncio.get_running_loop()
+            client._async_shutdown = asyncio.Event()
+            threading.Timer(0.05, client.shutdown).start()
+            await client._backoff_async(30)
+
+        start = tts_client.time.monotonic()
+        with pytest.raises(RuntimeError):
+            asyncio.run(back_off())
+
+        assert tts_client.time.monotonic() - start < 5
+
+
+class TestBatchGenerate:
+    @pytest.fixture
+    def client(self):
+        """Client with generate_audio echoing the text, no network or config needed"""
+        client = BaseTenTTSClient.__new__(BaseTenTTSClient)
+        client.max_workers = 2
+        client.logger = logging.getLogger(__name__)
+        client.generate_audio = lambda text, voice=None: text.encode()
+        return client
+
+    def test_batch_generate_keeps_chunk_order(self, client):
+        """Test that results come back in input order whatever order workers finish in"""
+        chunks = [f"chunk {i}" for i in range(20)]
+
+        assert client.batch_generate(chunks) == [chunk.encode() for chunk in chunks]
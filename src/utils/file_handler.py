@@ -1,18 +1,35 @@
 """
 File handling utilities for Book2Audible
 """
+import codecs
 import chardet
 from pathlib import Path
 from typing import Union, Tuple
 import logging
 from docx import Document
 
+# Encoding detection looks at this much of the file rather than all of it
+_ENCODING_SAMPLE_BYTES = 64 * 1024
+# Fed to the detector in slices so it can stop as soon as it is confident
+_ENCODING_FEED_BYTES = 8 * 1024
+
+# Checked in order - the UTF-32 LE mark starts with the UTF-16 LE one
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
 class FileHandler:
     """Handles reading various file formats and encoding detection"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.supported_formats = ['.txt', '.docx']
+        # Reused for every text file read by this handler
+        self._detector = chardet.UniversalDetector()
     
     def read_file(self, file_path: Union[str, Path]) -> str:
         """Read text content from file, auto-detecting format and encoding"""
@@ -37,39 +54,64 @@ class FileHandler:
     
     def _read_text_file(self, file_path: Path) -> str:
         """Read text file with encoding detection"""
-        # Detect encoding
-        with open(file_path, 'rb') as f:
-            raw_data = f.read()
-        
-        encoding_result = chardet.detect(raw_data)
-        encoding = encoding_result['encoding'] or 'utf-8'
-        confidence = encoding_result['confidence']
-        
-        self.logger.debug(f"Detected encoding: {encoding} (confidence: {confidence:.2f})")
+        encoding = self._detect_encoding(file_path)
         
         # Read with detected encoding
         try:
             with open(file_path, 'r', encoding=encoding) as f:
                 content = f.read()
         except UnicodeDecodeError:
-            # Fallback to utf-8 with error handling
-            self.logger.warning(f"Failed to decode with {encoding}, falling back to utf-8")
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+            # The sample missed legacy bytes further in, so let the detector see the whole file
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            full_encoding = self._detect_bytes(raw, stop_early=False)
+            try:
+                content = raw.decode(full_encoding)
+                self.logger.warning(f"Failed to decode with {encoding}, re-detected {full_encoding} from the full file")
+            except (UnicodeDecodeError, LookupError):
+                # Fallback to utf-8 with error handling
+                self.logger.warning(f"Failed to decode with {encoding} or {full_encoding}, falling back to utf-8")
+                content = raw.decode('utf-8', errors='replace')
         
         return content
     
+    def _detect_encoding(self, file_path: Path) -> str:
+        """Detect a text file's encoding from its byte-order mark or a sample of its start"""
+        with open(file_path, 'rb') as f:
+            head = f.read(_ENCODING_SAMPLE_BYTES)
+        
+        for bom, bom_encoding in _BOM_ENCODINGS:
+            if head.startswith(bom):
+                self.logger.debug(f"Detected encoding from BOM: {bom_encoding}")
+                return bom_encoding
+        
+        return self._detect_bytes(head)
+    
+    def _detect_bytes(self, data: bytes, stop_early: bool = True) -> str:
+        """Run the charset detector over data, optionally stopping once it is confident"""
+        self._detector.reset()
+        for offset in range(0, len(data), _ENCODING_FEED_BYTES):
+            self._detector.feed(data[offset:offset + _ENCODING_FEED_BYTES])
+            if stop_early and self._detector.done:
+                break
+        encoding_result = self._detector.close()
+        encoding = encoding_result['encoding'] or 'utf-8'
+        confidence = encoding_result['confidence']
+        self.logger.debug(f"Detected encoding: {encoding} (confidence: {confidence:.2f})")
+        
+        # An ASCII sample says nothing about later bytes; UTF-8 reads the same text and more
+        if encoding.lower() == 'ascii':
+            return 'utf-8'
+        return encoding
+    
     def _read_docx_file(self, file_path: Path) -> str:
         """Read DOCX file content"""
         try:
             doc = Document(file_path)
-            paragraphs = []
-            
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    paragraphs.append(paragraph.text)
             
-            content = '\n'.join(paragraphs)
+            # paragraph.text is rebuilt from the XML runs on every access, so read it once each
+            paragraph_texts = (paragraph.text for paragraph in doc.paragraphs)
+            content = '\n'.join(text for text in paragraph_texts if text.strip())
             self.logger.info(f"Successfully read DOCX file: {len(content)} characters")
             return content
             
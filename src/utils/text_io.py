@@ -0,0 +1,21 @@
+"""
+Small-file text output for Book2Audible - one open/write/close per file
+"""
+import os
+from pathlib import Path
+from typing import Union
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0)
+
+
+def write_text(path: Union[str, Path], text: str) -> None:
+    """Write text to path as UTF-8 with one unbuffered write, replacing any existing file"""
+    data = text.encode('utf-8')
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
@@ -5,6 +5,7 @@ Start just the FastAPI backend for testing
 import subprocess
 import sys
 import os
+from importlib.metadata import distribution, PackageNotFoundError
 from pathlib import Path
 
 def check_dependencies():
@@ -12,10 +13,11 @@ def check_dependencies():
     required_packages = ['fastapi', 'uvicorn', 'websockets', 'pydantic']
     missing = []
     
+    # Installed-package metadata is enough here; importing fastapi etc. would cost hundreds of ms
     for package in required_packages:
         try:
-            __import__(package)
-        except ImportError:
+            distribution(package)
+        except PackageNotFoundError:
             missing.append(package)
     
     if missing:
@@ -12,13 +12,15 @@ async def main():
     print("Testing local development servers...")
     
     try:
-        # Test backend API
-        print("Taking screenshot of backend at http://localhost:8000...")
-        await tester.take_screenshot("http://localhost:8000", "backend_test")
-        
-        # Test frontend
-        print("Taking screenshot of frontend at http://localhost:3001...")
-        await tester.take_screenshot("http://localhost:3001", "frontend_test")
+        # One browser for both screenshots
+        async with tester:
+            # Test backend API
+            print("Taking screenshot of backend at http://localhost:8000...")
+            await tester.take_screenshot("http://localhost:8000", "backend_test")
+            
+            # Test frontend
+            print("Taking screenshot of frontend at http://localhost:3001...")
+            await tester.take_screenshot("http://localhost:3001", "frontend_test")
         
         print("Local server screenshots completed!")
         
@@ -2,9 +2,11 @@
 """
 Test script for the synchronized audio player features
 Tests database schema, API endpoints, and basic functionality
+
+Run directly, or in parallel under pytest-xdist: pytest -n auto test_sync_player.py
 """
 import sys
-import os
+import re
 from pathlib import Path
 
 # Add src to path
@@ -12,63 +14,102 @@ sys.path.append(str(Path(__file__).parent / "src"))
 
 from src.core.chunk_database import ChunkDatabase
 from src.core.enhanced_fal_tts_client import EnhancedFalTTSClient
+import importlib
 import json
-import tempfile
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+# Progress lines are INFO, so they cost nothing unless a handler asks for them (pytest --log-level=INFO)
+log = logging.getLogger(__name__)
+
+EXPECTED_TABLES = frozenset({'projects', 'chapters', 'chunks', 'audio_versions', 'word_timings', 'chapter_words'})
+EXPECTED_CHUNK_COLUMNS = frozenset({'orpheus_temperature', 'orpheus_voice', 'orpheus_speed', 'sequence_in_chapter'})
+EXPECTED_ENDPOINTS = (
+    '/api/chapters/{chapter_id}/audio-sync-data',
+    '/api/chapters/{chapter_id}/stitched-audio',
+    '/api/chunks/{chunk_id}/orpheus-params',
+    '/api/chapters/{chapter_id}/word-timings',
+)
+# Path parameters and slashes, stripped from both sides so routes match however parameters are named
+_PATH_NOISE_RE = re.compile(r'\{[^}]*\}|/')
+_COLUMN_DEF_RE = re.compile(r'\b(\w+)\s+(?:INTEGER|REAL|TEXT|BOOLEAN)\b')
+
+
+@pytest.fixture(scope="module")
+def db():
+    """One in-memory ChunkDatabase shared by the module, so its schema is created once"""
+    # Every ChunkDatabase method commits on its own connection, so tests stay independent
+    # by each creating their own project rather than rolling back
+    return ChunkDatabase(":memory:")
+
+
+def _make_enhanced_client(mp):
+    """Build an EnhancedFalTTSClient with its missing dependencies mocked through mp"""
+    # Mock fal_client if not available
+    mp.setitem(sys.modules, 'fal_client', MagicMock())
+
+    # Mock config if needed
+    if 'src.core.config' not in sys.modules:
+        mock_config = MagicMock()
+        mock_config.config.fal_config = {"api_key": "test", "timeout": 120}
+        mp.setitem(sys.modules, 'src.core.config', mock_config)
+
+    return EnhancedFalTTSClient()
 
 
-def test_database_schema():
+@pytest.fixture(scope="session")
+def enhanced_client():
+    """One EnhancedFalTTSClient per session; the helpers under test are pure"""
+    with pytest.MonkeyPatch.context() as mp:
+        yield _make_enhanced_client(mp)
+
+
+@pytest.fixture(scope="session")
+def web_api_module():
+    """web_api imported once, so FastAPI route registration is paid once per session"""
+    return importlib.import_module('web_api')
+
+
+def test_database_schema(db):
     """Test that the database schema includes new tables and columns"""
-    print("🔍 Testing database schema...")
-    
-    # Create temporary database
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
-        db_path = tmp.name
-    
-    try:
-        db = ChunkDatabase(Path(db_path))
-        
-        # Test that new tables exist
-        import sqlite3
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0] for row in cursor.fetchall()]
-            
-            expected_tables = ['projects', 'chapters', 'chunks', 'audio_versions', 'word_timings', 'chapter_words']
-            missing_tables = [t for t in expected_tables if t not in tables]
-            
-            if missing_tables:
-                print(f"❌ Missing tables: {missing_tables}")
-                return False
-            
-            # Test that chunks table has new columns
-            cursor = conn.execute("PRAGMA table_info(chunks)")
-            columns = [row[1] for row in cursor.fetchall()]
-            
-            expected_columns = ['orpheus_temperature', 'orpheus_voice', 'orpheus_speed', 'sequence_in_chapter']
-            missing_columns = [c for c in expected_columns if c not in columns]
-            
-            if missing_columns:
-                print(f"❌ Missing columns in chunks table: {missing_columns}")
-                return False
-        
-        print("✅ Database schema is correct")
-        return True
-        
-    finally:
-        # Cleanup
-        os.unlink(db_path)
-
-
-def test_audio_version_tracking():
+    log.info("Testing database schema")
+
+    # One sqlite_master read covers both checks: table names, and the chunks DDL
+    # (ALTER TABLE migrations are written back into it too)
+    schemas = db.table_schemas()
+    tables = set(schemas)
+
+    # Test that new tables exist
+    missing_tables = EXPECTED_TABLES - tables
+
+    assert not missing_tables, f"Missing tables: {missing_tables}"
+
+    # Test that chunks table has new columns
+    columns = set(_COLUMN_DEF_RE.findall(schemas['chunks']))
+
+    missing_columns = EXPECTED_CHUNK_COLUMNS - columns
+
+    assert not missing_columns, f"Missing columns in chunks table: {missing_columns}"
+
+    log.info("Database schema is correct")
+
+
+def _assert_indexed(db, sql, params):
+    """Fail unless SQLite plans sql as an index search rather than a full table scan"""
+    with db._connection() as conn:
+        plan = conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+    assert any("USING INDEX" in step[3] for step in plan), plan
+    assert not any(step[3].startswith("SCAN") for step in plan), plan
+
+
+def test_audio_version_tracking(db):
     """Test audio version tracking functionality"""
-    print("🔍 Testing audio version tracking...")
-    
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
-        db_path = tmp.name
-    
-    try:
-        db = ChunkDatabase(Path(db_path))
-        
+    log.info("Testing audio version tracking")
+
+    # Setup writes, committed together
+    with db.transaction():
         # Create test project and chapter
         project_id = db.create_project("Test Book", "test.txt")
         chapter_id = db.create_chapter(
@@ -79,7 +120,7 @@ def test_audio_version_tracking():
             cleaned_text="Hello world. This is a test.",
             chunks_directory="/tmp/test"
         )
-        
+
         # Create test chunk
         chunk_id = db.create_chunk(
             chapter_id=chapter_id,
@@ -90,61 +131,54 @@ def test_audio_version_tracking():
             cleaned_text="Hello world. This is a test.",
             text_file_path="/tmp/test_chunk.txt"
         )
-        
+
         # Test creating audio versions
         orpheus_params1 = {"voice": "tara", "temperature": 0.7, "speed": 1.0}
-        version_id1 = db.create_audio_version(chunk_id, "/tmp/audio_v1.wav", orpheus_params1)
-        
         orpheus_params2 = {"voice": "tara", "temperature": 0.5, "speed": 1.2}
-        version_id2 = db.create_audio_version(chunk_id, "/tmp/audio_v2.wav", orpheus_params2)
-        
-        # Test getting versions
-        versions = db.get_audio_versions(chunk_id)
-        if len(versions) != 2:
-            print(f"❌ Expected 2 versions, got {len(versions)}")
-            return False
-        
-        # Test active version
-        active_version = db.get_active_audio_version(chunk_id)
-        if not active_version or active_version['version_number'] != 2:
-            print(f"❌ Expected active version 2, got {active_version}")
-            return False
-        
-        # Test word timings
-        word_timings = [
-            {"word": "Hello", "start": 0.0, "end": 0.5, "word_index": 0},
-            {"word": "world", "start": 0.5, "end": 1.0, "word_index": 1},
-            {"word": "This", "start": 1.5, "end": 1.8, "word_index": 2},
-            {"word": "is", "start": 1.8, "end": 2.0, "word_index": 3},
-            {"word": "a", "start": 2.0, "end": 2.1, "word_index": 4},
-            {"word": "test", "start": 2.1, "end": 2.5, "word_index": 5}
-        ]
-        
-        db.store_word_timings(version_id2, word_timings)
-        
-        # Test retrieving word timings
-        retrieved_timings = db.get_word_timings(version_id2)
-        if len(retrieved_timings) != 6:
-            print(f"❌ Expected 6 word timings, got {len(retrieved_timings)}")
-            return False
-        
-        print("✅ Audio version tracking works correctly")
-        return True
-        
-    finally:
-        os.unlink(db_path)
-
-
-def test_chunk_database_methods():
+        version_id1, version_id2 = db.create_audio_versions(chunk_id, [
+            ("/tmp/audio_v1.wav", orpheus_params1),
+            ("/tmp/audio_v2.wav", orpheus_params2),
+        ])
+
+    # Test getting versions
+    versions = db.get_audio_versions(chunk_id)
+    assert len(versions) == 2, f"Expected 2 versions, got {len(versions)}"
+
+    # Test active version
+    active_version_number = db.get_active_version_number(chunk_id)
+    assert active_version_number == 2, f"Expected active version 2, got {active_version_number}"
+
+    # Test word timings
+    word_timings = [
+        {"word": "Hello", "start": 0.0, "end": 0.5, "word_index": 0},
+        {"word": "world", "start": 0.5, "end": 1.0, "word_index": 1},
+        {"word": "This", "start": 1.5, "end": 1.8, "word_index": 2},
+        {"word": "is", "start": 1.8, "end": 2.0, "word_index": 3},
+        {"word": "a", "start": 2.0, "end": 2.1, "word_index": 4},
+        {"word": "test", "start": 2.1, "end": 2.5, "word_index": 5}
+    ]
+
+    db.store_word_timings(version_id2, word_timings)
+
+    # Test retrieving word timings
+    retrieved_timings = db.get_word_timings(version_id2)
+    assert len(retrieved_timings) == 6, f"Expected 6 word timings, got {len(retrieved_timings)}"
+
+    # The player fetches timings per version on every page load, so this must stay an index search
+    _assert_indexed(db, """
+        SELECT word_index, word_text, start_time, end_time, confidence, character_start, character_end
+        FROM word_timings WHERE audio_version_id = ? ORDER BY word_index
+    """, (version_id2,))
+
+    log.info("Audio version tracking works correctly")
+
+
+def test_chunk_database_methods(db):
     """Test new chunk database methods"""
-    print("🔍 Testing chunk database methods...")
-    
-    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as tmp:
-        db_path = tmp.name
-    
-    try:
-        db = ChunkDatabase(Path(db_path))
-        
+    log.info("Testing chunk database methods")
+
+    # Setup writes, committed together
+    with db.transaction():
         # Create test data
         project_id = db.create_project("Test Book", "test.txt")
         chapter_id = db.create_chapter(
@@ -155,7 +189,7 @@ def test_chunk_database_methods():
             cleaned_text="Hello world. This is a test sentence.",
             chunks_directory="/tmp/test"
         )
-        
+
         chunk_id = db.create_chunk(
             chapter_id=chapter_id,
             chunk_number=1,
@@ -165,172 +199,120 @@ def test_chunk_database_methods():
             cleaned_text="Hello world. This is a test sentence.",
             text_file_path="/tmp/test_chunk.txt"
         )
-        
-        # Test updating Orpheus parameters
-        db.update_chunk_orpheus_params(chunk_id, temperature=0.8, voice="dan", speed=1.1)
-        
-        chunk = db.get_chunk(chunk_id)
-        if not hasattr(chunk, 'orpheus_temperature') or chunk.orpheus_temperature != 0.8:
-            print("❌ Orpheus parameters not updated correctly")
-            return False
-        
-        # Test chapter words storage
-        words_data = [
-            {"word_index": 0, "word": "Hello", "chunk_id": chunk_id, "char_start": 0, "char_end": 5, "audio_start_time": 0.0, "audio_end_time": 0.5},
-            {"word_index": 1, "word": "world", "chunk_id": chunk_id, "char_start": 6, "char_end": 11, "audio_start_time": 0.5, "audio_end_time": 1.0},
-            {"word_index": 2, "word": "This", "chunk_id": chunk_id, "char_start": 13, "char_end": 17, "audio_start_time": 1.5, "audio_end_time": 1.8}
-        ]
-        
-        db.store_chapter_words(chapter_id, words_data)
-        
-        # Test retrieving chapter words
-        chapter_words = db.get_chapter_words(chapter_id)
-        if len(chapter_words) != 3:
-            print(f"❌ Expected 3 chapter words, got {len(chapter_words)}")
-            return False
-        
-        print("✅ Chunk database methods work correctly")
-        return True
-        
-    finally:
-        os.unlink(db_path)
-
-
-def test_api_endpoints():
+
+    # Test updating Orpheus parameters
+    db.update_chunk_orpheus_params(chunk_id, temperature=0.8, voice="dan", speed=1.1)
+
+    chunk = db.get_chunk(chunk_id)
+    assert chunk.orpheus_temperature == 0.8, "Orpheus parameters not updated correctly"
+    assert db.get_chunks_by_chapter(chapter_id)[0].orpheus_voice == "dan", \
+        "Chapter chunk listing dropped Orpheus parameters"
+
+    # Test chapter words storage
+    words_data = [
+        {"word_index": 0, "word": "Hello", "chunk_id": chunk_id, "char_start": 0, "char_end": 5, "audio_start_time": 0.0, "audio_end_time": 0.5},
+        {"word_index": 1, "word": "world", "chunk_id": chunk_id, "char_start": 6, "char_end": 11, "audio_start_time": 0.5, "audio_end_time": 1.0},
+        {"word_index": 2, "word": "This", "chunk_id": chunk_id, "char_start": 13, "char_end": 17, "audio_start_time": 1.5, "audio_end_time": 1.8}
+    ]
+
+    db.store_chapter_words(chapter_id, words_data)
+
+    # Test retrieving chapter words
+    chapter_words = db.get_chapter_words(chapter_id)
+    assert len(chapter_words) == 3, f"Expected 3 chapter words, got {len(chapter_words)}"
+
+    _assert_indexed(db, """
+        SELECT word_index, word_text, chunk_id, char_start, char_end, audio_start_time, audio_end_time
+        FROM chapter_words WHERE chapter_id = ? ORDER BY word_index
+    """, (chapter_id,))
+
+    log.info("Chunk database methods work correctly")
+
+
+def test_transaction_rolls_back(db):
+    """Test that a failing transaction() block leaves none of its writes behind"""
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            project_id = db.create_project("Rolled Back Book", "rolled_back.txt")
+            db.create_chapter(project_id, 1, "Gone", "text", "text", "/tmp/test")
+            raise RuntimeError("abort")
+
+    assert db.find_project_by_file("rolled_back.txt") is None
+
+
+def test_api_endpoints(web_api_module):
     """Test that API endpoints are properly defined"""
-    print("🔍 Testing API endpoint definitions...")
-    
-    try:
-        # Import web_api to check if endpoints are defined
-        import web_api
-        
-        # Check if the new endpoints exist
-        app = web_api.app
-        
-        # Get all route paths
-        routes = []
-        for route in app.routes:
-            if hasattr(route, 'path'):
-                routes.append(route.path)
-        
-        print(f"Found {len(routes)} routes")  # Debug info
-        
-        expected_endpoints = [
-            '/api/chapters/{chapter_id}/audio-sync-data',
-            '/api/chapters/{chapter_id}/stitched-audio', 
-            '/api/chunks/{chunk_id}/orpheus-params',
-            '/api/chapters/{chapter_id}/word-timings',
-        ]
-        
-        missing_endpoints = []
-        for endpoint in expected_endpoints:
-            # More flexible matching
-            pattern = endpoint.replace('{chapter_id}', '').replace('{chunk_id}', '')
-            base_pattern = pattern.replace('//', '/')  # Clean up any double slashes
-            
-            found = False
-            for route in routes:
-                if base_pattern.replace('/', '') in route.replace('/', ''):
-                    found = True
-                    break
-            
-            if not found:
-                missing_endpoints.append(endpoint)
-        
-        if missing_endpoints:
-            print(f"❌ Missing API endpoints: {missing_endpoints}")
-            print(f"Available routes: {routes[:10]}...")  # Show first 10 routes for debugging
-            return False
-        
-        print("✅ API endpoints are properly defined")
-        return True
-        
-    except ImportError as e:
-        print(f"❌ Failed to import web_api: {e}")
-        return False
-
-
-def test_enhanced_tts_client():
+    log.info("Testing API endpoint definitions")
+
+    # Check if the new endpoints exist
+    routes = web_api_module.APP_ROUTE_PATHS
+
+    log.debug("Found %d routes", len(routes))
+
+    # More flexible matching
+    normalized_routes = {_PATH_NOISE_RE.sub('', route) for route in routes}
+    missing_endpoints = [endpoint for endpoint in EXPECTED_ENDPOINTS
+                         if _PATH_NOISE_RE.sub('', endpoint) not in normalized_routes]
+
+    # Show first 10 routes for debugging
+    assert not missing_endpoints, \
+        f"Missing API endpoints: {missing_endpoints}. Available routes: {list(routes[:10])}..."
+
+    log.info("API endpoints are properly defined")
+
+
+def test_enhanced_tts_client(enhanced_client):
     """Test enhanced TTS client (without actually calling APIs)"""
-    print("🔍 Testing enhanced TTS client...")
-    
-    try:
-        # Test that enhanced client can be imported and initialized
-        # Mock the missing dependencies first
-        import sys
-        from unittest.mock import MagicMock
-        
-        # Mock fal_client if not available
-        sys.modules['fal_client'] = MagicMock()
-        
-        # Mock config if needed
-        if 'src.core.config' not in sys.modules:
-            mock_config = MagicMock()
-            mock_config.config.fal_config = {"api_key": "test", "timeout": 120}
-            sys.modules['src.core.config'] = mock_config
-        
-        client = EnhancedFalTTSClient()
-        
-        # Test tokenization
-        text = "Hello world. This is a test sentence."
-        words = client.tokenize_text(text)
-        
-        if len(words) < 6:  # Should have at least Hello, world, This, is, a, test, sentence
-            print(f"❌ Tokenization failed, got {len(words)} words")
-            return False
-        
-        # Test word matching
-        if not client.words_match("hello", "Hello"):
-            print("❌ Word matching failed for case difference")
-            return False
-        
-        if not client.words_match("test", "test"):
-            print("❌ Word matching failed for exact match")
-            return False
-        
-        print("✅ Enhanced TTS client works correctly")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Enhanced TTS client failed: {e}")
-        return False
+    log.info("Testing enhanced TTS client")
+    client = enhanced_client
+
+    # Test tokenization
+    text = "Hello world. This is a test sentence."
+    words = client.tokenize_text(text)
+
+    # Should have at least Hello, world, This, is, a, test, sentence
+    assert len(words) >= 6, f"Tokenization failed, got {len(words)} words"
+    assert words[1] == {'word': 'world', 'start_pos': 6, 'end_pos': 11}, "Punctuation leaked into word tokens"
+
+    # Test word matching
+    assert client.words_match("hello", "Hello"), "Word matching failed for case difference"
+    assert client.words_match("test", "test"), "Word matching failed for exact match"
+    assert client.words_match("test.", "TEST"), "Word matching failed for trailing punctuation"
+
+    log.info("Enhanced TTS client works correctly")
 
 
 def main():
     """Run all tests"""
-    print("🚀 Starting synchronized audio player tests...\n")
-    
-    tests = [
-        test_database_schema,
-        test_audio_version_tracking,
-        test_chunk_database_methods,
-        test_enhanced_tts_client,
-        test_api_endpoints,
-    ]
-    
     passed = 0
     failed = 0
-    
-    for test in tests:
-        try:
-            if test():
+
+    with pytest.MonkeyPatch.context() as mp:
+        db = ChunkDatabase(":memory:")
+
+        # Arguments are built inside the try below, so a failing setup counts against its test
+        tests = [
+            (test_database_schema, lambda: (db,)),
+            (test_audio_version_tracking, lambda: (db,)),
+            (test_chunk_database_methods, lambda: (db,)),
+            (test_enhanced_tts_client, lambda: (_make_enhanced_client(mp),)),
+            (test_api_endpoints, lambda: (importlib.import_module('web_api'),)),
+        ]
+
+        for test, make_args in tests:
+            try:
+                test(*make_args())
                 passed += 1
-            else:
+            except AssertionError as e:
+                log.error("%s failed: %s", test.__name__, e)
                 failed += 1
-        except Exception as e:
-            print(f"❌ Test {test.__name__} crashed: {e}")
-            failed += 1
-        print()
-    
+            except Exception as e:
+                log.error("%s crashed: %s", test.__name__, e)
+                failed += 1
+
     print(f"📊 Test Results: {passed} passed, {failed} failed")
-    
-    if failed == 0:
-        print("🎉 All tests passed! Synchronized audio player is ready.")
-        return 0
-    else:
-        print("⚠️  Some tests failed. Please check the implementation.")
-        return 1
+    return 0 if failed == 0 else 1
 
 
 if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+    exit(main())
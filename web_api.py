@@ -8,19 +8,24 @@ import os
 import sys
 import uuid
 import asyncio
-import json
+import codecs
+import concurrent.futures
+import functools
+import hashlib
+import html
+import string
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 import shutil
 import tempfile
+import time
 import logging
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks
+from fastapi import FastAPI, File, UploadFile, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, HTMLResponse
-from fastapi.websockets import WebSocketState
+from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse
 from pydantic import BaseModel
 import uvicorn
 
@@ -30,8 +35,22 @@ sys.path.append(str(Path(__file__).parent / "src"))
 from src.core.processor import Book2AudioProcessor
 from src.core.config import config
 from src.utils.logger import setup_logger
+from src.utils.json_utils import read_json, write_json
+from src.utils.file_handler import FileHandler
 import re
 
+# Optional Redis client for sharing job state across uvicorn workers
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+# Optional libmagic binding for sniffing upload content; a built-in check covers TXT and DOCX without it
+try:
+    import magic
+except ImportError:
+    magic = None
+
 # Optional chunk management imports (safe fallback)
 try:
     from src.core.enhanced_processor import EnhancedBook2AudioProcessor
@@ -74,9 +93,62 @@ class ChapterInfo(BaseModel):
     verification_passed: bool = False
     duration_ms: int = 0
 
-# Global job storage (in production, use Redis or database)
+# Uploads and viewed report files move through memory in blocks, never whole
+_IO_BLOCK_SIZE = 1 << 16
+_UPLOAD_COPY_SIZE = 1 << 20
+
+# Upload format is decided from this much of the content
+_SNIFF_BYTES = 4096
+_ZIP_SIGNATURE = b'PK\x03\x04'
+_DOCX_MIME_TYPES = frozenset({
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'application/zip',  # libmagic may only see the ZIP container in the first few KB
+})
+_MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # 10MB
+
+# Uploads wait here, one directory per job, until their conversion starts
+_TMP_ROOT = Path(tempfile.gettempdir()) / "book2audible"
+_TMP_ROOT.mkdir(parents=True, exist_ok=True)
+
+# Conversions run here so process_book never blocks the event loop
+CONVERSION_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.environ.get("B2A_CONVERSION_WORKERS", "4")),
+    thread_name_prefix="conversion"
+)
+
+# WebSocket sends awaited together per broadcast batch
+BROADCAST_BATCH_SIZE = 50
+MAX_SUBSCRIBERS_PER_JOB = 200
+
+# Progress updates per job are coalesced to at most one broadcast per interval (10 Hz)
+BROADCAST_INTERVAL = 0.1
+_TERMINAL_STATUSES = frozenset({"completed", "failed"})
+
+# Processor log lines that move a job's progress bar
+_CHAPTERS_FOUND_RE = re.compile(r'Found (\d+) chapters\b')
+_CHAPTER_SPLIT_RE = re.compile(r'Chapter \d+ split into \d+ chunks\b')
+_CHUNK_RE = re.compile(r'✅ Chunk (\d+)/(\d+) completed\b.*?(\d+\.\d+)%')
+
+# Completed-job responses carry an ETag and must be revalidated; they are not immutable, since a
+# resumed run rewrites the log and /api/download adds a ZIP to the output directory
+_COMPLETED_CACHE_CONTROL = "public, no-cache"
+
+# Opening body tag of a report page viewed through /view-file, attributes included
+_BODY_TAG_RE = re.compile(rb'<body\b[^>]*>', re.IGNORECASE)
+
+# Global job storage; with B2A_REDIS_URL set, every update is also stored and published in Redis
+# so status polls and WebSocket subscribers on other workers see jobs this worker runs
 active_jobs: Dict[str, ConversionStatus] = {}
-job_websockets: Dict[str, List[WebSocket]] = {}
+job_websockets: Dict[str, Set[WebSocket]] = {}
+_last_broadcast: Dict[str, float] = {}
+_pending_broadcasts: Dict[str, asyncio.Task] = {}
+
+REDIS_URL = os.environ.get("B2A_REDIS_URL")
+_REDIS_JOB_KEY = "book2audible:job:"
+_REDIS_JOB_CHANNEL = "book2audible:job_channel:"
+_REDIS_JOB_TTL = 7 * 24 * 3600  # seconds
+_redis_client = None
+_redis_listener: Optional[asyncio.Task] = None
 
 app = FastAPI(
     title="Book2Audible Web API",
@@ -96,6 +168,9 @@ app.add_middleware(
 # Setup logging
 logger = setup_logger("WebAPI", config.log_file, "INFO")
 
+if REDIS_URL and aioredis is None:
+    logger.warning("B2A_REDIS_URL is set but redis is not installed; job state stays in this process")
+
 # Serve static files (generated audio files)
 app.mount("/static", StaticFiles(directory="data/output"), name="static")
 
@@ -142,6 +217,76 @@ async def get_providers():
         ]
     }
 
+class _UploadReader:
+    """Read side of an upload copy: enforces the size limit and counts UTF-8 text as blocks pass through"""
+    
+    def __init__(self, raw, count_text: bool):
+        self.raw = raw
+        self.decoder = codecs.getincrementaldecoder('utf-8')() if count_text else None
+        self.size = 0
+        self.char_count = 0
+        self.word_count = 0
+        self.in_word = False
+    
+    def read(self, size: int = -1) -> bytes:
+        block = self.raw.read(size)
+        self.size += len(block)
+        if self.size > _MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail="File too large. Maximum size: 10MB")
+        if self.decoder is not None:
+            # An empty block is EOF, where a truncated UTF-8 sequence must raise
+            self._count(self.decoder.decode(block, final=not block))
+        return block
+    
+    def _count(self, text: str):
+        words = text.split()
+        self.char_count += len(text)
+        self.word_count += len(words)
+        if words and self.in_word and not text[0].isspace():
+            self.word_count -= 1  # continues the previous block's last word
+        if text:
+            self.in_word = not text[-1].isspace()
+
+def _sniff_upload(head: bytes) -> Optional[str]:
+    """'.txt' or '.docx' for what an upload's first bytes contain, or None if it is neither"""
+    if not head:
+        return '.txt'
+    if magic is not None:
+        mime = magic.from_buffer(head, mime=True)
+        if mime in _DOCX_MIME_TYPES:
+            return '.docx'
+        return '.txt' if mime.startswith('text/') else None
+    
+    if head.startswith(_ZIP_SIGNATURE):
+        return '.docx'
+    try:
+        # Incremental so a character cut off at the end of the sample is not an error
+        codecs.getincrementaldecoder('utf-8')().decode(head)
+    except UnicodeDecodeError:
+        return None
+    return '.txt' if b'\0' not in head else None
+
+def _docx_text_counts(file_path: Path) -> Tuple[int, int]:
+    """Character and word counts of a DOCX file's text, as the processor will read it"""
+    text = FileHandler().read_file(file_path)
+    return len(text), len(text.split())
+
+def _save_upload(reader: _UploadReader, file_path: Path):
+    """Copy an upload to file_path in large blocks; runs on a worker thread"""
+    with open(file_path, 'wb') as f:
+        shutil.copyfileobj(reader, f, _UPLOAD_COPY_SIZE)
+
+@functools.lru_cache(maxsize=4096)
+def _upload_dir(job_id: str) -> Path:
+    """Temp directory for a job's upload; 404 unless job_id is a canonical UUID, so it cannot escape _TMP_ROOT"""
+    try:
+        valid = str(uuid.UUID(job_id)) == job_id
+    except ValueError:
+        valid = False
+    if not valid:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return _TMP_ROOT / job_id
+
 @app.post("/api/upload")
 async def upload_file(file: UploadFile = File(...)):
     """Upload and validate book file"""
@@ -156,34 +301,39 @@ async def upload_file(file: UploadFile = File(...)):
             detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
         )
     
-    # Check file size (10MB limit)
-    content = await file.read()
-    if len(content) > 10 * 1024 * 1024:  # 10MB
-        raise HTTPException(status_code=400, detail="File too large. Maximum size: 10MB")
+    # Trust the content over the name: a renamed file is stored under the extension it really has
+    head = file.file.read(_SNIFF_BYTES)
+    file.file.seek(0)
+    file_kind = _sniff_upload(head)
+    if file_kind is None:
+        raise HTTPException(status_code=400, detail="File content is neither plain text nor a DOCX document")
     
     # Create unique job ID and temp directory
     job_id = str(uuid.uuid4())
-    temp_dir = Path(tempfile.gettempdir()) / "book2audible" / job_id
-    temp_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Save uploaded file
-    file_path = temp_dir / file.filename
-    with open(file_path, 'wb') as f:
-        f.write(content)
+    temp_dir = _upload_dir(job_id)
+    temp_dir.mkdir(exist_ok=True)
     
-    # Basic file validation (try to read it)
+    # Stream the upload to disk, counting text as it passes (10MB limit); keep only the
+    # filename's last component so it cannot point outside the job directory
+    file_path = temp_dir / (Path(file.filename).stem + file_kind)
+    reader = _UploadReader(file.file, count_text=file_kind == '.txt')
     try:
-        if file_extension == '.txt':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text_content = f.read()
+        # One hop to a worker thread for the whole copy, rather than one await per block
+        await asyncio.to_thread(_save_upload, reader, file_path)
+        
+        file_size = reader.size
+        if file_kind == '.txt':
+            char_count = reader.char_count
+            word_count = reader.word_count
         else:  # .docx
-            # Let the processor handle docx files
-            text_content = "DOCX file uploaded successfully"
+            # Read once now so the upload page shows real counts; also rejects broken documents
+            char_count, word_count = await asyncio.to_thread(_docx_text_counts, file_path)
             
-        word_count = len(text_content.split())
-        char_count = len(text_content)
-        
+    except HTTPException:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
     except Exception as e:
+        shutil.rmtree(temp_dir, ignore_errors=True)
         raise HTTPException(status_code=400, detail=f"Failed to read file: {str(e)}")
     
     logger.info(f"File uploaded: {file.filename} ({char_count} chars, {word_count} words)")
@@ -192,7 +342,7 @@ async def upload_file(file: UploadFile = File(...)):
     upload_metadata = {
         "job_id": job_id,
         "filename": file.filename,
-        "file_size": len(content),
+        "file_size": file_size,
         "character_count": char_count,
         "word_count": word_count,
         "estimated_cost_fal": round((char_count / 1000) * 0.05, 2),
@@ -201,8 +351,7 @@ async def upload_file(file: UploadFile = File(...)):
     
     # Save metadata to file for persistence
     metadata_file = temp_dir / "upload_metadata.json"
-    with open(metadata_file, 'w') as f:
-        json.dump(upload_metadata, f, indent=2)
+    await asyncio.to_thread(write_json, upload_metadata, metadata_file)
     
     return upload_metadata
 
@@ -210,51 +359,14 @@ async def upload_file(file: UploadFile = File(...)):
 async def get_upload_info(job_id: str):
     """Get upload information for a job"""
     
-    # Try to find upload metadata
-    temp_dir = Path(tempfile.gettempdir()) / "book2audible" / job_id
-    metadata_file = temp_dir / "upload_metadata.json"
-    
-    if metadata_file.exists():
-        try:
-            with open(metadata_file, 'r') as f:
-                upload_data = json.load(f)
-            return upload_data
-        except Exception as e:
-            logger.error(f"Failed to read upload metadata for {job_id}: {e}")
-    
-    # If metadata file doesn't exist, try to get info from temp directory
-    if temp_dir.exists():
-        uploaded_files = list(temp_dir.glob("*"))
-        if uploaded_files:
-            # Find the uploaded file (not metadata)
-            uploaded_file = None
-            for file_path in uploaded_files:
-                if file_path.name != "upload_metadata.json":
-                    uploaded_file = file_path
-                    break
-            
-            if uploaded_file:
-                try:
-                    file_size = uploaded_file.stat().st_size
-                    
-                    # Try to read content for character/word count
-                    with open(uploaded_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    char_count = len(content)
-                    word_count = len(content.split())
-                    
-                    return {
-                        "job_id": job_id,
-                        "filename": uploaded_file.name,
-                        "file_size": file_size,
-                        "character_count": char_count,
-                        "word_count": word_count,
-                        "estimated_cost_fal": round((char_count / 1000) * 0.05, 2),
-                        "upload_time": None
-                    }
-                except Exception as e:
-                    logger.error(f"Failed to analyze uploaded file for {job_id}: {e}")
+    # upload_file records the counts it took while streaming the file, so the upload is never re-read here
+    metadata_file = _upload_dir(job_id) / "upload_metadata.json"
+    try:
+        return await asyncio.to_thread(read_json, metadata_file)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error(f"Failed to read upload metadata for {job_id}: {e}")
     
     raise HTTPException(status_code=404, detail="Upload information not found")
 
@@ -263,7 +375,7 @@ async def start_conversion(job_id: str, request: ConversionRequest, background_t
     """Start book conversion process"""
     
     # Find uploaded file
-    temp_dir = Path(tempfile.gettempdir()) / "book2audible" / job_id
+    temp_dir = _upload_dir(job_id)
     if not temp_dir.exists():
         raise HTTPException(status_code=404, detail="Job not found")
     
@@ -288,6 +400,8 @@ async def start_conversion(job_id: str, request: ConversionRequest, background_t
         start_time=datetime.now()
     )
     active_jobs[job_id] = job_status
+    # Store the pending status in Redis before returning, so other workers know the job from the first poll
+    await broadcast_job_update(job_id)
     
     # Start processing in background
     background_tasks.add_task(
@@ -321,22 +435,63 @@ async def process_book_background(
         # Initialize enhanced processor with chunk tracking
         processor = EnhancedBook2AudioProcessor("INFO", provider, enable_chunk_tracking=True)
         
-        # Simple logger that doesn't interfere with threading
+        # Logger that hands progress lines to one consumer task on the event loop; the processor
+        # may call it from another thread, so lines cross over with call_soon_threadsafe
         class WebProgressLogger:
             def __init__(self, job_id: str):
                 self.job_id = job_id
                 self.current_chapter = 0
                 self.total_chapters = 0
+                self.loop = asyncio.get_running_loop()
+                self.q = asyncio.Queue(maxsize=1000)
+                self.consumer = asyncio.create_task(self._drain())
+            
+            def _enqueue(self, message: str):
+                try:
+                    self.q.put_nowait(message)
+                except asyncio.QueueFull:
+                    pass  # Drop progress lines rather than hold up TTS behind slow clients
+            
+            async def _drain(self):
+                while True:
+                    message = await self.q.get()
+                    try:
+                        await self.handle_log_message(message)
+                    except Exception as e:
+                        logger.debug(f"[{self.job_id}] Progress update failed: {e}")
+            
+            async def handle_log_message(self, message: str):
+                job = active_jobs.get(self.job_id)
+                if job is None or job.status != "processing":
+                    return
+                
+                progress = job.progress
+                if match := _CHAPTERS_FOUND_RE.match(message):
+                    self.total_chapters = int(match.group(1))
+                elif _CHAPTER_SPLIT_RE.match(message):
+                    self.current_chapter += 1
+                elif (match := _CHUNK_RE.match(message)) and self.total_chapters:
+                    # Chunk processing spans 15%-95%, shared evenly between chapters
+                    chapter_done = float(match.group(3)) / 100
+                    chapters_done = max(self.current_chapter - 1, 0) + chapter_done
+                    progress = 0.15 + 0.8 * min(chapters_done / self.total_chapters, 1.0)
+                
+                await update_job_status(self.job_id, "processing", progress, message)
+            
+            def close(self):
+                self.consumer.cancel()
             
             def info(self, message: str):
-                # Just log to console, don't try to update job status from background thread
                 logger.info(f"[{self.job_id}] {message}")
+                self.loop.call_soon_threadsafe(self._enqueue, message)
             
             def error(self, message: str):
                 logger.error(f"[{self.job_id}] {message}")
+                self.loop.call_soon_threadsafe(self._enqueue, message)
             
             def warning(self, message: str):
                 logger.warning(f"[{self.job_id}] {message}")
+                self.loop.call_soon_threadsafe(self._enqueue, message)
             
             def debug(self, message: str):
                 logger.debug(f"[{self.job_id}] {message}")
@@ -351,12 +506,18 @@ async def process_book_background(
         
         await update_job_status(job_id, "processing", 0.15, "Starting text processing...")
         
-        # Process the book directly (not in thread executor to avoid signal handling issues)
-        result = processor.process_book(
-            input_file,
-            output_dir,
-            manual_chapters
-        )
+        # Process the book on the conversion pool so status polls and WebSocket updates keep flowing
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                CONVERSION_POOL,
+                processor.process_book,
+                input_file,
+                output_dir,
+                manual_chapters
+            )
+        finally:
+            web_logger.close()
+            processor.close()
         
         # Extract chapter information
         chapters = []
@@ -383,7 +544,7 @@ async def process_book_background(
             active_jobs[job_id].end_time = datetime.now()
         
         # Notify WebSocket clients
-        await broadcast_job_update(job_id)
+        await throttled_broadcast(job_id, immediate=True)
         
         logger.info(f"Conversion completed: {job_id}")
         
@@ -395,7 +556,7 @@ async def process_book_background(
             active_jobs[job_id].error_message = str(e)
             active_jobs[job_id].end_time = datetime.now()
             
-            await broadcast_job_update(job_id)
+            await throttled_broadcast(job_id, immediate=True)
 
 async def update_job_status(job_id: str, status: str, progress: float, step: str):
     """Update job status and notify WebSocket clients"""
@@ -404,26 +565,162 @@ async def update_job_status(job_id: str, status: str, progress: float, step: str
         active_jobs[job_id].progress = progress
         active_jobs[job_id].current_step = step
         
+        await throttled_broadcast(job_id, immediate=status in _TERMINAL_STATUSES)
+
+async def throttled_broadcast(job_id: str, immediate: bool = False):
+    """Broadcast now if the job's last broadcast is older than BROADCAST_INTERVAL, else once when it expires"""
+    pending = _pending_broadcasts.get(job_id)
+    if immediate:
+        # Terminal states always go out, and end the job's throttling state
+        if pending is not None:
+            pending.cancel()
+        _pending_broadcasts.pop(job_id, None)
+        _last_broadcast.pop(job_id, None)
+        await broadcast_job_update(job_id)
+        return
+    
+    wait = _last_broadcast.get(job_id, float("-inf")) + BROADCAST_INTERVAL - time.monotonic()
+    if wait <= 0 and pending is None:
+        _last_broadcast[job_id] = time.monotonic()
         await broadcast_job_update(job_id)
+    elif pending is None:
+        # The trailing broadcast sends whatever the job holds when it fires, so updates in between merge
+        _pending_broadcasts[job_id] = asyncio.create_task(_trailing_broadcast(job_id, wait))
+
+async def _trailing_broadcast(job_id: str, delay: float):
+    """Broadcast the job's latest state after delay seconds"""
+    await asyncio.sleep(delay)
+    del _pending_broadcasts[job_id]
+    _last_broadcast[job_id] = time.monotonic()
+    await broadcast_job_update(job_id)
+
+def _get_redis():
+    """Shared Redis client when B2A_REDIS_URL is set and redis is installed, else None"""
+    global _redis_client
+    if _redis_client is None and REDIS_URL and aioredis is not None:
+        _redis_client = aioredis.from_url(REDIS_URL)
+    return _redis_client
 
 async def broadcast_job_update(job_id: str):
     """Broadcast job update to all connected WebSocket clients"""
+    redis = _get_redis()
+    if redis is not None and job_id in active_jobs:
+        # Every worker's listener, this one included, relays the published update to its own sockets
+        payload = active_jobs[job_id].json()
+        try:
+            await redis.set(_REDIS_JOB_KEY + job_id, payload, ex=_REDIS_JOB_TTL)
+            await redis.publish(_REDIS_JOB_CHANNEL + job_id, payload)
+            return
+        except Exception as e:
+            # Keep this worker's own subscribers updated while Redis is unreachable
+            logger.error(f"Failed to publish update for job {job_id} to Redis: {e}")
     if job_id in job_websockets:
-        # Use json() method to properly serialize datetime objects, then parse back to dict
-        job_json_str = active_jobs[job_id].json()
-        job_data = json.loads(job_json_str)
-        
-        # Remove disconnected WebSockets
-        connected_sockets = []
-        for websocket in job_websockets[job_id]:
-            if websocket.client_state == WebSocketState.CONNECTED:
-                try:
-                    await websocket.send_json(job_data)
-                    connected_sockets.append(websocket)
-                except:
-                    pass  # WebSocket disconnected
-        
-        job_websockets[job_id] = connected_sockets
+        # Serialize once for every subscriber; json() handles the datetime fields
+        await _send_to_subscribers(job_id, active_jobs[job_id].json())
+
+async def _send_to_subscribers(job_id: str, payload: str):
+    """Send payload to this worker's WebSocket subscribers for job_id, dropping disconnected ones"""
+    # Send to a snapshot of the subscribers concurrently, one batch at a time, yielding to the loop between batches
+    sockets = list(job_websockets[job_id])
+    for start in range(0, len(sockets), BROADCAST_BATCH_SIZE):
+        batch = sockets[start:start + BROADCAST_BATCH_SIZE]
+        results = await asyncio.gather(*(websocket.send_text(payload) for websocket in batch),
+                                       return_exceptions=True)
+        # Sockets whose send raised have disconnected; the endpoint removes the rest when they close
+        for websocket, result in zip(batch, results):
+            if isinstance(result, BaseException):
+                job_websockets.get(job_id, set()).discard(websocket)
+        await asyncio.sleep(0)
+
+async def _relay_redis_updates(redis):
+    """Forward job updates published by any worker to this worker's WebSocket subscribers"""
+    pubsub = redis.pubsub()
+    await pubsub.psubscribe(_REDIS_JOB_CHANNEL + "*")
+    try:
+        async for message in pubsub.listen():
+            if message["type"] != "pmessage":
+                continue
+            job_id = message["channel"].decode()[len(_REDIS_JOB_CHANNEL):]
+            if job_id in job_websockets:
+                await _send_to_subscribers(job_id, message["data"].decode())
+    except Exception as e:
+        logger.error(f"Redis job update relay stopped: {e}")
+    finally:
+        await pubsub.aclose()
+
+def _ensure_redis_relay():
+    """Start this worker's Redis relay task if Redis is configured and the relay is not running"""
+    global _redis_listener
+    redis = _get_redis()
+    if redis is not None and (_redis_listener is None or _redis_listener.done()):
+        _redis_listener = asyncio.create_task(_relay_redis_updates(redis))
+
+async def _shared_job_status(job_id: str) -> Optional[ConversionStatus]:
+    """Latest status another worker stored for job_id in Redis, or None"""
+    redis = _get_redis()
+    if redis is None:
+        return None
+    try:
+        payload = await redis.get(_REDIS_JOB_KEY + job_id)
+    except Exception as e:
+        logger.error(f"Failed to read job {job_id} from Redis: {e}")
+        return None
+    return ConversionStatus.parse_raw(payload) if payload else None
+
+def _find_log_file(output_dir: Path) -> Optional[Path]:
+    """First processing log (*_log.json) in a job's output directory, or None"""
+    return next(output_dir.glob("*_log.json"), None)
+
+@functools.lru_cache(maxsize=256)
+def _load_log(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parsed processing log; mtime_ns only keys the cache, so a rewritten log is read again"""
+    return read_json(path)
+
+def _read_log(log_file: Path) -> Dict[str, Any]:
+    """Processing log contents, shared between callers until the file changes - do not mutate"""
+    return _load_log(str(log_file), log_file.stat().st_mtime_ns)
+
+def _walk_files(root: str):
+    """DirEntry for every file under root, without following directory symlinks"""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+def _output_snapshot(output_dir: Path) -> Tuple[Tuple[str, int, int], ...]:
+    """(relative path, size, mtime_ns) of every file under a job's output directory, sorted by path"""
+    # Directory mtimes miss files rewritten in place and files written into the chunk subdirectories
+    # (restitch, chunk reprocessing, resumed runs), so every file is stat'ed on each call
+    root = str(output_dir)
+    snapshot = []
+    for entry in _walk_files(root):
+        stat = entry.stat()
+        snapshot.append((os.path.relpath(entry.path, root), stat.st_size, stat.st_mtime_ns))
+    return tuple(sorted(snapshot))
+
+@functools.lru_cache(maxsize=256)
+def _list_output_files(snapshot: Tuple[Tuple[str, int, int], ...]) -> List[Dict[str, Any]]:
+    """File listing for an output snapshot; the snapshot is the cache key, so any file change rebuilds it"""
+    files = []
+    for path, file_size, _ in snapshot:
+        name = os.path.basename(path)
+        suffix = os.path.splitext(name)[1]
+        files.append({
+            "name": name,
+            "path": path,
+            "size_bytes": file_size,
+            "size_human": f"{file_size / 1024:.1f} KB" if file_size < 1024*1024 else f"{file_size / (1024*1024):.1f} MB",
+            "type": "audio" if suffix == ".wav" else "text" if suffix == ".txt" else "report" if suffix in [".json", ".html"] else "other"
+        })
+    return files
+
+def _output_files(output_dir: Path) -> List[Dict[str, Any]]:
+    """Current output file listing, shared between callers while no file changes - do not mutate"""
+    return _list_output_files(_output_snapshot(output_dir))
 
 async def restore_job_from_files(job_id: str) -> Optional[ConversionStatus]:
     """Restore job status from completed files if available"""
@@ -434,17 +731,12 @@ async def restore_job_from_files(job_id: str) -> Optional[ConversionStatus]:
         return None
     
     # Look for processing log
-    log_file = None
-    for log_file_path in output_dir.glob("*_log.json"):
-        log_file = log_file_path
-        break
-    
-    if not log_file or not log_file.exists():
+    log_file = await asyncio.to_thread(_find_log_file, output_dir)
+    if not log_file:
         return None
     
     try:
-        with open(log_file, 'r') as f:
-            log_data = json.load(f)
+        log_data = await asyncio.to_thread(_read_log, log_file)
         
         # Extract chapter information
         chapters = []
@@ -479,21 +771,52 @@ async def restore_job_from_files(job_id: str) -> Optional[ConversionStatus]:
         logger.error(f"Failed to restore job {job_id} from files: {e}")
         return None
 
+def _job_etag(job_id: str, log_file: Path, snapshot: Tuple[Tuple[str, int, int], ...] = ()) -> str:
+    """Strong ETag for a job's completed output, derived from the log's mtime and an output snapshot"""
+    key = f"{job_id}:{log_file.stat().st_mtime_ns}:{snapshot!r}"
+    return f'"{hashlib.md5(key.encode()).hexdigest()}"'
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already names etag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in tags or "*" in tags
+
 @app.get("/api/status/{job_id}")
-async def get_job_status(job_id: str):
+async def get_job_status(job_id: str, request: Request, response: Response):
     """Get current status of conversion job"""
     
     # First check if there are completed files - this takes priority
+    log_file = await asyncio.to_thread(_find_log_file, Path("data/output") / job_id)
+    etag = None
+    if log_file:
+        etag = _job_etag(job_id, log_file)
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _COMPLETED_CACHE_CONTROL})
+    
     restored_job = await restore_job_from_files(job_id)
     if restored_job:
         # Update active jobs with completed status
         active_jobs[job_id] = restored_job
+        if etag:
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = _COMPLETED_CACHE_CONTROL
         return restored_job
     
+    # Anything short of a completed log changes as the job runs
+    response.headers["Cache-Control"] = "no-store"
+    
     # Check active jobs if no completed files found
     if job_id in active_jobs:
         return active_jobs[job_id]
     
+    # A job running on another worker
+    shared_job = await _shared_job_status(job_id)
+    if shared_job:
+        return shared_job
+    
     # Check if job directory exists but has no log files (interrupted/zombie job)
     output_dir = Path("data/output") / job_id
     if output_dir.exists():
@@ -511,15 +834,16 @@ async def get_job_status(job_id: str):
             end_time=datetime.now()
         )
         
-        # Store in active jobs for future requests
-        active_jobs[job_id] = failed_job
+        # Store in active jobs for future requests; with Redis the job may still be starting on
+        # another worker, so the next poll must look again
+        if _get_redis() is None:
+            active_jobs[job_id] = failed_job
         return failed_job
     
     raise HTTPException(status_code=404, detail="Job not found")
 
-@app.get("/api/results/{job_id}")
-async def get_job_results(job_id: str):
-    """Get detailed results for a completed job without triggering API calls"""
+async def _find_job_log(job_id: str) -> Tuple[Path, Path]:
+    """A completed job's output directory and processing log, or a 404"""
     
     # Check if output directory exists
     output_dir = Path("data/output") / job_id
@@ -527,106 +851,109 @@ async def get_job_results(job_id: str):
         raise HTTPException(status_code=404, detail="Job results not found")
     
     # Look for processing log
-    log_file = None
-    for log_file_path in output_dir.glob("*_log.json"):
-        log_file = log_file_path
-        break
-    
-    if not log_file or not log_file.exists():
+    log_file = await asyncio.to_thread(_find_log_file, output_dir)
+    if not log_file:
         raise HTTPException(status_code=404, detail="Job log not found")
     
+    return output_dir, log_file
+
+@functools.lru_cache(maxsize=256)
+def _cached_results(job_id: str, log_file: str, log_mtime_ns: int,
+                    snapshot: Tuple[Tuple[str, int, int], ...]) -> Dict[str, Any]:
+    """Results summary with its file list sorted; the log mtime and output snapshot key the cache"""
+    log_data = _load_log(log_file, log_mtime_ns)
+    files = _list_output_files(snapshot)
+    
+    return {
+        "job_id": job_id,
+        "status": "completed",
+        "processing_date": log_data.get("processing_date"),
+        "total_chapters": log_data.get("total_chapters", 0),
+        "successful_chapters": log_data.get("successful_chapters", 0),
+        "failed_chapters": log_data.get("failed_chapters", 0),
+        "total_words_processed": log_data.get("total_words_processed", 0),
+        "total_processing_time": log_data.get("total_processing_time", 0),
+        "output_files": log_data.get("output_files", []),
+        "files": sorted(files, key=lambda x: (x["type"], x["name"])),
+        "chapter_details": log_data.get("chapter_details", [])
+    }
+
+def _results_summary(job_id: str, output_dir: Path, log_file: Path,
+                     snapshot: Optional[Tuple[Tuple[str, int, int], ...]] = None) -> Dict[str, Any]:
+    """Results summary, rebuilt only when the log or any output file changes - do not mutate"""
+    if snapshot is None:
+        snapshot = _output_snapshot(output_dir)
+    return _cached_results(job_id, str(log_file), log_file.stat().st_mtime_ns, snapshot)
+
+async def _build_results(job_id: str, output_dir: Path, log_file: Path,
+                         snapshot: Optional[Tuple[Tuple[str, int, int], ...]] = None) -> Dict[str, Any]:
+    """Results summary for a completed job, shared by the JSON endpoint and the HTML page"""
     try:
-        with open(log_file, 'r') as f:
-            log_data = json.load(f)
-        
-        # Get file list
-        files = []
-        for file_path in output_dir.rglob("*"):
-            if file_path.is_file():
-                relative_path = file_path.relative_to(output_dir)
-                file_size = file_path.stat().st_size
-                files.append({
-                    "name": file_path.name,
-                    "path": str(relative_path),
-                    "size_bytes": file_size,
-                    "size_human": f"{file_size / 1024:.1f} KB" if file_size < 1024*1024 else f"{file_size / (1024*1024):.1f} MB",
-                    "type": "audio" if file_path.suffix == ".wav" else "text" if file_path.suffix == ".txt" else "report" if file_path.suffix in [".json", ".html"] else "other"
-                })
-        
-        # Build response
-        result = {
-            "job_id": job_id,
-            "status": "completed",
-            "processing_date": log_data.get("processing_date"),
-            "total_chapters": log_data.get("total_chapters", 0),
-            "successful_chapters": log_data.get("successful_chapters", 0),
-            "failed_chapters": log_data.get("failed_chapters", 0),
-            "total_words_processed": log_data.get("total_words_processed", 0),
-            "total_processing_time": log_data.get("total_processing_time", 0),
-            "output_files": log_data.get("output_files", []),
-            "files": sorted(files, key=lambda x: (x["type"], x["name"])),
-            "chapter_details": log_data.get("chapter_details", [])
-        }
-        
-        return result
-        
+        return await asyncio.to_thread(_results_summary, job_id, output_dir, log_file, snapshot)
     except Exception as e:
         logger.error(f"Failed to get results for {job_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to load job results")
 
-@app.get("/results/{job_id}", response_class=HTMLResponse)
-async def show_job_results_page(job_id: str):
-    """Display job results in a simple HTML page (no API calls)"""
+@app.get("/api/results/{job_id}")
+async def get_job_results(job_id: str, request: Request, response: Response):
+    """Get detailed results for a completed job without triggering API calls"""
     
-    try:
-        # Get results data
-        results_response = await get_job_results(job_id)
-        results = results_response
-        
-        # Generate HTML
-        html = f"""
+    output_dir, log_file = await _find_job_log(job_id)
+    
+    # The summary changes whenever the log or any file under the output directory is written
+    snapshot = await asyncio.to_thread(_output_snapshot, output_dir)
+    etag = _job_etag(job_id, log_file, snapshot)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _COMPLETED_CACHE_CONTROL})
+    
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _COMPLETED_CACHE_CONTROL
+    return await _build_results(job_id, output_dir, log_file, snapshot)
+
+# Results page layout; every substituted value is HTML-escaped before it reaches these templates
+_RESULTS_PAGE_TEMPLATE = string.Template("""
         <!DOCTYPE html>
         <html>
         <head>
-            <title>Book2Audible Results - {job_id}</title>
+            <title>Book2Audible Results - $job_id</title>
             <style>
-                body {{ font-family: Arial, sans-serif; margin: 40px; }}
-                .header {{ background: #10B981; color: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }}
-                .stats {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin-bottom: 20px; }}
-                .stat {{ background: #F3F4F6; padding: 15px; border-radius: 8px; }}
-                .stat-value {{ font-size: 24px; font-weight: bold; color: #10B981; }}
-                .stat-label {{ color: #6B7280; font-size: 14px; }}
-                .files {{ margin-top: 20px; }}
-                .file-list {{ display: grid; gap: 10px; }}
-                .file {{ background: #F9FAFB; border: 1px solid #E5E7EB; padding: 12px; border-radius: 6px; display: flex; justify-content: between; align-items: center; }}
-                .file-audio {{ border-left: 4px solid #10B981; }}
-                .file-text {{ border-left: 4px solid #3B82F6; }}
-                .file-report {{ border-left: 4px solid #8B5CF6; }}
-                .file-name {{ font-weight: 500; }}
-                .file-size {{ color: #6B7280; font-size: 14px; margin-left: auto; }}
-                .success {{ color: #10B981; font-weight: bold; }}
-                .download-link {{ background: #10B981; color: white; padding: 8px 16px; border-radius: 4px; text-decoration: none; display: inline-block; margin-top: 10px; }}
-                .download-link:hover {{ background: #059669; }}
+                body { font-family: Arial, sans-serif; margin: 40px; }
+                .header { background: #10B981; color: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
+                .stats { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin-bottom: 20px; }
+                .stat { background: #F3F4F6; padding: 15px; border-radius: 8px; }
+                .stat-value { font-size: 24px; font-weight: bold; color: #10B981; }
+                .stat-label { color: #6B7280; font-size: 14px; }
+                .files { margin-top: 20px; }
+                .file-list { display: grid; gap: 10px; }
+                .file { background: #F9FAFB; border: 1px solid #E5E7EB; padding: 12px; border-radius: 6px; display: flex; justify-content: between; align-items: center; }
+                .file-audio { border-left: 4px solid #10B981; }
+                .file-text { border-left: 4px solid #3B82F6; }
+                .file-report { border-left: 4px solid #8B5CF6; }
+                .file-name { font-weight: 500; }
+                .file-size { color: #6B7280; font-size: 14px; margin-left: auto; }
+                .success { color: #10B981; font-weight: bold; }
+                .download-link { background: #10B981; color: white; padding: 8px 16px; border-radius: 4px; text-decoration: none; display: inline-block; margin-top: 10px; }
+                .download-link:hover { background: #059669; }
             </style>
         </head>
         <body>
             <div class="header">
                 <h1>🎉 Conversion Completed Successfully!</h1>
-                <p>Job ID: {job_id}</p>
-                <p>Processed: {results['processing_date']}</p>
+                <p>Job ID: $job_id</p>
+                <p>Processed: $processing_date</p>
             </div>
             
             <div class="stats">
                 <div class="stat">
-                    <div class="stat-value">{results['successful_chapters']}/{results['total_chapters']}</div>
+                    <div class="stat-value">$successful_chapters/$total_chapters</div>
                     <div class="stat-label">Chapters Completed</div>
                 </div>
                 <div class="stat">
-                    <div class="stat-value">{results['total_words_processed']}</div>
+                    <div class="stat-value">$total_words_processed</div>
                     <div class="stat-label">Words Processed</div>
                 </div>
                 <div class="stat">
-                    <div class="stat-value">{results['total_processing_time']:.1f}s</div>
+                    <div class="stat-value">$total_processing_time</div>
                     <div class="stat-label">Processing Time</div>
                 </div>
                 <div class="stat">
@@ -638,50 +965,9 @@ async def show_job_results_page(job_id: str):
             <div class="files">
                 <h2>📁 Generated Files</h2>
                 <div class="file-list">
-        """
-        
-        # Add files
-        for file in results['files']:
-            file_class = f"file-{file['type']}"
-            icon = "🎵" if file['type'] == 'audio' else "📄" if file['type'] == 'text' else "📊"
-            
-            if file['type'] == 'audio':
-                download_url = f"/static/{job_id}/{file['path']}"
-                download_link = f'<a href="{download_url}" class="download-link">Download</a>'
-            elif file['name'].endswith('.html'):
-                view_url = f"/view-file/{job_id}/{file['path']}"
-                download_link = f'<a href="{view_url}" class="download-link">View</a>'
-            else:
-                download_link = ""
-            
-            html += f"""
-                    <div class="file {file_class}">
-                        <div>
-                            <span class="file-name">{icon} {file['name']}</span>
-                            {download_link}
-                        </div>
-                        <span class="file-size">{file['size_human']}</span>
-                    </div>
-            """
-        
-        # Add chapter details
-        for chapter in results['chapter_details']:
-            html += f"""
+$files
                 </div>
-                <h2>📖 Chapter Details</h2>
-                <div class="stat">
-                    <div class="stat-value">Chapter {chapter['chapter']}: {chapter['title']}</div>
-                    <div class="stat-label">
-                        ✅ Audio Duration: {chapter['quality_check']['duration_ms']/1000:.1f} seconds<br>
-                        ✅ Audio Quality: {chapter['quality_check']['sample_rate']}Hz, {chapter['quality_check']['channels']} channel, {chapter['quality_check']['bit_depth']}-bit<br>
-                        ✅ Verification: {chapter['content_verification']['accuracy_score']*100:.1f}% accuracy<br>
-                        ✅ File Size: {chapter['quality_check']['file_size']/1024:.1f} KB
-                    </div>
-                    <a href="/static/{job_id}/{Path(chapter['audio_file']).name}" class="download-link">🎵 Play Audio</a>
-                </div>
-            """
-        
-        html += """
+$chapters
             </div>
             
             <div style="margin-top: 40px; padding: 20px; background: #F0FDF4; border-radius: 8px;">
@@ -692,9 +978,92 @@ async def show_job_results_page(job_id: str):
             </div>
         </body>
         </html>
-        """
+        """)
+
+_RESULTS_FILE_TEMPLATE = string.Template("""
+                    <div class="file $file_class">
+                        <div>
+                            <span class="file-name">$icon $name</span>
+                            $link
+                        </div>
+                        <span class="file-size">$size</span>
+                    </div>""")
+
+_RESULTS_CHAPTER_TEMPLATE = string.Template("""
+                <div class="stat">
+                    <div class="stat-value">Chapter $chapter: $title</div>
+                    <div class="stat-label">
+                        ✅ Audio Duration: $duration seconds<br>
+                        ✅ Audio Quality: ${sample_rate}Hz, $channels channel, $bit_depth-bit<br>
+                        ✅ Verification: $accuracy% accuracy<br>
+                        ✅ File Size: $file_size KB
+                    </div>
+                    <a href="$audio_url" class="download-link">🎵 Play Audio</a>
+                </div>""")
+
+def _render_results_page(job_id: str, results: Dict[str, Any]) -> str:
+    """Results page HTML for a completed job, built in one join"""
+    escape = html.escape
+    
+    files = []
+    for file in results['files']:
+        icon = "🎵" if file['type'] == 'audio' else "📄" if file['type'] == 'text' else "📊"
+        
+        if file['type'] == 'audio':
+            download_url = escape(f"/static/{job_id}/{file['path']}")
+            download_link = f'<a href="{download_url}" class="download-link">Download</a>'
+        elif file['name'].endswith('.html'):
+            view_url = escape(f"/view-file/{job_id}/{file['path']}")
+            download_link = f'<a href="{view_url}" class="download-link">View</a>'
+        else:
+            download_link = ""
+        
+        files.append(_RESULTS_FILE_TEMPLATE.substitute(
+            file_class=escape(f"file-{file['type']}"),
+            icon=icon,
+            name=escape(file['name']),
+            link=download_link,
+            size=escape(file['size_human'])
+        ))
+    
+    chapters = []
+    for chapter in results['chapter_details']:
+        quality = chapter['quality_check']
+        chapters.append(_RESULTS_CHAPTER_TEMPLATE.substitute(
+            chapter=escape(str(chapter['chapter'])),
+            title=escape(str(chapter['title'])),
+            duration=f"{quality['duration_ms']/1000:.1f}",
+            sample_rate=escape(str(quality['sample_rate'])),
+            channels=escape(str(quality['channels'])),
+            bit_depth=escape(str(quality['bit_depth'])),
+            accuracy=f"{chapter['content_verification']['accuracy_score']*100:.1f}",
+            file_size=f"{quality['file_size']/1024:.1f}",
+            audio_url=escape(f"/static/{job_id}/{Path(chapter['audio_file']).name}")
+        ))
+    if chapters:
+        chapters.insert(0, "\n                <h2>📖 Chapter Details</h2>")
+    
+    return _RESULTS_PAGE_TEMPLATE.substitute(
+        job_id=escape(job_id),
+        processing_date=escape(str(results['processing_date'])),
+        successful_chapters=escape(str(results['successful_chapters'])),
+        total_chapters=escape(str(results['total_chapters'])),
+        total_words_processed=escape(str(results['total_words_processed'])),
+        total_processing_time=f"{results['total_processing_time']:.1f}s",
+        files="".join(files),
+        chapters="".join(chapters)
+    )
+
+@app.get("/results/{job_id}", response_class=HTMLResponse)
+async def show_job_results_page(job_id: str):
+    """Display job results in a simple HTML page (no API calls)"""
+    
+    try:
+        # Get results data
+        output_dir, log_file = await _find_job_log(job_id)
+        results = await _build_results(job_id, output_dir, log_file)
         
-        return html
+        return _render_results_page(job_id, results)
         
     except HTTPException:
         raise
@@ -703,53 +1072,68 @@ async def show_job_results_page(job_id: str):
         return f"""
         <html><body>
         <h1>Error Loading Results</h1>
-        <p>Could not load results for job {job_id}</p>
-        <p>Error: {str(e)}</p>
+        <p>Could not load results for job {html.escape(job_id)}</p>
+        <p>Error: {html.escape(str(e))}</p>
         </body></html>
         """
 
+def _stream_with_banner(path: Path, banner: bytes):
+    """Yield an HTML file in blocks, with banner inserted after its opening <body> tag"""
+    with open(path, 'rb') as f:
+        # Buffer only until the body tag turns up, then pass the rest straight through
+        head = b''
+        while block := f.read(_IO_BLOCK_SIZE):
+            head += block
+            match = _BODY_TAG_RE.search(head)
+            if match:
+                yield head[:match.end()] + banner + head[match.end():]
+                break
+        else:
+            yield head
+            return
+        
+        while block := f.read(_IO_BLOCK_SIZE):
+            yield block
+
 @app.get("/view-file/{job_id}/{file_path:path}", response_class=HTMLResponse)
 async def view_html_file(job_id: str, file_path: str):
     """View HTML files from job output"""
     
     # Security check - only allow HTML files in the job's output directory
-    output_dir = Path("data/output") / job_id
-    full_file_path = output_dir / file_path
+    output_dir = (Path("data/output") / job_id).resolve()
+    full_file_path = (output_dir / file_path).resolve()
     
     # Check if file exists and is within the job directory
-    if not full_file_path.exists() or not str(full_file_path).startswith(str(output_dir)):
+    if not full_file_path.is_relative_to(output_dir) or not full_file_path.is_file():
         raise HTTPException(status_code=404, detail="File not found")
     
     # Only serve HTML files
     if not full_file_path.suffix.lower() == '.html':
         raise HTTPException(status_code=400, detail="Only HTML files can be viewed")
     
-    try:
-        with open(full_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Add a header to identify the file
-        enhanced_content = content.replace(
-            '<body>',
-            f'''<body>
+    # Add a header to identify the file
+    banner = f'''
             <div style="background: #1F2937; color: white; padding: 10px; margin-bottom: 20px; border-radius: 5px;">
                 <h3 style="margin: 0;">📄 {full_file_path.name}</h3>
                 <p style="margin: 5px 0 0 0; font-size: 14px;">Job: {job_id} | <a href="/results/{job_id}" style="color: #60A5FA;">← Back to Results</a></p>
-            </div>'''
-        )
-        
-        return enhanced_content
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to read file: {str(e)}")
+            </div>'''.encode('utf-8')
+    
+    # A sync generator, so Starlette reads the file on its threadpool
+    return StreamingResponse(_stream_with_banner(full_file_path, banner), media_type="text/html; charset=utf-8")
 
 @app.get("/api/all-jobs")
 async def get_all_jobs():
     """Get list of all processed jobs"""
     
+    # Reads every job's log, so keep it off the event loop
+    return {"jobs": await asyncio.to_thread(_list_jobs)}
+
+def _list_jobs() -> List[Dict[str, Any]]:
+    """Summary of every job with a processing log, newest first"""
+    
     output_dir = Path("data/output")
     if not output_dir.exists():
-        return {"jobs": []}
+        return []
     
     jobs = []
     for job_dir in output_dir.iterdir():
@@ -760,8 +1144,7 @@ async def get_all_jobs():
             log_files = list(job_dir.glob("*_log.json"))
             if log_files:
                 try:
-                    with open(log_files[0], 'r') as f:
-                        log_data = json.load(f)
+                    log_data = _read_log(log_files[0])
                     
                     # Get audio files
                     audio_files = list(job_dir.glob("*.wav"))
@@ -782,7 +1165,7 @@ async def get_all_jobs():
     # Sort by processing date (newest first)
     jobs.sort(key=lambda x: x.get("processing_date", ""), reverse=True)
     
-    return {"jobs": jobs}
+    return jobs
 
 @app.websocket("/ws/{job_id}")
 async def websocket_endpoint(websocket: WebSocket, job_id: str):
@@ -790,19 +1173,23 @@ async def websocket_endpoint(websocket: WebSocket, job_id: str):
     
     await websocket.accept()
     
-    # Add to job WebSocket list
-    if job_id not in job_websockets:
-        job_websockets[job_id] = []
-    job_websockets[job_id].append(websocket)
+    # Bound the fan-out cost of a single job's broadcasts
+    subscribers = job_websockets.setdefault(job_id, set())
+    if len(subscribers) >= MAX_SUBSCRIBERS_PER_JOB:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Too many subscribers for this job")
+        return
+    
+    _ensure_redis_relay()
+    
+    # Add to job WebSocket set
+    subscribers.add(websocket)
     
     try:
         # Send current status immediately
-        if job_id in active_jobs:
-            # Use json() method to properly serialize datetime objects, then parse back to dict
-            job_json_str = active_jobs[job_id].json()
-            job_data = json.loads(job_json_str)
-            
-            await websocket.send_json(job_data)
+        job = active_jobs.get(job_id) or await _shared_job_status(job_id)
+        if job:
+            # json() serializes the datetime fields; send it as is rather than re-encoding a dict
+            await websocket.send_text(job.json())
         
         # Keep connection alive and handle messages
         while True:
@@ -811,29 +1198,37 @@ async def websocket_endpoint(websocket: WebSocket, job_id: str):
             await websocket.send_text(f"Received: {data}")
             
     except WebSocketDisconnect:
-        # Remove from job WebSocket list
-        if job_id in job_websockets:
-            try:
-                job_websockets[job_id].remove(websocket)
-            except ValueError:
-                pass
+        pass
+    finally:
+        # Remove from job WebSocket set, dropping the job's entry with its last subscriber
+        subscribers = job_websockets.get(job_id)
+        if subscribers is not None:
+            subscribers.discard(websocket)
+            if not subscribers:
+                del job_websockets[job_id]
+
+def _write_chapters_zip(output_dir: Path, zip_path: Path):
+    """Write every chapter WAV in output_dir into the ZIP at zip_path"""
+    import zipfile
+    
+    with zipfile.ZipFile(zip_path, 'w') as zipf:
+        for audio_file in output_dir.glob("*.wav"):
+            zipf.write(audio_file, audio_file.name)
 
 @app.get("/api/download/{job_id}")
 async def download_all_chapters(job_id: str):
     """Download all chapters as a ZIP file"""
     
-    if job_id not in active_jobs or active_jobs[job_id].status != "completed":
+    # The job may have run on another worker, or before a restart, so fall back to Redis and the log
+    job = active_jobs.get(job_id) or await _shared_job_status(job_id)
+    if not (job and job.status == "completed") and not await restore_job_from_files(job_id):
         raise HTTPException(status_code=404, detail="Job not found or not completed")
     
     # Create ZIP file with all chapters
-    import zipfile
-    
     output_dir = Path("data/output") / job_id
     zip_path = output_dir / f"{job_id}_audiobook.zip"
     
-    with zipfile.ZipFile(zip_path, 'w') as zipf:
-        for audio_file in output_dir.glob("*.wav"):
-            zipf.write(audio_file, audio_file.name)
+    await asyncio.to_thread(_write_chapters_zip, output_dir, zip_path)
     
     return FileResponse(
         zip_path,
@@ -2056,15 +2451,30 @@ async def serve_frontend():
     </html>
     """
 
+# Every registered route path, collected once after the last route is declared
+APP_ROUTE_PATHS = tuple(route.path for route in app.routes if hasattr(route, 'path'))
+
 if __name__ == "__main__":
+    import importlib.util
+    
     # Ensure output directory exists
     Path("data/output").mkdir(parents=True, exist_ok=True)
     
+    # uvloop and httptools are optional speedups; uvicorn falls back to asyncio and h11 without them
+    loop_impl = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http_impl = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    
+    # Conversions, uploads and per-job state still assume one process, so the API serves from a single worker
+    if int(os.environ.get("WEB_CONCURRENCY", "1")) > 1:
+        logger.warning("WEB_CONCURRENCY > 1 is not supported yet; running one worker")
+    
     # Run the FastAPI server
     uvicorn.run(
         "web_api:app",
         host="0.0.0.0",
         port=8000,
         reload=True,
+        loop=loop_impl,
+        http=http_impl,
         log_level="info"
-    )
\ No newline at end of file
+    )